@@ -58,7 +58,10 @@ class Server:
             """Execute the analyzer function."""
             # Parse the request params
             try:
-                req_data = AnalyzerRequest(request.get_json())
+                req_data = AnalyzerRequest(
+                    request.get_json(),
+                    ad_hoc_recognizer_cache=self.engine.ad_hoc_recognizer_cache,
+                )
                 if not req_data.text:
                     raise Exception("No text provided")
 
@@ -0,0 +1,83 @@
+"""Benchmark of creating the ad hoc recognizers of REST API requests.
+
+Compares parsing requests holding ad hoc recognizers and analyzing a short
+text with them, with new recognizers for each request and with recognizers
+from an AdHocRecognizerCache. Requests come from several clients, each always
+sending its own recognizers: together, their patterns outnumber the internal
+cache of the regex module, so new recognizers compile their regexes again.
+
+Run from the presidio-analyzer directory, with presidio_analyzer installed:
+python benchmarks/benchmark_ad_hoc_recognizer_cache.py
+"""
+
+import json
+import time
+
+from presidio_analyzer import AdHocRecognizerCache, AnalyzerRequest
+
+N_CLIENTS = 60
+N_RECOGNIZERS = 10
+N_ROUNDS = 5
+
+TEXT = "Order 123-456-7890 shipped to zip code 98052-1234 on 2024-01-31"
+
+
+def create_request_body(client: int) -> str:
+    """Return the JSON body of the requests of a client."""
+    return json.dumps(
+        {
+            "text": TEXT,
+            "language": "en",
+            "ad_hoc_recognizers": [
+                {
+                    "name": f"Recognizer {client}-{i}",
+                    "supported_language": "en",
+                    "supported_entity": f"ENTITY_{i}",
+                    "patterns": [
+                        {
+                            "name": f"pattern {i}",
+                            "regex": rf"\b(?:C{client}R{i}-\w+|\d{{3}}-\d{{3}}-"
+                            rf"\d{{4}}|\d{{5}}(?:-\d{{4}})?|\d{{4}}-\d{{2}}-\d{{2}})\b",
+                            "score": 0.5,
+                        }
+                    ],
+                }
+                for i in range(N_RECOGNIZERS)
+            ],
+        }
+    )
+
+
+def handle_request(body: str, cache):
+    """Parse the request and analyze its text with its ad hoc recognizers."""
+    request = AnalyzerRequest(json.loads(body), ad_hoc_recognizer_cache=cache)
+    for recognizer in request.ad_hoc_recognizers:
+        recognizer.analyze(
+            request.text, recognizer.supported_entities, regex_flags=request.regex_flags
+        )
+
+
+def time_requests(bodies, cache) -> float:
+    """Return the seconds per request, over rounds of requests of all clients."""
+    for body in bodies:
+        handle_request(body, cache)
+    start = time.perf_counter()
+    for _ in range(N_ROUNDS):
+        for body in bodies:
+            handle_request(body, cache)
+    return (time.perf_counter() - start) / (N_ROUNDS * len(bodies))
+
+
+def main():
+    """Print the time per request with and without the cache."""
+    bodies = [create_request_body(client) for client in range(N_CLIENTS)]
+    without_cache = time_requests(bodies, None)
+    with_cache = time_requests(bodies, AdHocRecognizerCache())
+
+    print(f"{N_CLIENTS} clients, {N_RECOGNIZERS} ad hoc recognizers per request")
+    print(f"without cache: {without_cache * 1000:8.3f} ms per request")
+    print(f"with cache:    {with_cache * 1000:8.3f} ms per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Micro-benchmark of EntityRecognizer.remove_duplicates.
+
+Compares the sweep based implementation with the previous quadratic one,
+on results of a few entity types with random spans and scores,
+to show where the sweep becomes faster.
+
+Run from the presidio-analyzer directory, with presidio_analyzer installed:
+python benchmarks/benchmark_remove_duplicates.py
+"""
+
+import random
+import timeit
+from typing import List
+
+from presidio_analyzer import EntityRecognizer, RecognizerResult
+
+SIZES = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+
+def quadratic_remove_duplicates(
+    results: List[RecognizerResult],
+) -> List[RecognizerResult]:
+    """Remove duplicates as EntityRecognizer.remove_duplicates used to."""
+    results = list(set(results))
+    results = sorted(results, key=lambda x: (-x.score, x.start, -(x.end - x.start)))
+    filtered_results = []
+
+    for result in results:
+        if result.score == 0:
+            continue
+
+        to_keep = result not in filtered_results  # equals based comparison
+        if to_keep:
+            for filtered in filtered_results:
+                # If result is contained in one of the other results
+                if (
+                    result.contained_in(filtered)
+                    and result.entity_type == filtered.entity_type
+                ):
+                    to_keep = False
+                    break
+
+        if to_keep:
+            filtered_results.append(result)
+
+    return filtered_results
+
+
+def random_results(size: int, rng: random.Random) -> List[RecognizerResult]:
+    """Return results spread over a text of about 20 characters per result."""
+    results = []
+    for _ in range(size):
+        start = rng.randrange(size * 20)
+        results.append(
+            RecognizerResult(
+                entity_type=rng.choice(["PERSON", "PHONE_NUMBER", "ZIP"]),
+                start=start,
+                end=start + rng.randint(1, 30),
+                score=rng.choice([0.3, 0.5, 0.85, 1.0]),
+            )
+        )
+    return results
+
+
+def main():
+    """Print the timings of both implementations per number of results."""
+    rng = random.Random(42)
+    print(f"{'results':>8} {'quadratic (ms)':>15} {'sweep (ms)':>11} {'speedup':>8}")
+    for size in SIZES:
+        results = random_results(size, rng)
+        number = max(1, 2000 // size)
+        timings = []
+        for remove_duplicates in (
+            quadratic_remove_duplicates,
+            EntityRecognizer.remove_duplicates,
+        ):
+            seconds = min(
+                timeit.repeat(
+                    lambda: remove_duplicates(results),  # noqa: B023
+                    number=number,
+                    repeat=5,
+                )
+            )
+            timings.append(seconds / number * 1000)
+        quadratic_ms, sweep_ms = timings
+        print(
+            f"{size:>8} {quadratic_ms:>15.4f} {sweep_ms:>11.4f} "
+            f"{quadratic_ms / sweep_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Memory benchmark of a batch of a million RecognizerResults.
+
+Compares the memory held by the results and their explanations
+with the previous layout, where each object had an attribute dictionary
+and each result its own recognition metadata dictionary,
+replicated here by `DictRecognizerResult` and `DictAnalysisExplanation`.
+
+Run from the presidio-analyzer directory, with presidio_analyzer installed:
+python benchmarks/benchmark_result_memory.py
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Callable, List
+
+from presidio_analyzer import AnalysisExplanation, PatternRecognizer, RecognizerResult
+
+NUMBER_OF_RESULTS = 1_000_000
+
+
+class DictAnalysisExplanation:
+    """AnalysisExplanation with an attribute dictionary."""
+
+    def __init__(self, recognizer: str, original_score: float):
+        self.recognizer = recognizer
+        self.pattern_name = None
+        self.pattern = None
+        self.original_score = original_score
+        self.score = original_score
+        self.textual_explanation = None
+        self.score_context_improvement = 0
+        self.supportive_context_word = ""
+        self.validation_result = None
+        self.regex_flags = None
+
+
+class DictRecognizerResult:
+    """RecognizerResult with an attribute dictionary."""
+
+    def __init__(self, entity_type, start, end, score, explanation, metadata):
+        self.entity_type = entity_type
+        self.start = start
+        self.end = end
+        self.score = score
+        self.analysis_explanation = explanation
+        self.recognition_metadata = metadata
+
+
+def dict_results(recognizer: PatternRecognizer, size: int) -> List:
+    """Create results as recognizers used to, without shared metadata."""
+    return [
+        DictRecognizerResult(
+            "TEST",
+            index,
+            index + 1,
+            0.5,
+            DictAnalysisExplanation(recognizer.name, 0.5),
+            {
+                RecognizerResult.RECOGNIZER_NAME_KEY: recognizer.name,
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: recognizer.id,
+            },
+        )
+        for index in range(size)
+    ]
+
+
+def slots_results(recognizer: PatternRecognizer, size: int) -> List:
+    """Create results as recognizers do, sharing the recognizer's metadata."""
+    metadata = recognizer.get_recognition_metadata()
+    return [
+        RecognizerResult(
+            "TEST",
+            index,
+            index + 1,
+            0.5,
+            AnalysisExplanation(recognizer.name, 0.5),
+            metadata,
+        )
+        for index in range(size)
+    ]
+
+
+def measure(create_results: Callable, recognizer: PatternRecognizer):
+    """Return the memory in MB allocated by the results, and the creation time."""
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    results = create_results(recognizer, NUMBER_OF_RESULTS)
+    seconds = time.perf_counter() - start_time
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return memory / 2**20, seconds
+
+
+def main():
+    """Print the memory and creation time of both layouts."""
+    recognizer = PatternRecognizer(supported_entity="TEST", deny_list=["test"])
+    print(f"{NUMBER_OF_RESULTS} results with explanations")
+    print(f"{'layout':>8} {'memory (MB)':>12} {'creation (s)':>13}")
+    for name, create_results in (("dict", dict_results), ("slots", slots_results)):
+        memory, seconds = measure(create_results, recognizer)
+        print(f"{name:>8} {memory:>12.1f} {seconds:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
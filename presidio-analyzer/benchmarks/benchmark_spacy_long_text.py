@@ -0,0 +1,55 @@
+"""Benchmark of processing one long text with SpacyNlpEngine's long text mode.
+
+Compares processing a text of 2 MB whole, on one core, with splitting it
+into pieces processed by several processes (long_text_threshold and
+long_text_n_process). The speedup is bounded by the number of cores.
+
+Run from the presidio-analyzer directory, with presidio_analyzer and
+the spaCy model installed:
+python benchmarks/benchmark_spacy_long_text.py [model_name]
+"""
+
+import os
+import sys
+import time
+
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
+
+MODEL_NAME = "en_core_web_lg"
+TEXT_PARAGRAPHS = 16000
+LONG_TEXT_THRESHOLD = 100_000
+
+PARAGRAPH = (
+    "Dear Mr. John Smith, your appointment at 42 Main Street, Springfield "
+    "is confirmed for March 3rd. Call Jane Doe at Acme Corp. if needed.\n\n"
+)
+
+
+def time_process_text(engine: SpacyNlpEngine, text: str) -> float:
+    """Return the seconds taken to process the text."""
+    start = time.perf_counter()
+    engine.process_text(text, language="en")
+    return time.perf_counter() - start
+
+
+def main():
+    """Print the time to process the text, by number of processes."""
+    model_name = sys.argv[1] if len(sys.argv) > 1 else MODEL_NAME
+    models = [{"lang_code": "en", "model_name": model_name}]
+    text = PARAGRAPH * TEXT_PARAGRAPHS
+    cores = os.cpu_count() or 1
+
+    engine = SpacyNlpEngine(models=models)
+    engine.load()
+    print(f"text of {len(text) / 1e6:.1f} MB, {cores} cores")
+    print(f"whole text:   {time_process_text(engine, text):8.2f} s")
+
+    for n_process in sorted({2, cores} - {1}):
+        engine.long_text_threshold = LONG_TEXT_THRESHOLD
+        engine.long_text_n_process = n_process
+        seconds = time_process_text(engine, text)
+        print(f"{n_process:2d} processes: {seconds:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
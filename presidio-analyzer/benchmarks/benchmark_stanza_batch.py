@@ -0,0 +1,48 @@
+"""Benchmark of processing a batch of texts with StanzaNlpEngine.
+
+Compares processing texts one by one (process_text) with processing them
+with process_batch, which runs the Stanza pipeline on several texts per call.
+
+Run from the presidio-analyzer directory, with presidio_analyzer, stanza
+and the Stanza English models installed:
+python benchmarks/benchmark_stanza_batch.py
+"""
+
+import time
+
+from presidio_analyzer.nlp_engine import StanzaNlpEngine
+
+N_TEXTS = 200
+BATCH_SIZE = 32
+
+TEXT = (
+    "Dear Mr. John Smith, your appointment at 42 Main Street, Springfield "
+    "is confirmed for March 3rd. Please call Jane Doe at Acme Corp. if needed."
+)
+
+
+def main():
+    """Print the time per text one by one and in batches."""
+    engine = StanzaNlpEngine(
+        models=[{"lang_code": "en", "model_name": "en"}], download_if_missing=False
+    )
+    engine.load()
+    texts = [f"{TEXT} Reference {i}." for i in range(N_TEXTS)]
+    engine.process_text(texts[0], language="en")
+
+    start = time.perf_counter()
+    for text in texts:
+        engine.process_text(text, language="en")
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    list(engine.process_batch(texts, language="en", batch_size=BATCH_SIZE))
+    batched = time.perf_counter() - start
+
+    print(f"{N_TEXTS} texts")
+    print(f"one by one:        {one_by_one / N_TEXTS * 1000:8.2f} ms per text")
+    print(f"batches of {BATCH_SIZE:<4}:   {batched / N_TEXTS * 1000:8.2f} ms per text")
+
+
+if __name__ == "__main__":
+    main()
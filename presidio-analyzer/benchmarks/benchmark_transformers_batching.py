@@ -0,0 +1,93 @@
+"""Benchmark of length-bucketed batching in TransformersNlpEngine.process_batch.
+
+Texts have a realistic, long-tailed length distribution (log-normal, as for
+messages or clinical notes: mostly short texts, and a few long ones).
+Compares batching them in order, `BATCH_SIZE` texts per batch, with batching
+them by length within a token budget (max_batch_tokens). Prints the share of
+padding tokens of each batching, then, if transformers and the models are
+installed, the time taken by each. Tokens are counted with the model's
+tokenizer if transformers is installed, or else approximated by spaCy tokens.
+
+Run from the presidio-analyzer directory, with presidio_analyzer installed:
+python benchmarks/benchmark_transformers_batching.py
+"""
+
+import random
+import time
+
+import spacy
+from presidio_analyzer.nlp_engine import TransformersNlpEngine
+
+N_TEXTS = 2000
+BATCH_SIZE = 32
+MAX_BATCH_TOKENS = 4096
+WORDS = ["patient", "John", "Smith", "visited", "the", "clinic", "on", "Monday"]
+
+
+def create_texts():
+    """Return texts of log-normally distributed lengths (median of 30 words)."""
+    generator = random.Random(42)
+    return [
+        " ".join(
+            generator.choice(WORDS)
+            for _ in range(min(int(generator.lognormvariate(3.4, 0.9)) + 1, 1000))
+        )
+        for _ in range(N_TEXTS)
+    ]
+
+
+def get_padding_share(lengths, batches):
+    """Return the share of padding tokens, padding each batch to its longest."""
+    padded = sum(len(batch) * max(lengths[i] for i in batch) for batch in batches)
+    return 1 - sum(lengths) / padded
+
+
+def time_process_batch(engine, texts, max_batch_tokens) -> float:
+    """Return the seconds taken by process_batch."""
+    engine.max_batch_tokens = max_batch_tokens
+    start = time.perf_counter()
+    for _ in engine.process_batch(texts, language="en", batch_size=BATCH_SIZE):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    """Print the padding share and the time taken of each batching."""
+    texts = create_texts()
+    engine = TransformersNlpEngine()
+    if TransformersNlpEngine.is_available:
+        from transformers import AutoTokenizer
+
+        model = engine.models[0]["model_name"]["transformers"]
+        tokenizer = AutoTokenizer.from_pretrained(model)
+        lengths = TransformersNlpEngine._get_model_lengths(tokenizer, texts)
+        print(f"tokens of the {model} tokenizer")
+    else:
+        tokenizer = spacy.blank("en").tokenizer
+        lengths = [len(tokenizer(text)) for text in texts]
+        print("transformers is not installed, tokens approximated by spaCy tokens")
+    in_order = [
+        list(range(start, min(start + BATCH_SIZE, len(texts))))
+        for start in range(0, len(texts), BATCH_SIZE)
+    ]
+    by_length = TransformersNlpEngine._get_length_batches(lengths, MAX_BATCH_TOKENS)
+
+    in_order_padding = get_padding_share(lengths, in_order)
+    by_length_padding = get_padding_share(lengths, by_length)
+    print(f"{N_TEXTS} texts, median of {sorted(lengths)[N_TEXTS // 2]} tokens")
+    print(f"in order, {BATCH_SIZE} per batch: {in_order_padding:.0%} padding")
+    print(f"by length, {MAX_BATCH_TOKENS} tokens: {by_length_padding:.0%} padding")
+
+    if not TransformersNlpEngine.is_available:
+        print("spacy-huggingface-pipelines is not installed, not timing the model")
+        return
+
+    engine.load()
+    in_order_seconds = time_process_batch(engine, texts, max_batch_tokens=None)
+    by_length_seconds = time_process_batch(engine, texts, MAX_BATCH_TOKENS)
+    print(f"in order:  {in_order_seconds:8.2f} s")
+    print(f"by length: {by_length_seconds:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark of the ONNX Runtime backends of TransformersNlpEngine.
+
+Runs the same texts through the default PyTorch backend, the ONNX Runtime
+backend and the int8 quantized ONNX Runtime backend, and prints the time
+taken by each, and whether each finds the same entities as PyTorch,
+with scores within `SCORE_TOLERANCE`.
+Requires spacy-huggingface-pipelines, optimum[onnxruntime] and the models.
+
+Run from the presidio-analyzer directory, with presidio_analyzer installed:
+python benchmarks/benchmark_transformers_onnx.py
+"""
+
+import time
+
+from presidio_analyzer.nlp_engine import TransformersNlpEngine
+
+N_TEXTS = 200
+SCORE_TOLERANCE = 0.05
+MODEL = {
+    "lang_code": "en",
+    "model_name": {
+        "spacy": "en_core_web_sm",
+        "transformers": "StanfordAIMI/stanford-deidentifier-base",
+    },
+}
+TEXTS = [
+    "Patient John Smith was admitted to Mercy Hospital on March 3rd.",
+    "Call Dr. Maria Garcia at 212-555-0123 about the results.",
+    "Jane Doe, 45, lives in Seattle and works for Contoso.",
+    "The appointment with Ahmed Khan is on Monday at 10:30.",
+]
+
+
+def get_entities(engine, texts):
+    """Return the entities and scores found in each text, and the seconds taken."""
+    start = time.perf_counter()
+    entities = [
+        list(zip(nlp_artifacts.entities, nlp_artifacts.scores))
+        for _, nlp_artifacts in engine.process_batch(texts, language="en")
+    ]
+    return entities, time.perf_counter() - start
+
+
+def is_same(entities, expected_entities):
+    """Return whether entities match the expected ones within the tolerance."""
+    for text_entities, expected_text_entities in zip(entities, expected_entities):
+        if len(text_entities) != len(expected_text_entities):
+            return False
+        for (span, score), (expected_span, expected_score) in zip(
+            text_entities, expected_text_entities
+        ):
+            if (span.start_char, span.end_char, span.label_) != (
+                expected_span.start_char,
+                expected_span.end_char,
+                expected_span.label_,
+            ) or abs(score - expected_score) > SCORE_TOLERANCE:
+                return False
+    return True
+
+
+def main():
+    """Print the time taken by each backend and whether its entities match."""
+    texts = [TEXTS[i % len(TEXTS)] for i in range(N_TEXTS)]
+    backends = {
+        "pytorch": {},
+        "onnx": {"backend": "onnx"},
+        "onnx int8": {"backend": "onnx", "quantize": True},
+    }
+
+    expected_entities = None
+    for name, backend_params in backends.items():
+        engine = TransformersNlpEngine(models=[{**MODEL, **backend_params}])
+        engine.load()
+        get_entities(engine, texts[:1])  # warm up
+        entities, seconds = get_entities(engine, texts)
+        if expected_entities is None:
+            expected_entities = entities
+        same = is_same(entities, expected_entities)
+        print(f"{name:10}: {seconds:8.2f} s, same entities and scores: {same}")
+
+
+if __name__ == "__main__":
+    main()
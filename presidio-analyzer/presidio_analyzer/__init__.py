@@ -1,7 +1,9 @@
 # isort: skip_file
 """Presidio analyzer package."""
 
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
 from presidio_analyzer.analysis_explanation import AnalysisExplanation
 from presidio_analyzer.recognizer_result import RecognizerResult
@@ -9,15 +11,51 @@ from presidio_analyzer.dict_analyzer_result import DictAnalyzerResult
 from presidio_analyzer.entity_recognizer import EntityRecognizer
 from presidio_analyzer.local_recognizer import LocalRecognizer
 from presidio_analyzer.pattern import Pattern
+from presidio_analyzer.deny_list_matcher import DenyListMatcher
+from presidio_analyzer.allow_list import AllowList
+from presidio_analyzer.text_chunker import TextChunker
 from presidio_analyzer.pattern_recognizer import PatternRecognizer
 from presidio_analyzer.remote_recognizer import RemoteRecognizer
-from presidio_analyzer.recognizer_registry import RecognizerRegistry
-from presidio_analyzer.analyzer_engine import AnalyzerEngine
-from presidio_analyzer.batch_analyzer_engine import BatchAnalyzerEngine
+from presidio_analyzer.multi_pattern_scanner import MultiPatternScanner
+from presidio_analyzer.ad_hoc_recognizer_cache import AdHocRecognizerCache
 from presidio_analyzer.analyzer_request import AnalyzerRequest
 from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer
 from presidio_analyzer.context_aware_enhancers import LemmaContextAwareEnhancer
-from presidio_analyzer.analyzer_engine_provider import AnalyzerEngineProvider
+
+if TYPE_CHECKING:
+    from presidio_analyzer.columnar_recognizer_results import (
+        ColumnarRecognizerResults,
+    )
+    from presidio_analyzer.recognizer_registry import RecognizerRegistry
+    from presidio_analyzer.analyzer_engine import AnalyzerEngine
+    from presidio_analyzer.batch_analyzer_engine import BatchAnalyzerEngine
+    from presidio_analyzer.analyzer_engine_provider import AnalyzerEngineProvider
+
+# The registry and the engines import the NLP engines and predefined recognizers
+# (and with them NLP libraries such as spaCy), so they are only imported
+# when first accessed. Processes using only e.g. PatternRecognizer don't load them.
+_LAZY_IMPORTS = {
+    "ColumnarRecognizerResults": "presidio_analyzer.columnar_recognizer_results",
+    "RecognizerRegistry": "presidio_analyzer.recognizer_registry",
+    "AnalyzerEngine": "presidio_analyzer.analyzer_engine",
+    "BatchAnalyzerEngine": "presidio_analyzer.batch_analyzer_engine",
+    "AnalyzerEngineProvider": "presidio_analyzer.analyzer_engine_provider",
+}
+
+
+def __getattr__(name: str):
+    """Import the lazily imported attributes on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of the module, including the lazily imported ones."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 # Define default loggers behavior
 
@@ -40,10 +78,16 @@ __all__ = [
     "AnalysisExplanation",
     "RecognizerResult",
     "DictAnalyzerResult",
+    "ColumnarRecognizerResults",
     "EntityRecognizer",
     "LocalRecognizer",
+    "DenyListMatcher",
+    "AllowList",
+    "TextChunker",
     "PatternRecognizer",
     "RemoteRecognizer",
+    "MultiPatternScanner",
+    "AdHocRecognizerCache",
     "RecognizerRegistry",
     "AnalyzerEngine",
     "AnalyzerRequest",
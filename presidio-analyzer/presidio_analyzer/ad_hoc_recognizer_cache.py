@@ -0,0 +1,114 @@
+import copy
+import hashlib
+import json
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from presidio_analyzer import PatternRecognizer
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class AdHocRecognizerCache:
+    """
+    A bounded LRU cache of ad hoc PatternRecognizers, keyed by their definition.
+
+    Clients of the REST API typically send the same ad hoc recognizers with
+    every request. Creating a recognizer for each request means compiling
+    its regexes again on each request, while a cached recognizer keeps them
+    compiled. Definitions are keyed by a hash of their canonical JSON form,
+    so equal definitions share one recognizer regardless of the key order.
+
+    Cached recognizers are shared between requests (and threads):
+    they must not be modified by their users. Each recognizer is cached
+    per regex flags, so that its patterns are only ever compiled with
+    the same flags, and are not recompiled by concurrent requests
+    using other flags.
+
+    :param max_size: Maximum number of recognizers to keep
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._recognizers: Dict[Tuple[str, Optional[int]], PatternRecognizer] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_fingerprint(recognizer_dict: Dict) -> str:
+        """
+        Return the hash of a recognizer definition, independent of the key order.
+
+        :param recognizer_dict: The recognizer definition,
+        as accepted by PatternRecognizer.from_dict
+        """
+        canonical = json.dumps(
+            recognizer_dict, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get_recognizer(
+        self, recognizer_dict: Dict, regex_flags: Optional[int] = None
+    ) -> PatternRecognizer:
+        """
+        Return the recognizer of a definition, creating and caching it if needed.
+
+        :param recognizer_dict: The recognizer definition,
+        as accepted by PatternRecognizer.from_dict
+        :param regex_flags: The regex flags the recognizer will be used with,
+        None for the recognizer's global_regex_flags
+        :return: A recognizer with its patterns compiled with these flags
+        """
+        try:
+            key = (self.get_fingerprint(recognizer_dict), regex_flags or None)
+        except TypeError:
+            logger.debug("Ad hoc recognizer definition is not JSON, not caching it")
+            return self.__create_recognizer(recognizer_dict, regex_flags)
+
+        with self._lock:
+            recognizer = self._recognizers.pop(key, None)
+            if recognizer is not None:
+                # reinsert as the most recently used
+                self._recognizers[key] = recognizer
+                return recognizer
+
+        # created outside the lock, as compiling the patterns may take a while
+        recognizer = self.__create_recognizer(recognizer_dict, regex_flags)
+
+        with self._lock:
+            # keep the recognizer cached by a concurrent request, if any
+            recognizer = self._recognizers.pop(key, recognizer)
+            self._recognizers[key] = recognizer
+            if len(self._recognizers) > self.max_size:
+                # evict the least recently used recognizer
+                del self._recognizers[next(iter(self._recognizers))]
+        return recognizer
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle (e.g. for worker processes), without the lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore a pickled cache, with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Remove all cached recognizers."""
+        with self._lock:
+            self._recognizers.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached recognizers."""
+        return len(self._recognizers)
+
+    @staticmethod
+    def __create_recognizer(
+        recognizer_dict: Dict, regex_flags: Optional[int]
+    ) -> PatternRecognizer:
+        # from_dict replaces the patterns of the dict it is given
+        recognizer = PatternRecognizer.from_dict(copy.deepcopy(recognizer_dict))
+        recognizer.compile_patterns(flags=regex_flags)
+        return recognizer
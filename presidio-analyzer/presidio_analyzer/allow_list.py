@@ -0,0 +1,98 @@
+from typing import Dict, Iterable, List, Optional
+
+import regex as re
+
+from presidio_analyzer import RecognizerResult
+
+
+class AllowList:
+    """
+    Words the user allows to keep in the text, prepared once for many analyses.
+
+    Passing an AllowList to `AnalyzerEngine.analyze` instead of a list of words
+    avoids preparing the allow list on every call, which matters for allow lists
+    of thousands of words: exact words are held in a set (a hash lookup per
+    result), and regexes are combined into a single compiled regex.
+
+    :param allow_list: The allowed words,
+    or regexes if allow_list_match is "regex"
+    :param allow_list_match: How the allow_list should be interpreted;
+    either as "exact" or as "regex".
+    - If `regex`, results which match with any regex condition in the allow_list
+    are allowed.
+    - if `exact`, results which exactly match any value in the allow_list
+    are allowed.
+    """
+
+    def __init__(self, allow_list: Iterable[str], allow_list_match: str = "exact"):
+        if allow_list_match not in ("exact", "regex"):
+            raise ValueError(
+                "allow_list_match must either be set to 'exact' or 'regex'."
+            )
+
+        self.allow_list = list(allow_list)
+        self.allow_list_match = allow_list_match
+        self._words = frozenset(self.allow_list)
+        # The union of the regexes, compiled per regex flags
+        self._compiled_regexes: Dict[int, re.Pattern] = {}
+
+    def is_allowed(self, word: str, regex_flags: Optional[int] = None) -> bool:
+        """
+        Return whether a word is allowed.
+
+        :param word: The text of a result
+        :param regex_flags: regex flags to be used when allow_list_match is "regex"
+        """
+        if self.allow_list_match == "exact":
+            return word in self._words
+        return bool(self.__get_compiled_regex(regex_flags).search(word))
+
+    def remove_allowed(
+        self,
+        results: List[RecognizerResult],
+        text: str,
+        regex_flags: Optional[int] = None,
+    ) -> List[RecognizerResult]:
+        """
+        Remove results which are part of the allow list.
+
+        :param results: List of RecognizerResult
+        :param text: the text the results were found in
+        :param regex_flags: regex flags to be used when allow_list_match is "regex"
+        :return: List[RecognizerResult]
+        """
+        if self.allow_list_match == "exact":
+            return [
+                result
+                for result in results
+                if text[result.start : result.end] not in self._words
+            ]
+
+        compiled_regex = self.__get_compiled_regex(regex_flags)
+        return [
+            result
+            for result in results
+            if not compiled_regex.search(text[result.start : result.end])
+        ]
+
+    def __contains__(self, word: str) -> bool:
+        """Return whether a word is allowed, using the default regex flags."""
+        return self.is_allowed(word)
+
+    def __len__(self) -> int:
+        """Return the number of words (or regexes) in the allow list."""
+        return len(self.allow_list)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the instance."""
+        return (
+            f"AllowList(words={len(self)}, allow_list_match={self.allow_list_match!r})"
+        )
+
+    def __get_compiled_regex(self, regex_flags: Optional[int]) -> re.Pattern:
+        regex_flags = regex_flags or 0
+        compiled_regex = self._compiled_regexes.get(regex_flags)
+        if compiled_regex is None:
+            compiled_regex = re.compile("|".join(self.allow_list), flags=regex_flags)
+            self._compiled_regexes[regex_flags] = compiled_regex
+        return compiled_regex
@@ -15,6 +15,19 @@ class AnalysisExplanation:
             a decision of a logic or model
     """
 
+    __slots__ = (
+        "recognizer",
+        "pattern_name",
+        "pattern",
+        "original_score",
+        "score",
+        "textual_explanation",
+        "score_context_improvement",
+        "supportive_context_word",
+        "validation_result",
+        "regex_flags",
+    )
+
     def __init__(
         self,
         recognizer: str,
@@ -38,7 +51,7 @@ class AnalysisExplanation:
 
     def __repr__(self):
         """Create string representation of the object."""
-        return str(self.__dict__)
+        return str(self.to_dict())
 
     def set_improved_score(self, score: float) -> None:
         """Update the score and calculate the difference from the original score."""
@@ -62,4 +75,4 @@ class AnalysisExplanation:
 
         :return: a dictionary
         """
-        return self.__dict__
+        return {name: getattr(self, name) for name in self.__slots__}
@@ -1,19 +1,35 @@
+import asyncio
 import json
 import logging
-from collections import Counter
-from typing import List, Optional
+from collections import Counter, defaultdict
+from functools import partial
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import regex as re
 
 from presidio_analyzer import (
     EntityRecognizer,
     RecognizerResult,
+    RemoteRecognizer,
 )
+from presidio_analyzer.ad_hoc_recognizer_cache import AdHocRecognizerCache
+from presidio_analyzer.allow_list import AllowList
 from presidio_analyzer.app_tracer import AppTracer
 from presidio_analyzer.context_aware_enhancers import (
     ContextAwareEnhancer,
     LemmaContextAwareEnhancer,
 )
+from presidio_analyzer.multi_pattern_scanner import MultiPatternScanner
 from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine, NlpEngineProvider
 from presidio_analyzer.recognizer_registry import (
     RecognizerRegistry,
@@ -43,8 +59,20 @@ class AnalyzerEngine:
     :param context_aware_enhancer: instance of type ContextAwareEnhancer for enhancing
     confidence score based on context words, (LemmaContextAwareEnhancer will be created
     by default if None passed)
+    :param multi_pattern_scanning: Whether to evaluate the patterns of all
+    pattern recognizers using a single pass over the text (see MultiPatternScanner).
+    Requires the google-re2 package.
+    :param ad_hoc_recognizer_cache: Cache of the ad hoc recognizers created
+    from request definitions (see AnalyzerRequest), kept with the engine
+    so that they are reused across requests. A new cache is created if None.
     """
 
+    # Maximum number of MultiPatternScanners (one per recognizers set) to keep
+    MAX_CACHED_PATTERN_SCANNERS = 64
+
+    # Maximum number of AllowLists prepared from allow lists passed as lists
+    MAX_CACHED_ALLOW_LISTS = 16
+
     def __init__(
         self,
         registry: RecognizerRegistry = None,
@@ -54,6 +82,8 @@ class AnalyzerEngine:
         default_score_threshold: float = 0,
         supported_languages: List[str] = None,
         context_aware_enhancer: Optional[ContextAwareEnhancer] = None,
+        multi_pattern_scanning: bool = False,
+        ad_hoc_recognizer_cache: Optional[AdHocRecognizerCache] = None,
     ):
         if not supported_languages:
             supported_languages = ["en"]
@@ -110,6 +140,18 @@ class AnalyzerEngine:
 
         self.context_aware_enhancer = context_aware_enhancer
 
+        if multi_pattern_scanning and not MultiPatternScanner.is_available:
+            raise ImportError(
+                "multi_pattern_scanning requires google-re2. Please install it."
+            )
+        self.multi_pattern_scanning = multi_pattern_scanning
+        self._pattern_scanners: Dict[frozenset, MultiPatternScanner] = {}
+        self._allow_lists: Dict[Tuple[int, int, str], Tuple[List[str], AllowList]] = {}
+
+        if ad_hoc_recognizer_cache is None:
+            ad_hoc_recognizer_cache = AdHocRecognizerCache()
+        self.ad_hoc_recognizer_cache = ad_hoc_recognizer_cache
+
     def get_recognizers(self, language: Optional[str] = None) -> List[EntityRecognizer]:
         """
         Return a list of PII recognizers currently loaded.
@@ -155,10 +197,11 @@ class AnalyzerEngine:
         return_decision_process: Optional[bool] = False,
         ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
         context: Optional[List[str]] = None,
-        allow_list: Optional[List[str]] = None,
+        allow_list: Optional[Union[List[str], AllowList]] = None,
         allow_list_match: Optional[str] = "exact",
         regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
         nlp_artifacts: Optional[NlpArtifacts] = None,
+        recognizer_results: Optional[Dict[str, List[RecognizerResult]]] = None,
     ) -> List[RecognizerResult]:
         """
         Find PII entities in text using different PII recognizers for a given language.
@@ -177,12 +220,17 @@ class AnalyzerEngine:
         :param context: List of context words to enhance confidence score if matched
         with the recognized entity's recognizer context
         :param allow_list: List of words that the user defines as being allowed to keep
-        in the text
+        in the text, or an AllowList (prepared once for many calls, and holding
+        its own allow_list_match). Lists are prepared once too, and reused while
+        the same, unchanged, list is passed
         :param allow_list_match: How the allow_list should be interpreted; either as "exact" or as "regex".
         - If `regex`, results which match with any regex condition in the allow_list would be allowed and not be returned as potential PII.
         - if `exact`, results which exactly match any value in the allow_list would be allowed and not be returned as potential PII.
         :param regex_flags: regex flags to be used for when allow_list_match is "regex"
         :param nlp_artifacts: precomputed NlpArtifacts
+        :param recognizer_results: precomputed results per recognizer id,
+        used instead of running these recognizers
+        (e.g. from `RemoteRecognizer.analyze_batch`)
         :return: an array of the found entities in the text
 
         :Example:
@@ -216,31 +264,370 @@ class AnalyzerEngine:
             entities = self.get_supported_entities(language=language)
 
         # run the nlp pipeline over the given text, store the results in
-        # a NlpArtifacts instance
-        if not nlp_artifacts:
-            nlp_artifacts = self.nlp_engine.process_text(text, language)
-
-        if self.log_decision_process:
+        # a NlpArtifacts instance.
+        # Only the parts needed by the recognizers and the context enhancer run,
+        # and none if the recognizers don't use it (e.g. only regex recognizers)
+        nlp_capabilities = self.get_nlp_capabilities(recognizers)
+        if not nlp_artifacts and (nlp_capabilities is None or nlp_capabilities):
+            nlp_artifacts = self._process_text(text, language, nlp_capabilities)
+
+        if self.log_decision_process and nlp_artifacts:
             self.app_tracer.trace(
                 correlation_id, "nlp artifacts:" + nlp_artifacts.to_json()
             )
 
-        results = []
+        results_per_recognizer = self._analyze_with_recognizers(
+            text,
+            entities,
+            recognizers,
+            nlp_artifacts,
+            ad_hoc_recognizers,
+            recognizer_results,
+        )
+        results = [
+            result
+            for recognizer_results in results_per_recognizer.values()
+            for result in recognizer_results or []
+        ]
+
+        return self._process_results(
+            text,
+            language,
+            results,
+            nlp_artifacts,
+            recognizers,
+            correlation_id=correlation_id,
+            score_threshold=score_threshold,
+            return_decision_process=return_decision_process,
+            context=context,
+            allow_list=allow_list,
+            allow_list_match=allow_list_match,
+            regex_flags=regex_flags,
+        )
+
+    async def analyze_async(
+        self,
+        text: str,
+        language: str,
+        entities: Optional[List[str]] = None,
+        correlation_id: Optional[str] = None,
+        score_threshold: Optional[float] = None,
+        return_decision_process: Optional[bool] = False,
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        context: Optional[List[str]] = None,
+        allow_list: Optional[Union[List[str], AllowList]] = None,
+        allow_list_match: Optional[str] = "exact",
+        regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+        recognizer_results: Optional[Dict[str, List[RecognizerResult]]] = None,
+    ) -> List[RecognizerResult]:
+        """
+        Find PII entities in text, calling the remote recognizers concurrently.
+
+        Returns the same results as `analyze`, but the calls of the
+        `RemoteRecognizer`s (see `RemoteRecognizer.analyze_async`) run concurrently
+        with each other, and with the NLP pipeline and the local recognizers,
+        which run in the event loop's default executor.
+        The latency is therefore close to the one of the slowest of them.
+        Remote recognizers using the NlpArtifacts are called once they're ready.
+
+        See `analyze` for the parameters.
+
+        :Example:
+
+        ```python
+        import asyncio
+
+        from presidio_analyzer import AnalyzerEngine
+
+        analyzer = AnalyzerEngine()
+        results = asyncio.run(
+            analyzer.analyze_async(text="My phone number is 212-555-5555", language="en")
+        )
+        ```
+        """  # noqa: E501
+
+        all_fields = not entities
+
+        recognizers = self.registry.get_recognizers(
+            language=language,
+            entities=entities,
+            all_fields=all_fields,
+            ad_hoc_recognizers=ad_hoc_recognizers,
+        )
+
+        if all_fields:
+            entities = self.get_supported_entities(language=language)
+
+        local_recognizers = []
+        remote_recognizers = []
         for recognizer in recognizers:
-            # Lazy loading of the relevant recognizers
-            if not recognizer.is_loaded:
-                recognizer.load()
-                recognizer.is_loaded = True
+            if isinstance(recognizer, RemoteRecognizer) and not (
+                recognizer_results and recognizer.id in recognizer_results
+            ):
+                remote_recognizers.append(recognizer)
+            else:
+                local_recognizers.append(recognizer)
+
+        remote_tasks: Dict[str, asyncio.Future] = {}
+
+        def call_remote_recognizers(
+            remote: List[RemoteRecognizer], artifacts: Optional[NlpArtifacts]
+        ) -> None:
+            for recognizer in remote:
+                self._load_recognizer(recognizer)
+                remote_tasks[recognizer.id] = asyncio.ensure_future(
+                    recognizer.analyze_async(
+                        text=text, entities=entities, nlp_artifacts=artifacts
+                    )
+                )
 
-            # analyze using the current recognizer and append the results
-            current_results = recognizer.analyze(
-                text=text, entities=entities, nlp_artifacts=nlp_artifacts
+        loop = asyncio.get_running_loop()
+        try:
+            # remote recognizers which don't need the NLP pipeline are called
+            # right away, while it runs
+            call_remote_recognizers(
+                [
+                    rec
+                    for rec in remote_recognizers
+                    if nlp_artifacts or rec.nlp_capabilities == frozenset()
+                ],
+                nlp_artifacts,
+            )
+
+            nlp_capabilities = self.get_nlp_capabilities(recognizers)
+            if not nlp_artifacts and (nlp_capabilities is None or nlp_capabilities):
+                nlp_artifacts = await loop.run_in_executor(
+                    None, self._process_text, text, language, nlp_capabilities
+                )
+
+            if self.log_decision_process and nlp_artifacts:
+                self.app_tracer.trace(
+                    correlation_id, "nlp artifacts:" + nlp_artifacts.to_json()
+                )
+
+            call_remote_recognizers(
+                [rec for rec in remote_recognizers if rec.id not in remote_tasks],
+                nlp_artifacts,
+            )
+
+            results_per_recognizer = await loop.run_in_executor(
+                None,
+                self._analyze_with_recognizers,
+                text,
+                entities,
+                local_recognizers,
+                nlp_artifacts,
+                ad_hoc_recognizers,
+                recognizer_results,
+            )
+            remote_results = await asyncio.gather(*remote_tasks.values())
+        finally:
+            for task in remote_tasks.values():
+                task.cancel()
+
+        remote_recognizers_by_id = {rec.id: rec for rec in remote_recognizers}
+        for recognizer_id, current_results in zip(remote_tasks.keys(), remote_results):
+            recognizer = remote_recognizers_by_id[recognizer_id]
+            if current_results:
+                self.__add_recognizer_id_if_not_exists(current_results, recognizer)
+            results_per_recognizer[recognizer.id] = current_results
+
+        # merge in the recognizers order, as in `analyze`
+        results = [
+            result
+            for recognizer in recognizers
+            for result in results_per_recognizer[recognizer.id] or []
+        ]
+
+        return self._process_results(
+            text,
+            language,
+            results,
+            nlp_artifacts,
+            recognizers,
+            correlation_id=correlation_id,
+            score_threshold=score_threshold,
+            return_decision_process=return_decision_process,
+            context=context,
+            allow_list=allow_list,
+            allow_list_match=allow_list_match,
+            regex_flags=regex_flags,
+        )
+
+    def analyze_stream(
+        self,
+        text_stream: Union[Iterable[str], TextIO],
+        language: str,
+        window_size: int = 100_000,
+        window_overlap: int = 1_000,
+        **kwargs,
+    ) -> Iterator[RecognizerResult]:
+        """
+        Find PII entities in a text too large to analyze at once, in windows.
+
+        The text is read from the stream and analyzed in overlapping windows of
+        `window_size` characters, so that memory is bounded by the window size
+        and the NLP engine never processes more than a window (e.g. below spaCy's
+        max_length). Each result is returned by the window in which it starts
+        at least `window_overlap` characters from the window's edges,
+        so entities and their context words are never cut by a window edge
+        as long as they are shorter than `window_overlap`.
+
+        Results are yielded, ordered by start, as soon as their window is
+        analyzed, with offsets in the whole text.
+
+        :param text_stream: The text to analyze, as chunks of text of any size
+        (e.g. the lines of a file) or as a text file object
+        :param language: the language of the text
+        :param window_size: Number of characters analyzed at once
+        :param window_overlap: Number of characters of context around the results
+        of each window, which are also analyzed by the previous or next window.
+        Must be less than half of `window_size`.
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method
+        (e.g. entities, score_threshold or allow_list)
+        """
+        if window_overlap < 0 or window_size <= 2 * window_overlap:
+            raise ValueError(
+                "window_overlap must be positive and less than half of window_size"
             )
+
+        if isinstance(text_stream, str):
+            chunks = iter([text_stream])
+        elif hasattr(text_stream, "read"):
+            chunks = iter(partial(text_stream.read, window_size), "")
+        else:
+            chunks = iter(text_stream)
+        # large chunks (e.g. a whole text) are split, for the buffer to stay
+        # below two windows, and each window to be copied once
+        chunks = (
+            chunk[index : index + window_size]
+            for chunk in chunks
+            for index in range(0, len(chunk), window_size)
+        )
+
+        buffer = ""
+        # offset of the buffer, and of the first result owned by the next window,
+        # in the whole text
+        buffer_start = 0
+        owned_start = 0
+        exhausted = False
+        while True:
+            if not exhausted and len(buffer) < window_size:
+                pieces = [buffer]
+                size = len(buffer)
+                while size < window_size:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pieces.append(chunk)
+                    size += len(chunk)
+                buffer = "".join(pieces)
+
+            is_last_window = exhausted and len(buffer) <= window_size
+            if is_last_window:
+                window = buffer
+                owned_end = buffer_start + len(buffer)
+            else:
+                window = buffer[:window_size]
+                owned_end = buffer_start + window_size - window_overlap
+
+            if not window:
+                return
+
+            results = self.analyze(text=window, language=language, **kwargs)
+            owned_results = []
+            for result in results:
+                result.start += buffer_start
+                result.end += buffer_start
+                if owned_start <= result.start < owned_end:
+                    owned_results.append(result)
+            owned_results.sort(key=lambda result: (result.start, result.end))
+            yield from owned_results
+
+            if is_last_window:
+                return
+
+            next_start = owned_end - window_overlap
+            buffer = buffer[next_start - buffer_start :]
+            buffer_start = next_start
+            owned_start = owned_end
+
+    def _analyze_with_recognizers(
+        self,
+        text: str,
+        entities: List[str],
+        recognizers: List[EntityRecognizer],
+        nlp_artifacts: Optional[NlpArtifacts],
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        recognizer_results: Optional[Dict[str, List[RecognizerResult]]] = None,
+    ) -> Dict[str, List[RecognizerResult]]:
+        """
+        Run the recognizers over the text.
+
+        :param text: The text to analyze
+        :param entities: The entities to look for
+        :param recognizers: The recognizers to run
+        :param nlp_artifacts: The NlpArtifacts of the text, if needed
+        :param ad_hoc_recognizers: The ad-hoc recognizers of this request
+        :param recognizer_results: precomputed results per recognizer id
+        :return: A dictionary of the results per recognizer id,
+        in the recognizers order
+        """
+        scanned_results = dict(recognizer_results or {})
+        if self.multi_pattern_scanning:
+            scanned_results.update(
+                self._scan_patterns(
+                    text,
+                    [rec for rec in recognizers if rec.id not in scanned_results],
+                    ad_hoc_recognizers,
+                )
+            )
+
+        results = {}
+        for recognizer in recognizers:
+            self._load_recognizer(recognizer)
+
+            # analyze using the current recognizer and append the results
+            if recognizer.id in scanned_results:
+                current_results = scanned_results[recognizer.id]
+            else:
+                current_results = recognizer.analyze(
+                    text=text, entities=entities, nlp_artifacts=nlp_artifacts
+                )
             if current_results:
                 # add recognizer name to recognition metadata inside results
                 # if not exists
                 self.__add_recognizer_id_if_not_exists(current_results, recognizer)
-                results.extend(current_results)
+            results[recognizer.id] = current_results
+
+        return results
+
+    def _process_results(
+        self,
+        text: str,
+        language: str,
+        results: List[RecognizerResult],
+        nlp_artifacts: Optional[NlpArtifacts],
+        recognizers: List[EntityRecognizer],
+        correlation_id: Optional[str],
+        score_threshold: Optional[float],
+        return_decision_process: Optional[bool],
+        context: Optional[List[str]],
+        allow_list: Optional[Union[List[str], AllowList]],
+        allow_list_match: Optional[str],
+        regex_flags: Optional[int],
+    ) -> List[RecognizerResult]:
+        """
+        Enhance the recognizers results using context and filter them.
+
+        See `analyze` for the parameters.
+        """
+        if not nlp_artifacts and results:
+            nlp_artifacts = self._process_text(
+                text, language, self.context_aware_enhancer.nlp_capabilities
+            )
 
         results = self._enhance_using_context(
             text, results, nlp_artifacts, recognizers, context
@@ -257,6 +644,7 @@ class AnalyzerEngine:
         results = self.__remove_low_scores(results, score_threshold)
 
         if allow_list:
+            allow_list = self._get_allow_list(allow_list, allow_list_match)
             results = self._remove_allow_list(
                 results, allow_list, text, regex_flags, allow_list_match
             )
@@ -266,6 +654,99 @@ class AnalyzerEngine:
 
         return results
 
+    @staticmethod
+    def _load_recognizer(recognizer: EntityRecognizer) -> None:
+        # Lazy loading of the relevant recognizers
+        if not recognizer.is_loaded:
+            recognizer.load()
+            recognizer.is_loaded = True
+
+    def get_nlp_capabilities(
+        self, recognizers: List[EntityRecognizer]
+    ) -> Optional[FrozenSet[str]]:
+        """
+        Return the NlpArtifacts attributes needed to analyze a text.
+
+        When the recognizers need any, the attributes needed by the
+        context enhancer are included, as it uses the same NlpArtifacts.
+
+        :param recognizers: The recognizers used to analyze the text
+        :return: The capabilities to request from the NLP engine,
+        an empty set if the NLP pipeline doesn't have to run,
+        or None if the full pipeline has to run.
+        """
+        capabilities = set()
+        for recognizer in recognizers:
+            if recognizer.nlp_capabilities is None:
+                return None
+            capabilities.update(recognizer.nlp_capabilities)
+
+        if not capabilities:
+            return frozenset()
+        if self.context_aware_enhancer.nlp_capabilities is None:
+            return None
+        return frozenset(capabilities | self.context_aware_enhancer.nlp_capabilities)
+
+    def _process_text(
+        self, text: str, language: str, capabilities: Optional[FrozenSet[str]]
+    ) -> NlpArtifacts:
+        """Run the parts of the NLP pipeline needed for the given capabilities."""
+        if capabilities is None:
+            return self.nlp_engine.process_text(text, language)
+        if self.nlp_engine.supports_capabilities:
+            return self.nlp_engine.process_text(
+                text, language, capabilities=capabilities
+            )
+        if "entities" not in capabilities:
+            return self.nlp_engine.tokenize(text, language)
+        return self.nlp_engine.process_text(text, language)
+
+    def _scan_patterns(
+        self,
+        text: str,
+        recognizers: List[EntityRecognizer],
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+    ) -> Dict[str, List[RecognizerResult]]:
+        """
+        Run the pattern recognizers over the text in a single pass.
+
+        Scanners are cached per set of recognizers (and their patterns),
+        ad-hoc recognizers are excluded as they change on every request.
+
+        :param text: The text to analyze
+        :param recognizers: The recognizers selected for this request
+        :param ad_hoc_recognizers: The ad-hoc recognizers of this request
+        :return: A dictionary of the results per scanned recognizer id
+        """
+        ad_hoc_ids = {rec.id for rec in ad_hoc_recognizers or []}
+        scannable = [
+            rec
+            for rec in recognizers
+            if rec.id not in ad_hoc_ids and MultiPatternScanner.is_supported(rec)
+        ]
+        if not scannable:
+            return {}
+
+        key = frozenset(
+            (rec.id, rec.global_regex_flags, tuple(p.regex for p in rec.patterns))
+            for rec in scannable
+        )
+        scanner = self._pattern_scanners.get(key)
+        if not scanner:
+            scanner = MultiPatternScanner(scannable)
+            if len(self._pattern_scanners) >= self.MAX_CACHED_PATTERN_SCANNERS:
+                # evict the oldest scanner. The engine may be shared by threads,
+                # which may evict it first or change the dict while it is iterated
+                try:
+                    self._pattern_scanners.pop(
+                        next(iter(self._pattern_scanners), None), None
+                    )
+                except RuntimeError:
+                    pass
+            self._pattern_scanners[key] = scanner
+
+        return scanner.analyze(text)
+
     def _enhance_using_context(
         self,
         text: str,
@@ -286,32 +767,34 @@ class AnalyzerEngine:
         :param recognizers: the list of recognizers
         :param context: list of context words
         """
-        results = []
+        results_per_recognizer = defaultdict(list)
+        for result in raw_results:
+            recognizer_id = result.get_recognition_metadata_value(
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY
+            )
+            results_per_recognizer[recognizer_id].append(result)
 
+        results = []
         for recognizer in recognizers:
-            recognizer_results = [
-                r
-                for r in raw_results
-                if r.recognition_metadata[RecognizerResult.RECOGNIZER_IDENTIFIER_KEY]
-                == recognizer.id
-            ]
-            other_recognizer_results = [
-                r
-                for r in raw_results
-                if r.recognition_metadata[RecognizerResult.RECOGNIZER_IDENTIFIER_KEY]
-                != recognizer.id
-            ]
+            recognizer_results = results_per_recognizer.get(recognizer.id, [])
 
             # enhance score using context in recognizer level if implemented
-            recognizer_results = recognizer.enhance_using_context(
-                text=text,
-                # each recognizer will get access to all recognizer results
-                # to allow related entities contex enhancement
-                raw_recognizer_results=recognizer_results,
-                other_raw_recognizer_results=other_recognizer_results,
-                nlp_artifacts=nlp_artifacts,
-                context=context,
-            )
+            if self._implements_enhance_using_context(recognizer):
+                other_recognizer_results = [
+                    result
+                    for recognizer_id, other_results in results_per_recognizer.items()
+                    if recognizer_id != recognizer.id
+                    for result in other_results
+                ]
+                recognizer_results = recognizer.enhance_using_context(
+                    text=text,
+                    # each recognizer will get access to all recognizer results
+                    # to allow related entities contex enhancement
+                    raw_recognizer_results=recognizer_results,
+                    other_raw_recognizer_results=other_recognizer_results,
+                    nlp_artifacts=nlp_artifacts,
+                    context=context,
+                )
 
             results.extend(recognizer_results)
 
@@ -327,6 +810,14 @@ class AnalyzerEngine:
 
         return results
 
+    @staticmethod
+    def _implements_enhance_using_context(recognizer: EntityRecognizer) -> bool:
+        # the default implementation returns the results as is
+        enhance_using_context = getattr(
+            recognizer.enhance_using_context, "__func__", None
+        )
+        return enhance_using_context is not EntityRecognizer.enhance_using_context
+
     def __remove_low_scores(
         self, results: List[RecognizerResult], score_threshold: float = None
     ) -> List[RecognizerResult]:
@@ -343,10 +834,44 @@ class AnalyzerEngine:
         new_results = [result for result in results if result.score >= score_threshold]
         return new_results
 
+    def _get_allow_list(
+        self, allow_list: Union[List[str], AllowList], allow_list_match: str
+    ) -> AllowList:
+        """
+        Return the AllowList of an allow list, reusing the one of previous calls.
+
+        Allow lists passed as lists are prepared once, and reused while
+        the same, unchanged, list is passed. The cache holds the lists,
+        so that their id isn't reused by other lists.
+
+        :param allow_list: list of allowed terms, or an AllowList
+        :param allow_list_match: How the allow_list
+        should be interpreted; either as "exact" or as "regex"
+        """
+        if isinstance(allow_list, AllowList):
+            return allow_list
+
+        key = (id(allow_list), len(allow_list), allow_list_match)
+        cached = self._allow_lists.get(key)
+        # the words are compared too, as lists can be changed between calls
+        if cached and cached[0] is allow_list and cached[1].allow_list == allow_list:
+            return cached[1]
+
+        prepared = AllowList(allow_list, allow_list_match)
+        if len(self._allow_lists) >= self.MAX_CACHED_ALLOW_LISTS:
+            # evict the oldest allow list. The engine may be shared by threads,
+            # which may evict it first or change the dict while it is iterated
+            try:
+                self._allow_lists.pop(next(iter(self._allow_lists), None), None)
+            except RuntimeError:
+                pass
+        self._allow_lists[key] = (allow_list, prepared)
+        return prepared
+
     @staticmethod
     def _remove_allow_list(
         results: List[RecognizerResult],
-        allow_list: List[str],
+        allow_list: Union[List[str], AllowList],
         text: str,
         regex_flags: Optional[int],
         allow_list_match: str,
@@ -355,35 +880,19 @@ class AnalyzerEngine:
         Remove results which are part of the allow list.
 
         :param results: List of RecognizerResult
-        :param allow_list: list of allowed terms
+        :param allow_list: list of allowed terms, or an AllowList
         :param text: the text to analyze
         :param regex_flags: regex flags to be used for when allow_list_match is "regex"
         :param allow_list_match: How the allow_list
-        should be interpreted; either as "exact" or as "regex"
+        should be interpreted; either as "exact" or as "regex".
+        Ignored if allow_list is an AllowList.
         :return: List[RecognizerResult]
         """
-        new_results = []
-        if allow_list_match == "regex":
-            pattern = "|".join(allow_list)
-            re_compiled = re.compile(pattern, flags=regex_flags)
+        if not isinstance(allow_list, AllowList):
+            allow_list = AllowList(allow_list, allow_list_match)
 
-            for result in results:
-                word = text[result.start : result.end]
-
-                # if the word is not specified to be allowed, keep in the PII entities
-                if not re_compiled.search(word):
-                    new_results.append(result)
-        elif allow_list_match == "exact":
-            for result in results:
-                word = text[result.start : result.end]
-
-                # if the word is not specified to be allowed, keep in the PII entities
-                if word not in allow_list:
-                    new_results.append(result)
-        else:
-            raise ValueError(
-                "allow_list_match must either be set to 'exact' or 'regex'."
-            )
+        # if the word is not specified to be allowed, keep in the PII entities
+        new_results = allow_list.remove_allowed(results, text, regex_flags)
 
         return new_results
 
@@ -401,8 +910,21 @@ class AnalyzerEngine:
         :param recognizer: Entity recognizer
         """
         for result in results:
+            if (
+                result.get_recognition_metadata_value(
+                    RecognizerResult.RECOGNIZER_IDENTIFIER_KEY
+                )
+                is not None
+                and result.get_recognition_metadata_value(
+                    RecognizerResult.RECOGNIZER_NAME_KEY
+                )
+                is not None
+            ):
+                continue
             if not result.recognition_metadata:
-                result.recognition_metadata = dict()
+                # shared by the results of the recognizer
+                result.recognition_metadata = recognizer.get_recognition_metadata()
+                continue
             if (
                 RecognizerResult.RECOGNIZER_IDENTIFIER_KEY
                 not in result.recognition_metadata
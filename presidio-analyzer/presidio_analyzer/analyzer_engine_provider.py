@@ -21,6 +21,10 @@ class AnalyzerEngineProvider:
     :param nlp_engine_conf_file: the path to the nlp engine configuration file
     :param recognizer_registry_conf_file: the path to the recognizer
     registry configuration file
+    :param recognizer_registry_snapshot_file: the path to a recognizer registry
+    snapshot, loaded instead of creating the registry from the configuration
+    when it matches the configuration, and (re)built otherwise.
+    See RecognizerRegistrySnapshot
     """
 
     def __init__(
@@ -28,10 +32,12 @@ class AnalyzerEngineProvider:
         analyzer_engine_conf_file: Optional[Union[Path, str]] = None,
         nlp_engine_conf_file: Optional[Union[Path, str]] = None,
         recognizer_registry_conf_file: Optional[Union[Path, str]] = None,
+        recognizer_registry_snapshot_file: Optional[Union[Path, str]] = None,
     ):
         self.configuration = self.get_configuration(conf_file=analyzer_engine_conf_file)
         self.nlp_engine_conf_file = nlp_engine_conf_file
         self.recognizer_registry_conf_file = recognizer_registry_conf_file
+        self.recognizer_registry_snapshot_file = recognizer_registry_snapshot_file
 
     def get_configuration(
         self, conf_file: Optional[Union[Path, str]]
@@ -100,7 +106,9 @@ class AnalyzerEngineProvider:
                 f"configuration from {self.recognizer_registry_conf_file}"
             )
             provider = RecognizerRegistryProvider(
-                conf_file=self.recognizer_registry_conf_file, nlp_engine=nlp_engine
+                conf_file=self.recognizer_registry_conf_file,
+                nlp_engine=nlp_engine,
+                snapshot_file=self.recognizer_registry_snapshot_file,
             )
         elif "recognizer_registry" in self.configuration:
             registry_configuration = self.configuration["recognizer_registry"]
@@ -110,6 +118,7 @@ class AnalyzerEngineProvider:
                     "supported_languages": supported_languages,
                 },
                 nlp_engine=nlp_engine,
+                snapshot_file=self.recognizer_registry_snapshot_file,
             )
         else:
             logger.warning(
@@ -123,6 +132,7 @@ class AnalyzerEngineProvider:
                     "supported_languages": supported_languages,
                 },
                 nlp_engine=nlp_engine,
+                snapshot_file=self.recognizer_registry_snapshot_file,
             )
         registry = provider.create_recognizer_registry()
 
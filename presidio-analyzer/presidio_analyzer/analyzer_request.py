@@ -1,7 +1,8 @@
 import re
-from typing import Dict
+from typing import Dict, Optional
 
 from presidio_analyzer import PatternRecognizer
+from presidio_analyzer.ad_hoc_recognizer_cache import AdHocRecognizerCache
 
 
 class AnalyzerRequest:
@@ -19,23 +20,36 @@ class AnalyzerRequest:
         be logged
         return_decision_process: Should the decision points within the analysis
         returned as part of the response
+    :param ad_hoc_recognizer_cache: Cache to get the ad hoc recognizers from,
+    reusing the recognizers (and their compiled patterns) of previous requests
+    with the same definitions. If None, new recognizers are created.
     """
 
-    def __init__(self, req_data: Dict):
+    def __init__(
+        self,
+        req_data: Dict,
+        ad_hoc_recognizer_cache: Optional[AdHocRecognizerCache] = None,
+    ):
         self.text = req_data.get("text")
         self.language = req_data.get("language")
         self.entities = req_data.get("entities")
         self.correlation_id = req_data.get("correlation_id")
         self.score_threshold = req_data.get("score_threshold")
         self.return_decision_process = req_data.get("return_decision_process")
+        self.regex_flags = req_data.get("regex_flags",
+                                        re.DOTALL | re.MULTILINE | re.IGNORECASE)
         ad_hoc_recognizers = req_data.get("ad_hoc_recognizers")
         self.ad_hoc_recognizers = []
         if ad_hoc_recognizers:
-            self.ad_hoc_recognizers = [
-                PatternRecognizer.from_dict(rec) for rec in ad_hoc_recognizers
-            ]
+            if ad_hoc_recognizer_cache is not None:
+                self.ad_hoc_recognizers = [
+                    ad_hoc_recognizer_cache.get_recognizer(rec, self.regex_flags)
+                    for rec in ad_hoc_recognizers
+                ]
+            else:
+                self.ad_hoc_recognizers = [
+                    PatternRecognizer.from_dict(rec) for rec in ad_hoc_recognizers
+                ]
         self.context = req_data.get("context")
         self.allow_list = req_data.get("allow_list")
         self.allow_list_match = req_data.get("allow_list_match", "exact")
-        self.regex_flags = req_data.get("regex_flags",
-                                        re.DOTALL | re.MULTILINE | re.IGNORECASE)
@@ -1,7 +1,15 @@
 import logging
+import multiprocessing
+from itertools import islice
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from presidio_analyzer import AnalyzerEngine, DictAnalyzerResult, RecognizerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    ColumnarRecognizerResults,
+    DictAnalyzerResult,
+    EntityRecognizer,
+    RecognizerResult,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -16,19 +24,48 @@ class BatchAnalyzerEngine:
 
     :param analyzer_engine: AnalyzerEngine instance to use
     for handling the values in those collections.
+    :param recognizer_batch_size: Number of texts passed at once to the
+    recognizers implementing `EntityRecognizer.analyze_batch`
+    (e.g. model based recognizers)
+    :param length_bucketing: Whether to group texts of similar length
+    in the batches of these recognizers, to reduce padding in model inference
+    :param mp_context: Start method of the worker processes when n_workers > 1
+    ("fork", "spawn" or "forkserver"), or None for the platform's default.
+    Forked workers share the loaded models of this process (copy on write),
+    but forking is unsafe on macOS once native libraries using threads
+    (e.g. torch) are loaded. Other workers unpickle a copy of the engine
     """
 
-    def __init__(self, analyzer_engine: Optional[AnalyzerEngine] = None):
+    # Number of texts sent to a worker process at once, when n_workers > 1
+    WORKER_SHARD_SIZE = 512
+
+    # Number of consecutive texts among which batches are bucketed by length
+    BUCKETING_WINDOW = 1024
+
+    def __init__(
+        self,
+        analyzer_engine: Optional[AnalyzerEngine] = None,
+        recognizer_batch_size: int = 32,
+        length_bucketing: bool = True,
+        mp_context: Optional[str] = None,
+    ):
         self.analyzer_engine = analyzer_engine
         if not analyzer_engine:
             self.analyzer_engine = AnalyzerEngine()
 
+        if recognizer_batch_size < 1:
+            raise ValueError("recognizer_batch_size must be at least 1")
+        self.recognizer_batch_size = recognizer_batch_size
+        self.length_bucketing = length_bucketing
+        self.mp_context = mp_context
+
     def analyze_iterator(
         self,
         texts: Iterable[Union[str, bool, float, int]],
         language: str,
         batch_size: int = 1,
         n_process: int = 1,
+        n_workers: int = 1,
         **kwargs,
     ) -> List[List[RecognizerResult]]:
         """
@@ -38,32 +75,214 @@ class BatchAnalyzerEngine:
         :param language: Input language
         :param batch_size: Batch size to process in a single iteration
         :param n_process: Number of processors to use. Defaults to `1`
+        :param n_workers: Number of worker processes running the full analysis
+        (NLP pipeline, recognizers, context enhancement) on shards of the texts,
+        in which case n_process is ignored.
+        Each worker holds its own copy of the AnalyzerEngine, see `mp_context`.
+        Defaults to `1` (analysis in this process).
         :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
         (default value depends on the nlp engine implementation)
         """
+        return list(
+            self._iter_results(
+                texts,
+                language=language,
+                batch_size=batch_size,
+                n_process=n_process,
+                n_workers=n_workers,
+                **kwargs,
+            )
+        )
+
+    def analyze_iterator_columnar(
+        self,
+        texts: Iterable[Union[str, bool, float, int]],
+        language: str,
+        batch_size: int = 1,
+        n_process: int = 1,
+        n_workers: int = 1,
+        **kwargs,
+    ) -> ColumnarRecognizerResults:
+        """
+        Analyze an iterable of strings, returning the results as columns.
+
+        The results of each text are added to the columns once it is analyzed,
+        so memory grows with a few numbers per result instead of an object,
+        see `ColumnarRecognizerResults`.
+        Explanations and recognition metadata of the results are not kept.
+
+        :param texts: An iterable containing strings to be analyzed.
+        :param language: Input language
+        :param batch_size: Batch size to process in a single iteration
+        :param n_process: Number of processors to use. Defaults to `1`
+        :param n_workers: Number of worker processes, see `analyze_iterator`
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        """
+        return ColumnarRecognizerResults.from_results(
+            self._iter_results(
+                texts,
+                language=language,
+                batch_size=batch_size,
+                n_process=n_process,
+                n_workers=n_workers,
+                **kwargs,
+            )
+        )
+
+    def _iter_results(
+        self,
+        texts: Iterable[Union[str, bool, float, int]],
+        language: str,
+        batch_size: int,
+        n_process: int,
+        n_workers: int,
+        **kwargs,
+    ) -> Iterator[List[RecognizerResult]]:
+        """Yield the results of each text, in the order of the texts."""
 
         # validate types
         texts = self._validate_types(texts)
 
-        # Process the texts as batch for improved performance
-        nlp_artifacts_batch: Iterator[Tuple[str, NlpArtifacts]] = (
-            self.analyzer_engine.nlp_engine.process_batch(
-                texts=texts,
+        if n_workers > 1:
+            yield from self._analyze_in_workers(
+                texts,
                 language=language,
                 batch_size=batch_size,
-                n_process=n_process,
+                n_workers=n_workers,
+                **kwargs,
             )
+            return
+
+        # Process the texts as batch for improved performance,
+        # running only the parts of the NLP pipeline the recognizers need,
+        # or none if they don't use the NLP artifacts
+        recognizers = self.analyzer_engine.registry.get_recognizers(
+            language=language,
+            entities=kwargs.get("entities"),
+            all_fields=not kwargs.get("entities"),
+            ad_hoc_recognizers=kwargs.get("ad_hoc_recognizers"),
         )
+        nlp_engine = self.analyzer_engine.nlp_engine
+        capabilities = self.analyzer_engine.get_nlp_capabilities(recognizers)
+        if capabilities is None or capabilities:
+            if capabilities is not None and nlp_engine.supports_capabilities:
+                nlp_kwargs = {"capabilities": capabilities}
+            else:
+                nlp_kwargs = {}
+            nlp_artifacts_batch: Iterator[Tuple[str, Optional[NlpArtifacts]]] = (
+                nlp_engine.process_batch(
+                    texts=texts,
+                    language=language,
+                    batch_size=batch_size,
+                    n_process=n_process,
+                    **nlp_kwargs,
+                )
+            )
+        else:
+            nlp_artifacts_batch = ((text, None) for text in texts)
+
+        # Recognizers implementing analyze_batch (e.g. models, remote services)
+        # analyze windows of texts in batches, instead of one text at a time
+        batch_recognizers = [
+            rec for rec in recognizers if self._implements_analyze_batch(rec)
+        ]
+        window_size = self.BUCKETING_WINDOW if batch_recognizers else 1
+        windows = iter(lambda: list(islice(nlp_artifacts_batch, window_size)), [])
 
-        list_results = []
-        for text, nlp_artifacts in nlp_artifacts_batch:
-            results = self.analyzer_engine.analyze(
-                text=str(text), nlp_artifacts=nlp_artifacts, language=language, **kwargs
+        for window in windows:
+            batch_results = self._analyze_window_in_batches(
+                window, batch_recognizers, language, kwargs.get("entities")
             )
+            for index, (text, nlp_artifacts) in enumerate(window):
+                if batch_results:
+                    kwargs["recognizer_results"] = {
+                        rec_id: results[index]
+                        for rec_id, results in batch_results.items()
+                    }
+                results = self.analyzer_engine.analyze(
+                    text=str(text),
+                    nlp_artifacts=nlp_artifacts,
+                    language=language,
+                    **kwargs,
+                )
 
-            list_results.append(results)
+                yield results
 
-        return list_results
+    @staticmethod
+    def _implements_analyze_batch(recognizer: EntityRecognizer) -> bool:
+        return type(recognizer).analyze_batch is not EntityRecognizer.analyze_batch
+
+    def _analyze_window_in_batches(
+        self,
+        window: List[Tuple[str, Optional[NlpArtifacts]]],
+        recognizers: List[EntityRecognizer],
+        language: str,
+        entities: Optional[List[str]],
+    ) -> Dict[str, List[List[RecognizerResult]]]:
+        """Run the recognizers' analyze_batch over batches of the window's texts.
+
+        :param window: The texts and their NlpArtifacts
+        :param recognizers: The recognizers implementing analyze_batch
+        :param language: Input language
+        :param entities: The requested entities, None for all
+        :return: The results per recognizer id, per text in the window order
+        """
+        if not recognizers:
+            return {}
+
+        if not entities:
+            entities = self.analyzer_engine.get_supported_entities(language=language)
+
+        texts = [str(text) for text, _ in window]
+        order = list(range(len(texts)))
+        if self.length_bucketing:
+            order.sort(key=lambda index: len(texts[index]))
+        batches = [
+            order[start : start + self.recognizer_batch_size]
+            for start in range(0, len(order), self.recognizer_batch_size)
+        ]
+
+        results = {}
+        for recognizer in recognizers:
+            AnalyzerEngine._load_recognizer(recognizer)
+            recognizer_results = [None] * len(texts)
+            for batch in batches:
+                batch_results = recognizer.analyze_batch(
+                    [texts[index] for index in batch],
+                    entities=entities,
+                    nlp_artifacts_list=[window[index][1] for index in batch],
+                )
+                for index, text_results in zip(batch, batch_results):
+                    recognizer_results[index] = text_results
+            results[recognizer.id] = recognizer_results
+
+        return results
+
+    def _analyze_in_workers(
+        self,
+        texts: Iterable[Union[str, bool, float, int]],
+        language: str,
+        batch_size: int,
+        n_workers: int,
+        **kwargs,
+    ) -> Iterator[List[RecognizerResult]]:
+        """Analyze shards of the texts in a pool of worker processes.
+
+        The results are returned in the order of the texts.
+        Workers run the NLP pipeline in a single process each.
+        """
+        # unless forked, the engine is pickled once per worker
+        mp_context = multiprocessing.get_context(self.mp_context)
+
+        texts = iter(texts)
+        shards = iter(lambda: list(islice(texts, self.WORKER_SHARD_SIZE)), [])
+        tasks = ((shard, language, batch_size, kwargs) for shard in shards)
+
+        with mp_context.Pool(
+            n_workers, initializer=_init_worker, initargs=(self,)
+        ) as pool:
+            for shard_results in pool.imap(_analyze_shard, tasks):
+                yield from shard_results
 
     def analyze_dict(
         self,
@@ -72,6 +291,7 @@ class BatchAnalyzerEngine:
         keys_to_skip: Optional[List[str]] = None,
         batch_size: int = 1,
         n_process: int = 1,
+        n_workers: int = 1,
         **kwargs,
     ) -> Iterator[DictAnalyzerResult]:
         """
@@ -84,6 +304,8 @@ class BatchAnalyzerEngine:
         :param keys_to_skip: Keys to ignore during analysis
         :param batch_size: Batch size to process in a single iteration
         :param n_process: Number of processors to use. Defaults to `1`
+        :param n_workers: Number of worker processes analyzing iterable values,
+        see `analyze_iterator`. Defaults to `1`
 
         :param kwargs: Additional keyword arguments
         for the `AnalyzerEngine.analyze` method.
@@ -120,6 +342,7 @@ class BatchAnalyzerEngine:
                     language=language,
                     context=specific_context,
                     keys_to_skip=new_keys_to_skip,
+                    n_workers=n_workers,
                     **kwargs,
                 )
             elif isinstance(value, Iterable):
@@ -130,6 +353,7 @@ class BatchAnalyzerEngine:
                     language=language,
                     context=specific_context,
                     n_process=n_process,
+                    n_workers=n_workers,
                     batch_size=batch_size,
                     **kwargs,
                 )
@@ -157,3 +381,21 @@ class BatchAnalyzerEngine:
             k.replace(f"{key}.", "") for k in keys_to_skip if k.startswith(key)
         ]
         return new_keys_to_skip
+
+
+# The BatchAnalyzerEngine of a worker process, set once when the worker starts
+_worker_batch_analyzer: Optional[BatchAnalyzerEngine] = None
+
+
+def _init_worker(batch_analyzer: BatchAnalyzerEngine) -> None:
+    global _worker_batch_analyzer
+    _worker_batch_analyzer = batch_analyzer
+
+
+def _analyze_shard(
+    task: Tuple[List[Any], str, int, Dict[str, Any]],
+) -> List[List[RecognizerResult]]:
+    texts, language, batch_size, kwargs = task
+    return _worker_batch_analyzer.analyze_iterator(
+        texts, language=language, batch_size=batch_size, **kwargs
+    )
@@ -0,0 +1,190 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from presidio_analyzer import RecognizerResult
+
+
+class ColumnarRecognizerResults:
+    """
+    The results of analyzing a batch of texts, as parallel arrays (columns).
+
+    Row i of the columns is one detected entity of the text `doc_index[i]`.
+    Rows are ordered by text, so that the results of a text are contiguous.
+    Holding a million results takes a few arrays instead of a million objects,
+    and the results can be filtered with NumPy operations on the columns
+    (e.g. `results.filter(results.score >= 0.5)`).
+
+    Only the entity type, span and score of the results are kept
+    (no analysis explanation or recognition metadata).
+
+    :param doc_index: The index of the text of each result, in increasing order
+    :param start: The start of each result in its text
+    :param end: The end of each result in its text
+    :param entity_type: The code of the entity type of each result,
+    its index in `entity_types`
+    :param score: The score of each result
+    :param entity_types: The entity types, by code
+    :param n_docs: The number of texts in the batch,
+    including the texts without results
+    """
+
+    def __init__(
+        self,
+        doc_index: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray,
+        entity_type: np.ndarray,
+        score: np.ndarray,
+        entity_types: Sequence[str],
+        n_docs: int,
+    ):
+        self.doc_index = np.asarray(doc_index, dtype=np.int64)
+        self.start = np.asarray(start, dtype=np.int64)
+        self.end = np.asarray(end, dtype=np.int64)
+        self.entity_type = np.asarray(entity_type, dtype=np.int32)
+        self.score = np.asarray(score, dtype=np.float64)
+        self.entity_types = list(entity_types)
+        self.n_docs = n_docs
+
+        lengths = {
+            len(column)
+            for column in (
+                self.doc_index,
+                self.start,
+                self.end,
+                self.entity_type,
+                self.score,
+            )
+        }
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+
+    @classmethod
+    def from_results(
+        cls, results_list: Iterable[List[RecognizerResult]]
+    ) -> "ColumnarRecognizerResults":
+        """
+        Create columnar results from lists of results, one list per text.
+
+        The lists are consumed one at a time, so that they can be produced
+        lazily (e.g. by a generator) without being held together in memory.
+
+        :param results_list: The results of each text in the batch
+        """
+        doc_index = array("q")
+        start = array("q")
+        end = array("q")
+        entity_type = array("i")
+        score = array("d")
+        entity_type_codes: Dict[str, int] = {}
+
+        n_docs = 0
+        for index, results in enumerate(results_list):
+            n_docs = index + 1
+            for result in results:
+                code = entity_type_codes.setdefault(
+                    result.entity_type, len(entity_type_codes)
+                )
+                doc_index.append(index)
+                start.append(result.start)
+                end.append(result.end)
+                entity_type.append(code)
+                score.append(result.score)
+
+        return cls(
+            doc_index=np.frombuffer(doc_index, dtype=np.int64),
+            start=np.frombuffer(start, dtype=np.int64),
+            end=np.frombuffer(end, dtype=np.int64),
+            entity_type=np.frombuffer(entity_type, dtype=np.int32),
+            score=np.frombuffer(score, dtype=np.float64),
+            entity_types=list(entity_type_codes),
+            n_docs=n_docs,
+        )
+
+    def to_results(self) -> List[List[RecognizerResult]]:
+        """Return the results as lists of RecognizerResult, one list per text."""
+        return [self.get_document_results(index) for index in range(self.n_docs)]
+
+    def get_document_results(self, doc_index: int) -> List[RecognizerResult]:
+        """
+        Return the results of one text as RecognizerResult objects.
+
+        :param doc_index: The index of the text in the batch
+        """
+        begin, stop = self.get_document_bounds(doc_index)
+        return [
+            RecognizerResult(
+                entity_type=self.entity_types[code],
+                start=start,
+                end=end,
+                score=score,
+            )
+            for code, start, end, score in zip(
+                self.entity_type[begin:stop].tolist(),
+                self.start[begin:stop].tolist(),
+                self.end[begin:stop].tolist(),
+                self.score[begin:stop].tolist(),
+            )
+        ]
+
+    def get_document_bounds(self, doc_index: int) -> Tuple[int, int]:
+        """
+        Return the rows (begin, stop) holding the results of a text.
+
+        :param doc_index: The index of the text in the batch
+        """
+        begin, stop = np.searchsorted(self.doc_index, [doc_index, doc_index + 1])
+        return int(begin), int(stop)
+
+    def filter(self, mask: np.ndarray) -> "ColumnarRecognizerResults":
+        """
+        Return the results selected by a boolean mask over the rows.
+
+        :param mask: Boolean array with one value per result,
+        e.g. `results.score >= 0.5`
+        """
+        return ColumnarRecognizerResults(
+            doc_index=self.doc_index[mask],
+            start=self.start[mask],
+            end=self.end[mask],
+            entity_type=self.entity_type[mask],
+            score=self.score[mask],
+            entity_types=self.entity_types,
+            n_docs=self.n_docs,
+        )
+
+    def filter_entities(
+        self,
+        entities: Optional[List[str]] = None,
+        score_threshold: Optional[float] = None,
+    ) -> "ColumnarRecognizerResults":
+        """
+        Return the results of the given entity types and above a score threshold.
+
+        :param entities: The entity types to keep, None for all
+        :param score_threshold: The minimum score to keep, None for all
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if entities is not None:
+            codes = [
+                code
+                for code, entity_type in enumerate(self.entity_types)
+                if entity_type in entities
+            ]
+            mask &= np.isin(self.entity_type, codes)
+        if score_threshold is not None:
+            mask &= self.score >= score_threshold
+        return self.filter(mask)
+
+    def __len__(self) -> int:
+        """Return the number of results (rows)."""
+        return len(self.doc_index)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the instance."""
+        return (
+            f"ColumnarRecognizerResults(results={len(self)}, n_docs={self.n_docs}, "
+            f"entity_types={self.entity_types})"
+        )
@@ -1,6 +1,6 @@
 import logging
 from abc import abstractmethod
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 from presidio_analyzer import EntityRecognizer, RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
@@ -25,6 +25,10 @@ class ContextAwareEnhancer:
     MIN_SCORE = 0
     MAX_SCORE = 1.0
 
+    # The NlpArtifacts attributes used by `enhance_using_context`,
+    # or None if it may use all of them. See `EntityRecognizer.nlp_capabilities`
+    nlp_capabilities: Optional[FrozenSet[str]] = None
+
     def __init__(
         self,
         context_similarity_factor: float,
@@ -1,8 +1,11 @@
 import copy
 import logging
-from typing import List, Optional
+import re
+from bisect import bisect_left, bisect_right
+from functools import partial
+from typing import Dict, List, Optional, Pattern
 
-from presidio_analyzer import EntityRecognizer, RecognizerResult
+from presidio_analyzer import AnalysisExplanation, EntityRecognizer, RecognizerResult
 from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
@@ -25,6 +28,8 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
     :param context_suffix_count: how many words after the entity to match context
     """
 
+    nlp_capabilities = frozenset({"tokens", "lemmas"})
+
     def __init__(
         self,
         context_similarity_factor: float = 0.35,
@@ -64,10 +69,12 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
                               accuracy of the context enhancement process
         :param recognizers: the list of recognizers
         :param context: list of context words
+        :return: The results, in which those enhanced are replaced by copies
+        (raw_results are not modified)
         """  # noqa D205 D400
 
-        # create a deep copy of the results object, so we can manipulate it
-        results = copy.deepcopy(raw_results)
+        # copy the list only, enhanced results are copied when their score changes
+        results = list(raw_results)
 
         # create recognizer context dictionary
         recognizers_dict = {recognizer.id: recognizer for recognizer in recognizers}
@@ -83,19 +90,17 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
             logger.warning("NLP artifacts were not provided")
             return results
 
-        for result in results:
-            recognizer = None
+        # index the tokens and keywords of the text once for all the results
+        context_index = _DocumentContextIndex.from_nlp_artifacts(nlp_artifacts)
+        context_matchers: Dict[str, Pattern] = {}
+
+        for index, result in enumerate(results):
             # get recognizer matching the result, if found.
-            if (
-                result.recognition_metadata
-                and RecognizerResult.RECOGNIZER_IDENTIFIER_KEY
-                in result.recognition_metadata.keys()
-            ):
-                recognizer = recognizers_dict.get(
-                    result.recognition_metadata[
-                        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY
-                    ]
+            recognizer = recognizers_dict.get(
+                result.get_recognition_metadata_value(
+                    RecognizerResult.RECOGNIZER_IDENTIFIER_KEY
                 )
+            )
 
             if not recognizer:
                 logger.debug(
@@ -114,7 +119,7 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
                 continue
 
             # skip context enhancement if already boosted by recognizer level
-            if result.recognition_metadata.get(
+            if result.get_recognition_metadata_value(
                 RecognizerResult.IS_SCORE_ENHANCED_BY_CONTEXT_KEY
             ):
                 logger.debug("result score already boosted, skipping")
@@ -124,28 +129,70 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
             word = text[result.start : result.end]
 
             surrounding_words = self._extract_surrounding_words(
-                nlp_artifacts=nlp_artifacts, word=word, start=result.start
+                nlp_artifacts=nlp_artifacts,
+                word=word,
+                start=result.start,
+                context_index=context_index,
             )
 
             # combine other sources of context with surrounding words
             surrounding_words.extend(context)
 
+            # most results have no supportive context word: rule them out
+            # with a single search of the recognizer's context words
+            if recognizer.id not in context_matchers:
+                context_matchers[recognizer.id] = self._compile_context_matcher(
+                    recognizer.context
+                )
+            if not context_matchers[recognizer.id].search("\0".join(surrounding_words)):
+                continue
+
             supportive_context_word = self._find_supportive_word_in_context(
                 surrounding_words, recognizer.context
             )
             if supportive_context_word != "":
-                result.score += self.context_similarity_factor
-                result.score = max(result.score, self.min_score_with_context_similarity)
-                result.score = min(result.score, ContextAwareEnhancer.MAX_SCORE)
+                # the copy leaves the explanation of the result pending
+                enhanced_result = copy.copy(result)
+                results[index] = enhanced_result
+
+                enhanced_result.score += self.context_similarity_factor
+                enhanced_result.score = max(
+                    enhanced_result.score, self.min_score_with_context_similarity
+                )
+                enhanced_result.score = min(
+                    enhanced_result.score, ContextAwareEnhancer.MAX_SCORE
+                )
 
                 # Update the explainability object with context information
-                # helped to improve the score
-                result.analysis_explanation.set_supportive_context_word(
-                    supportive_context_word
+                # helped to improve the score, when it is built
+                enhanced_result.analysis_explanation = partial(
+                    self._build_enhanced_explanation,
+                    result,
+                    supportive_context_word,
+                    enhanced_result.score,
                 )
-                result.analysis_explanation.set_improved_score(result.score)
         return results
 
+    @staticmethod
+    def _build_enhanced_explanation(
+        result: RecognizerResult, supportive_context_word: str, score: float
+    ) -> AnalysisExplanation:
+        """Copy the explanation of a result, with the context which enhanced it.
+
+        :param result: The result before enhancement
+        :param supportive_context_word: The context word which enhanced the score
+        :param score: The enhanced score
+        """
+        explanation = copy.copy(result.analysis_explanation)
+        explanation.set_supportive_context_word(supportive_context_word)
+        explanation.set_improved_score(score)
+        return explanation
+
+    @staticmethod
+    def _compile_context_matcher(recognizer_context_list: List[str]) -> Pattern:
+        """Compile a regex matching any of the context words of a recognizer."""
+        return re.compile("|".join(map(re.escape, recognizer_context_list)))
+
     @staticmethod
     def _find_supportive_word_in_context(
         context_list: List[str], recognizer_context_list: List[str]
@@ -186,7 +233,11 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
         return word
 
     def _extract_surrounding_words(
-        self, nlp_artifacts: NlpArtifacts, word: str, start: int
+        self,
+        nlp_artifacts: NlpArtifacts,
+        word: str,
+        start: int,
+        context_index: Optional["_DocumentContextIndex"] = None,
     ) -> List[str]:
         """Extract words surrounding another given word.
 
@@ -198,6 +249,8 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
                               execution on a given text
         :param word: The word to look for context around
         :param start: The start index of the word in the original text
+        :param context_index: The index of the nlp artifacts,
+                              built if not given
         """
         if not nlp_artifacts.tokens:
             logger.info("Skipping context extraction due to lack of NLP artifacts")
@@ -206,36 +259,19 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
             # context
             return [""]
 
-        # Get the already prepared words in the given text, in their
-        # LEMMATIZED version
-        lemmatized_keywords = nlp_artifacts.keywords
+        if context_index is None:
+            context_index = _DocumentContextIndex.from_nlp_artifacts(nlp_artifacts)
 
         # since the list of tokens is not necessarily aligned
         # with the actual index of the match, we look for the
         # token index which corresponds to the match
-        token_index = self._find_index_of_match_token(
-            word, start, nlp_artifacts.tokens, nlp_artifacts.tokens_indices
-        )
+        token_index = context_index.find_token_index(word, start)
 
         # index i belongs to the PII entity, take the preceding n words
         # and the successing m words into a context list
-
-        backward_context = self._add_n_words_backward(
-            token_index,
-            self.context_prefix_count,
-            nlp_artifacts.lemmas,
-            lemmatized_keywords,
+        context_list = context_index.get_surrounding_keywords(
+            token_index, self.context_prefix_count, self.context_suffix_count
         )
-        forward_context = self._add_n_words_forward(
-            token_index,
-            self.context_suffix_count,
-            nlp_artifacts.lemmas,
-            lemmatized_keywords,
-        )
-
-        context_list = []
-        context_list.extend(backward_context)
-        context_list.extend(forward_context)
         context_list = list(set(context_list))
         logger.debug("Context list is: %s", " ".join(context_list))
         return context_list
@@ -247,32 +283,9 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
         tokens,
         tokens_indices: List[int],  # noqa ANN001
     ) -> int:
-        found = False
-        # we use the known start index of the original word to find the actual
-        # token at that index, we are not checking for equivalence since the
-        # token might be just a substring of that word (e.g. for phone number
-        # 555-124564 the first token might be just '555' or for a match like '
-        # rocket' the actual token will just be 'rocket' hence the misalignment
-        # of indices)
-        # Note: we are iterating over the original tokens (not the lemmatized)
-        i = -1
-        for i, token in enumerate(tokens, 0):
-            # Either we found a token with the exact location, or
-            # we take a token which its characters indices covers
-            # the index we are looking for.
-            if (tokens_indices[i] == start) or (start < tokens_indices[i] + len(token)):
-                # found the interesting token, the one that around it
-                # we take n words, we save the matching lemma
-                found = True
-                break
-
-        if not found:
-            raise ValueError(
-                "Did not find word '" + word + "' "
-                "in the list of tokens although it "
-                "is expected to be found"
-            )
-        return i
+        return _DocumentContextIndex(tokens, tokens_indices).find_token_index(
+            word, start
+        )
 
     @staticmethod
     def _add_n_words(
@@ -334,3 +347,101 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
         return self._add_n_words(
             index, n_words, lemmas, lemmatized_filtered_keywords, True
         )
+
+
+class _DocumentContextIndex:
+    """Index of the tokens and keywords of a text, to find the context of matches.
+
+    Built once per text, after which the token of a match is found with bisect
+    over the token offsets, and the keywords around it with bisect over
+    the positions of the lemmas which are keywords.
+
+    :param tokens: The tokens of the text
+    :param tokens_indices: The start index of each token in the text
+    :param lemmas: The lemma of each token
+    :param keywords: The lower case lemmas which may be context words
+    """
+
+    def __init__(
+        self,
+        tokens,  # noqa ANN001
+        tokens_indices: List[int],
+        lemmas: Optional[List[str]] = None,
+        keywords: Optional[List[str]] = None,
+    ):
+        self.tokens_indices = list(tokens_indices)
+        self.tokens_ends = [
+            token_index + len(token)
+            for token_index, token in zip(tokens_indices, tokens)
+        ]
+
+        keywords = set(keywords) if keywords else set()
+        self.lower_lemmas = [lemma.lower() for lemma in lemmas] if lemmas else []
+        self.keyword_positions = [
+            position
+            for position, lower_lemma in enumerate(self.lower_lemmas)
+            if lower_lemma in keywords
+        ]
+
+    @classmethod
+    def from_nlp_artifacts(cls, nlp_artifacts: NlpArtifacts) -> "_DocumentContextIndex":
+        """Index the tokens and keywords of NlpArtifacts."""
+        return cls(
+            tokens=nlp_artifacts.tokens,
+            tokens_indices=nlp_artifacts.tokens_indices,
+            lemmas=nlp_artifacts.lemmas,
+            keywords=nlp_artifacts.keywords,
+        )
+
+    def find_token_index(self, word: str, start: int) -> int:
+        """Find the first token starting at, or ending after, a character index.
+
+        We are not checking for equivalence with the matched word since the
+        token might be just a substring of that word (e.g. for phone number
+        555-124564 the first token might be just '555' or for a match like
+        ' rocket' the actual token will just be 'rocket' hence the misalignment
+        of indices)
+
+        :param word: The matched word
+        :param start: The start index of the match in the text
+        :return: The token index
+        """
+        token_index = bisect_right(self.tokens_ends, start)
+        starting_token_index = bisect_left(self.tokens_indices, start)
+        if (
+            starting_token_index < token_index
+            and self.tokens_indices[starting_token_index] == start
+        ):
+            token_index = starting_token_index
+
+        if token_index == len(self.tokens_ends):
+            raise ValueError(
+                "Did not find word '" + word + "' "
+                "in the list of tokens although it "
+                "is expected to be found"
+            )
+        return token_index
+
+    def get_surrounding_keywords(
+        self, token_index: int, prefix_count: int, suffix_count: int
+    ) -> List[str]:
+        """
+        Return the lower case lemmas which are keywords around a token.
+
+        The token itself is no interest to us...however we want to
+        consider it anyway for cases were it is attached with no spaces
+        to an interesting context word, so we allow it and add 1 to
+        the number of collected words on each side.
+
+        :param token_index: The index of the token
+        :param prefix_count: The number of keywords to take before the token
+        :param suffix_count: The number of keywords to take after the token
+        """
+        backward_end = bisect_right(self.keyword_positions, token_index)
+        backward_start = max(0, backward_end - (prefix_count + 1))
+        forward_start = bisect_left(self.keyword_positions, token_index)
+        forward_end = forward_start + suffix_count + 1
+
+        positions = self.keyword_positions[backward_start:backward_end][::-1]
+        positions.extend(self.keyword_positions[forward_start:forward_end])
+        return [self.lower_lemmas[position] for position in positions]
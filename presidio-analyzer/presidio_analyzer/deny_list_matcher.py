@@ -0,0 +1,189 @@
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+import regex as re
+from regex import _regex
+
+
+class _CaseFoldTable(dict):
+    """Translation table mapping each character to a representative of its case.
+
+    Cases are taken from the `regex` module, so that characters have the same
+    representative iff they match each other with the IGNORECASE flag.
+    A few characters (e.g. the Turkish dotted and dotless I) match asymmetrically:
+    they share the representative of all the characters they're related to,
+    and matches of terms containing them need to be verified.
+    The table is filled lazily, so it can be used with `str.translate` on any text.
+    """
+
+    FLAGS = re.IGNORECASE | re.UNICODE
+
+    def __init__(self):
+        super().__init__()
+        self.asymmetric: Set[str] = set()
+
+    def __missing__(self, char_code: int) -> str:
+        cases = self.get_cases(char_code)
+        if all(self.get_cases(case) == cases for case in cases):
+            related = cases
+        else:
+            related = set(cases)
+            pending = list(cases)
+            while pending:
+                for case in self.get_cases(pending.pop()):
+                    if case not in related:
+                        related.add(case)
+                        pending.append(case)
+            self.asymmetric.update(map(chr, related))
+
+        folded = chr(min(related))
+        for case in related:
+            self[case] = folded
+        return folded
+
+    @classmethod
+    def get_cases(cls, char_code: int) -> FrozenSet[int]:
+        return frozenset(_regex.get_all_cases(cls.FLAGS, char_code))
+
+
+class DenyListMatcher:
+    """
+    Match the terms of a deny list in a text using a hash table of terms.
+
+    Equivalent to the regex created by `PatternRecognizer._deny_list_to_regex`:
+    a term is matched only if preceded by a non-word character (or the text start)
+    and followed by a non-word character (or the text end),
+    matches don't overlap, and when several terms match at the same position
+    the first one in the deny list is returned.
+
+    As a match has to start and end on word boundaries, only the spans between
+    boundaries up to the longest term's length are looked up in the table,
+    so matching time is linear in the text length,
+    regardless of the number of terms.
+
+    :param deny_list: The list of terms to match
+    """
+
+    _NON_WORD = re.compile(r"\W")
+
+    _CASE_FOLD = _CaseFoldTable()
+
+    # Flags which don't change the matching of the deny list regex
+    SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE | re.V0
+
+    def __init__(self, deny_list: List[str]):
+        self.deny_list = deny_list
+        # indexed terms per case sensitivity, created on first use
+        self._terms: Dict[bool, _IndexedTerms] = {}
+
+    @classmethod
+    def supports_flags(cls, flags: Optional[int]) -> bool:
+        """
+        Return True if the regex flags can be applied by this matcher.
+
+        :param flags: The regex flags the deny list would be matched with
+        """
+        return not (flags or 0) & ~cls.SUPPORTED_FLAGS
+
+    def finditer(
+        self, text: str, ignore_case: bool = True
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Find the deny list terms in the text.
+
+        :param text: The text to search in
+        :param ignore_case: Whether to match the terms case insensitively
+        :return: An iterator of (start, end) spans, ordered by start
+        """
+        terms = self.__get_terms(ignore_case)
+        if not terms.max_length:
+            return
+
+        key = text.translate(self._CASE_FOLD) if ignore_case else text
+
+        # a match starts at the text start or after a non-word character,
+        # and ends at the text end or before a non-word character
+        boundaries = [match.start() for match in self._NON_WORD.finditer(text)]
+        boundaries.append(len(text))
+
+        next_start = 0
+        start = 0
+        for boundary_index, boundary in enumerate(boundaries):
+            if start >= next_start:
+                best_index = best_end = None
+                end_index = boundary_index
+                end = boundary
+                while end - start <= terms.max_length:
+                    index = terms.find(key[start:end], text[start:end])
+                    if index is not None and (best_index is None or index < best_index):
+                        best_index, best_end = index, end
+                    end_index += 1
+                    if end_index == len(boundaries):
+                        break
+                    end = boundaries[end_index]
+
+                if best_end is not None:
+                    yield start, best_end
+                    next_start = best_end
+
+            start = boundary + 1
+
+    def __get_terms(self, ignore_case: bool) -> "_IndexedTerms":
+        terms = self._terms.get(ignore_case)
+        if terms is None:
+            terms = _IndexedTerms(
+                self.deny_list, self._CASE_FOLD if ignore_case else None
+            )
+            self._terms[ignore_case] = terms
+        return terms
+
+
+class _IndexedTerms:
+    """Deny list terms indexed by their (case folded) text.
+
+    :param deny_list: The list of terms to index
+    :param case_fold: The case folding table, or None to match case sensitively
+    """
+
+    def __init__(self, deny_list: List[str], case_fold: Optional[_CaseFoldTable]):
+        # index of the first term per key
+        self.exact: Dict[str, int] = {}
+        # terms containing asymmetric case characters per key, verified on lookup
+        self.verified: Dict[str, List[Tuple[int, str]]] = {}
+
+        for index, term in enumerate(deny_list):
+            if not term:
+                continue
+            if case_fold is None:
+                self.exact.setdefault(term, index)
+                continue
+
+            key = term.translate(case_fold)
+            if case_fold.asymmetric.isdisjoint(term):
+                self.exact.setdefault(key, index)
+            else:
+                self.verified.setdefault(key, []).append((index, term))
+
+        self.max_length = max(map(len, [*self.exact, *self.verified]), default=0)
+
+    def find(self, key: str, text: str) -> Optional[int]:
+        """Return the index of the first term matching the text, or None.
+
+        :param key: The text, translated with the case folding table
+        :param text: The original text
+        """
+        index = self.exact.get(key)
+        if self.verified:
+            for term_index, term in self.verified.get(key, ()):
+                if index is not None and term_index > index:
+                    break
+                if self.__matches(term, text):
+                    return term_index
+        return index
+
+    @staticmethod
+    def __matches(term: str, text: str) -> bool:
+        return all(
+            term_char == text_char
+            or ord(text_char) in _CaseFoldTable.get_cases(ord(term_char))
+            for term_char, text_char in zip(term, text)
+        )
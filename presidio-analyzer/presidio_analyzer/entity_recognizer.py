@@ -1,6 +1,8 @@
 import logging
 from abc import abstractmethod
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from presidio_analyzer import RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
@@ -32,6 +34,12 @@ class EntityRecognizer:
     MIN_SCORE = 0
     MAX_SCORE = 1.0
 
+    # The NlpArtifacts attributes used by the recognizer's `analyze`
+    # ("tokens", "lemmas" and/or "entities"), or None if it may use all of them.
+    # Only the parts of the NLP pipeline needed by the recognizers of a request run,
+    # and when none need any, `analyze` gets no NlpArtifacts.
+    nlp_capabilities: Optional[FrozenSet[str]] = None
+
     def __init__(
         self,
         supported_entities: List[str],
@@ -48,6 +56,7 @@ class EntityRecognizer:
             self.name = name
 
         self._id = f"{self.name}_{id(self)}"
+        self._recognition_metadata = None
 
         self.supported_language = supported_language
         self.version = version
@@ -64,6 +73,33 @@ class EntityRecognizer:
 
         return self._id
 
+    def get_recognition_metadata(self) -> Mapping[str, str]:
+        """
+        Return the recognition metadata of this recognizer's results.
+
+        The read-only mapping holds the recognizer name and id,
+        and is shared by the results instead of a dictionary per result
+        (see `RecognizerResult.recognition_metadata`).
+        """
+        metadata = getattr(self, "_recognition_metadata", None)
+        if metadata is None or metadata[RecognizerResult.RECOGNIZER_NAME_KEY] != (
+            self.name
+        ):
+            metadata = MappingProxyType(
+                {
+                    RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                    RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+                }
+            )
+            self._recognition_metadata = metadata
+        return metadata
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle or copy, without the cached metadata."""
+        state = self.__dict__.copy()
+        state["_recognition_metadata"] = None
+        return state
+
     @abstractmethod
     def load(self) -> None:
         """
@@ -87,6 +123,31 @@ class EntityRecognizer:
         """
         return None
 
+    def analyze_batch(
+        self,
+        texts: List[str],
+        entities: List[str],
+        nlp_artifacts_list: Optional[List[Optional[NlpArtifacts]]] = None,
+    ) -> List[List[RecognizerResult]]:
+        """
+        Analyze several texts at once.
+
+        Recognizers which benefit from batching (e.g. model inference)
+        can override this method, which `BatchAnalyzerEngine` then calls
+        with batches of texts. By default, `analyze` is called for each text.
+
+        :param texts: The texts to be analyzed
+        :param entities: The list of entities this recognizer is able to detect
+        :param nlp_artifacts_list: The NlpArtifacts of each text, if available
+        :return: List of results detected by this recognizer, per text
+        """
+        if nlp_artifacts_list is None:
+            nlp_artifacts_list = [None] * len(texts)
+        return [
+            self.analyze(text=text, entities=entities, nlp_artifacts=nlp_artifacts)
+            for text, nlp_artifacts in zip(texts, nlp_artifacts_list)
+        ]
+
     def enhance_using_context(
         self,
         text: str,
@@ -170,30 +231,57 @@ class EntityRecognizer:
 
         Remove duplicates in case the two results
         have identical start and ends and types.
+        Results with a score of 0, and results contained in another result
+        of the same type with a higher or equal score, are removed as well.
+        Runs in O(n log n).
         :param results: List[RecognizerResult]
-        :return: List[RecognizerResult]
+        :return: List[RecognizerResult], by descending score then position
         """
-        results = list(set(results))
-        results = sorted(results, key=lambda x: (-x.score, x.start, -(x.end - x.start)))
+        results_by_type = defaultdict(list)
+        for result in dict.fromkeys(results):  # equals based de-duplication
+            if result.score != 0:
+                results_by_type[result.entity_type].append(result)
+
         filtered_results = []
+        for same_type_results in results_by_type.values():
+            filtered_results.extend(
+                EntityRecognizer._remove_contained_results(same_type_results)
+            )
+
+        return sorted(
+            filtered_results, key=lambda x: (-x.score, x.start, -(x.end - x.start))
+        )
+
+    @staticmethod
+    def _remove_contained_results(
+        results: List[RecognizerResult],
+    ) -> List[RecognizerResult]:
+        """Remove results contained in another one with a higher or equal score.
 
-        for result in results:
-            if result.score == 0:
-                continue
-
-            to_keep = result not in filtered_results  # equals based comparison
-            if to_keep:
-                for filtered in filtered_results:
-                    # If result is contained in one of the other results
-                    if (
-                        result.contained_in(filtered)
-                        and result.entity_type == filtered.entity_type
-                    ):
-                        to_keep = False
-                        break
-
-            if to_keep:
-                filtered_results.append(result)
+        Results are swept by start (longest first), while a Fenwick tree holds
+        the maximal end of the swept results per score rank, so that finding a
+        containing result with a higher or equal score is a prefix query.
+        :param results: Distinct results of a single entity type
+        """
+        scores = sorted({result.score for result in results}, reverse=True)
+        score_ranks = {score: rank for rank, score in enumerate(scores, start=1)}
+        max_ends = [-1] * (len(scores) + 1)
+
+        filtered_results = []
+        for result in sorted(results, key=lambda x: (x.start, -x.end, -x.score)):
+            rank = score_ranks[result.score]
+            max_end = -1
+            while rank > 0:
+                max_end = max(max_end, max_ends[rank])
+                rank -= rank & -rank
+            if max_end >= result.end:
+                continue  # contained in a swept result
+
+            filtered_results.append(result)
+            rank = score_ranks[result.score]
+            while rank < len(max_ends):
+                max_ends[rank] = max(max_ends[rank], result.end)
+                rank += rank & -rank
 
         return filtered_results
 
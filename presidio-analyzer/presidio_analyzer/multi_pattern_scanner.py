@@ -0,0 +1,432 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import regex as re
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+from presidio_analyzer import PatternRecognizer, RecognizerResult
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class MultiPatternScanner:
+    """
+    Scan a text in a single pass for the patterns of many PatternRecognizers.
+
+    All patterns are compiled into one RE2 set (a combined automaton),
+    which reports in a single pass over the text which patterns can match.
+    Only those patterns are then evaluated by their owning recognizer,
+    so matching, validation, invalidation and scoring stay exactly
+    as in `PatternRecognizer.analyze`.
+
+    Patterns are translated into a relaxed RE2 form which matches a superset
+    of what the original pattern matches (e.g. lookarounds and word boundaries
+    are dropped), so the set can only over-report candidates, never miss them.
+    Patterns which can't be translated are always evaluated.
+
+    The RE2 set is only a prefilter: it tells which patterns may match,
+    not where. Match spans are always found by the recognizer, with the
+    `regex` module, so a pattern which can match costs as much as without
+    the scanner (including any backtracking). The time saved is that of
+    the patterns which can't match the text, most of them on typical texts.
+
+    Requires the `google-re2` package.
+
+    :param recognizers: The pattern recognizers to scan for.
+    Recognizers overriding `analyze` are not supported,
+    see `MultiPatternScanner.is_supported`.
+    """
+
+    is_available = bool(re2)
+
+    # Upper bound on the memory used by the RE2 automaton, in bytes
+    MAX_MEM = 256 << 20
+
+    # Ranges of the `regex` module's Unicode shorthand classes, in RE2 syntax,
+    # as RE2 implements \d, \w and \s as ASCII only. Computed on first use.
+    _unicode_classes: Optional[Dict[str, str]] = None
+
+    def __init__(self, recognizers: List[PatternRecognizer]):
+        if not re2:
+            raise ImportError(
+                "google-re2 is not installed. "
+                "Please install it to use the MultiPatternScanner."
+            )
+
+        self.recognizers = list(recognizers)
+
+        options = re2.Options()
+        options.log_errors = False
+        options.max_mem = self.MAX_MEM
+        self._pattern_set = re2.Set.SearchSet(options)
+
+        # (recognizer index, pattern index) per entry in the RE2 set
+        self._set_entries: List[Tuple[int, int]] = []
+        # patterns which couldn't be added to the set, and are always evaluated
+        self._unfiltered: List[Tuple[int, int]] = []
+
+        for rec_index, recognizer in enumerate(self.recognizers):
+            if not self.is_supported(recognizer):
+                raise ValueError(
+                    f"Recognizer {recognizer.name} is not supported by "
+                    f"the MultiPatternScanner"
+                )
+            for pattern_index, pattern in enumerate(recognizer.patterns):
+                if pattern is recognizer._deny_list_pattern:
+                    # already matched in linear time, regardless of its size
+                    self._unfiltered.append((rec_index, pattern_index))
+                elif self.__add_to_set(pattern.regex, recognizer.global_regex_flags):
+                    self._set_entries.append((rec_index, pattern_index))
+                else:
+                    logger.debug(
+                        "Pattern %s of %s can't be scanned with RE2, "
+                        "it will be evaluated on every text",
+                        pattern.name,
+                        recognizer.name,
+                    )
+                    self._unfiltered.append((rec_index, pattern_index))
+
+        if self._set_entries:
+            self._pattern_set.Compile()
+        else:
+            self._pattern_set = None
+
+        logger.info(
+            "Created a multi pattern scanner for %s recognizers "
+            "(%s scanned patterns, %s unfiltered patterns)",
+            len(self.recognizers),
+            len(self._set_entries),
+            len(self._unfiltered),
+        )
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle, the RE2 set being rebuilt when unpickled."""
+        return {"recognizers": self.recognizers}
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore a pickled scanner, compiling its RE2 set again."""
+        self.__init__(state["recognizers"])
+
+    @staticmethod
+    def is_supported(recognizer: object) -> bool:
+        """
+        Return True if the recognizer's patterns can be scanned by this class.
+
+        Only recognizers using `PatternRecognizer.analyze` as is are supported,
+        as others might not evaluate their patterns the standard way.
+
+        :param recognizer: The recognizer to check
+        """
+        return (
+            isinstance(recognizer, PatternRecognizer)
+            and type(recognizer).analyze is PatternRecognizer.analyze
+        )
+
+    def analyze(self, text: str) -> Dict[str, List[RecognizerResult]]:
+        """
+        Scan the text and analyze it with every recognizer having candidate matches.
+
+        :param text: The text to analyze
+        :return: A dictionary of the results per recognizer id.
+        Results are identical to the ones returned by each recognizer's `analyze`.
+        """
+        candidates = set(self._unfiltered)
+        if self._pattern_set and text:
+            try:
+                matched = self._pattern_set.Match(text)
+            except UnicodeEncodeError:
+                # e.g. lone surrogates, which can't be passed to RE2
+                matched = range(len(self._set_entries))
+            if matched:
+                candidates.update(self._set_entries[index] for index in matched)
+
+        results = {recognizer.id: [] for recognizer in self.recognizers}
+        # evaluate in the recognizer's pattern order, as in PatternRecognizer.analyze
+        for rec_index, pattern_index in sorted(candidates):
+            recognizer = self.recognizers[rec_index]
+            results[recognizer.id].append(recognizer.patterns[pattern_index])
+
+        for recognizer in self.recognizers:
+            patterns = results[recognizer.id]
+            if patterns:
+                results[recognizer.id] = recognizer._analyze_patterns(
+                    text, patterns=patterns
+                )
+
+        return results
+
+    def __add_to_set(self, regex: str, flags: Optional[int]) -> bool:
+        if flags and flags & (re.VERBOSE | re.V1):
+            return False
+
+        relaxed = self.to_re2(regex)
+        if relaxed is None:
+            return False
+
+        try:
+            self._pattern_set.Add(relaxed)
+        except re2.error:
+            return False
+        return True
+
+    @classmethod
+    def to_re2(cls, regex: str) -> Optional[str]:  # noqa: C901
+        """
+        Translate a `regex` pattern into a relaxed RE2 pattern.
+
+        The returned pattern matches (at least) every text the original pattern
+        matches, with any combination of the IGNORECASE, MULTILINE and DOTALL flags:
+        zero-width assertions are dropped, backreferences match anything,
+        and Python's Unicode shorthand classes are spelled out as ranges.
+
+        :param regex: The pattern to translate
+        :return: The RE2 pattern, or None if the pattern can't be translated
+        """
+        out = []
+        # per open group: whether it's dropped, and its start position in out
+        groups: List[Tuple[bool, int]] = []
+        in_class = False
+        after_quantifier = False
+        i = 0
+        n = len(regex)
+
+        while i < n:
+            c = regex[i]
+            is_quantifier = False
+
+            if c == "\\":
+                if i + 1 >= n:
+                    return None
+                escaped, i = cls.__translate_escape(regex, i, in_class)
+                if escaped is None:
+                    return None
+                out.append(escaped)
+
+            elif in_class:
+                if c == "]":
+                    in_class = False
+                    out.append(c)
+                elif c == "[":
+                    if regex.startswith("[:", i):
+                        # POSIX classes are ASCII only in RE2
+                        return None
+                    out.append(r"\[")
+                else:
+                    out.append(c)
+                i += 1
+
+            elif c == "[":
+                in_class = True
+                negated = regex.startswith("[^", i)
+                i += 2 if negated else 1
+                out.append("[^" if negated else "[")
+                if i < n and regex[i] == "]":
+                    out.append(r"\]")
+                    i += 1
+
+            elif c == "(":
+                group, i = cls.__translate_group_start(regex, i)
+                if group is None:
+                    return None
+                if group == "":
+                    # comment
+                    continue
+                if group in ("(?=", "(?!", "(?<=", "(?<!"):
+                    groups.append((True, len(out)))
+                else:
+                    groups.append((False, len(out)))
+                    out.append(group)
+
+            elif c == ")":
+                if not groups:
+                    return None
+                dropped, start = groups.pop()
+                if dropped:
+                    del out[start:]
+                    out.append("(?:)")
+                else:
+                    out.append(")")
+                i += 1
+
+            elif c in "*+?":
+                if after_quantifier and c == "+":
+                    # possessive quantifier, keep the plain quantifier
+                    pass
+                else:
+                    out.append(c)
+                    is_quantifier = c != "?" or not after_quantifier
+                i += 1
+
+            elif c == "{":
+                counted = re.match(r"\{(\d*)(,?)(\d*)\}", regex[i:])
+                if counted and (counted.group(1) or counted.group(3)):
+                    low = counted.group(1) or "0"
+                    out.append(f"{{{low}{counted.group(2)}{counted.group(3)}}}")
+                    i += counted.end()
+                    is_quantifier = True
+                else:
+                    out.append(r"\{")
+                    i += 1
+
+            elif c == "}":
+                out.append(r"\}")
+                i += 1
+
+            else:
+                out.append(c)
+                i += 1
+
+            after_quantifier = is_quantifier
+
+        if in_class or groups:
+            return None
+
+        return "(?ims)" + "".join(out)
+
+    @classmethod
+    def __translate_escape(  # noqa: C901
+        cls, regex: str, i: int, in_class: bool
+    ) -> Tuple[Optional[str], int]:
+        """Translate the escape sequence at index i, return it and the next index."""
+        e = regex[i + 1]
+        i += 2
+
+        if e in "dwsDWS":
+            ranges = cls.__get_unicode_classes()[e.lower()]
+            if in_class:
+                # negated shorthand classes can't be nested in RE2 classes
+                return (ranges if e.islower() else None), i
+            return (f"[{ranges}]" if e.islower() else f"[^{ranges}]"), i
+
+        if e in "bBGKmM":
+            if in_class:
+                return (r"\x{8}" if e == "b" else None), i
+            return "(?:)", i
+
+        if e in "AZ":
+            if in_class:
+                return None, i
+            return (r"\A" if e == "A" else r"\z"), i
+
+        if e in "pP":
+            if regex.startswith("{", i):
+                end = regex.find("}", i)
+                if end == -1:
+                    return None, i
+                return regex[i - 2 : end + 1], end + 1
+            return regex[i - 2 : i + 1], i + 1
+
+        if e == "x":
+            if regex.startswith("{", i):
+                end = regex.find("}", i)
+                if end == -1:
+                    return None, i
+                return regex[i - 2 : end + 1], end + 1
+            return regex[i - 2 : i + 2], i + 2
+
+        if e in "uU":
+            length = 4 if e == "u" else 8
+            code = regex[i : i + length]
+            if len(code) != length:
+                return None, i
+            return f"\\x{{{code}}}", i + length
+
+        if e.isdigit():
+            if in_class or e == "0":
+                return None, i
+            # backreference
+            while i < len(regex) and regex[i].isdigit():
+                i += 1
+            return "(?s:.*)", i
+
+        if e == "g" and regex.startswith("<", i):
+            end = regex.find(">", i)
+            if end == -1:
+                return None, i
+            return "(?s:.*)", end + 1
+
+        if e in "afnrtv":
+            return "\\" + e, i
+
+        if e.isascii() and e.isalnum():
+            return None, i
+
+        if e.isascii() and not e.isspace():
+            return "\\" + e, i
+
+        return e, i
+
+    @classmethod
+    def __get_unicode_classes(cls) -> Dict[str, str]:
+        if cls._unicode_classes is None:
+            # every code point except surrogates, which RE2 can't represent
+            characters = "".join(
+                chr(code_point)
+                for code_point in range(0x110000)
+                if not 0xD800 <= code_point <= 0xDFFF
+            )
+            cls._unicode_classes = {
+                shorthand: "".join(
+                    f"\\x{{{ord(match.group()[0]):X}}}-\\x{{{ord(match.group()[-1]):X}}}"
+                    for match in re.finditer(f"\\{shorthand}+", characters)
+                )
+                for shorthand in "dws"
+            }
+        return cls._unicode_classes
+
+    @staticmethod
+    def __translate_group_start(regex: str, i: int) -> Tuple[Optional[str], int]:
+        """Translate the group opening at index i, return it and the next index.
+
+        Returns an empty string for comments and global flags,
+        and None for unsupported groups.
+        """
+        if not regex.startswith("(?", i):
+            return "(", i + 1
+
+        for lookaround in ("(?=", "(?!", "(?<=", "(?<!"):
+            if regex.startswith(lookaround, i):
+                return lookaround, i + len(lookaround)
+
+        for non_capturing in ("(?:", "(?>", "(?|"):
+            if regex.startswith(non_capturing, i):
+                return "(?:", i + 3
+
+        if regex.startswith("(?#", i):
+            end = regex.find(")", i)
+            return ("" if end != -1 else None), end + 1
+
+        if regex.startswith("(?P=", i):
+            # named backreference
+            end = regex.find(")", i)
+            if end == -1:
+                return None, i
+            # placeholder group closed by the regular ")" handling
+            return "(?:(?s:.*)", end
+
+        named = re.match(r"\(\?P?<([^>=!]+)>", regex[i:])
+        if named:
+            return f"(?P<{named.group(1)}>", i + named.end()
+
+        flags = re.match(r"\(\?([a-zA-Z\-]*)([:)])", regex[i:])
+        if not flags:
+            # conditionals, recursion etc.
+            return None, i
+
+        flag_chars, kind = flags.groups()
+        if any(f not in "aimsu-" for f in flag_chars):
+            return None, i
+        if kind == ")" and "-" in flag_chars:
+            return None, i
+
+        if kind == ")":
+            # global flags which can only turn on i, m or s,
+            # already set for the entire pattern
+            return "", i + flags.end()
+
+        flag_chars = "".join(f for f in flag_chars if f in "ims-").rstrip("-")
+        return f"(?{flag_chars}:", i + flags.end()
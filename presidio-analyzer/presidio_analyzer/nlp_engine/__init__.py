@@ -1,13 +1,41 @@
 """NLP engine package. Performs text pre-processing."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .ner_model_configuration import NerModelConfiguration
 from .nlp_artifacts import NlpArtifacts
 from .nlp_engine import NlpEngine
-from .spacy_nlp_engine import SpacyNlpEngine
-from .stanza_nlp_engine import StanzaNlpEngine
-from .transformers_nlp_engine import TransformersNlpEngine
 
-from .nlp_engine_provider import NlpEngineProvider  # isort:skip
+if TYPE_CHECKING:
+    from .nlp_engine_provider import NlpEngineProvider
+    from .spacy_nlp_engine import SpacyNlpEngine
+    from .stanza_nlp_engine import StanzaNlpEngine
+    from .transformers_nlp_engine import TransformersNlpEngine
+
+# The NLP engines import their NLP library (e.g. spaCy),
+# so they are only imported when first accessed
+_LAZY_IMPORTS = {
+    "SpacyNlpEngine": ".spacy_nlp_engine",
+    "StanzaNlpEngine": ".stanza_nlp_engine",
+    "TransformersNlpEngine": ".transformers_nlp_engine",
+    "NlpEngineProvider": ".nlp_engine_provider",
+}
+
+
+def __getattr__(name: str):
+    """Import the lazily imported attributes on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of the module, including the lazily imported ones."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
 
 __all__ = [
     "NerModelConfiguration",
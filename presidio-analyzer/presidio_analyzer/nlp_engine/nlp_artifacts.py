@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 import json
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from spacy.tokens import Doc, Span
+if TYPE_CHECKING:
+    from spacy.tokens import Doc, Span
 
 
 class NlpArtifacts:
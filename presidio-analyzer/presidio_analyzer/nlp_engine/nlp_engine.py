@@ -12,6 +12,11 @@ class NlpEngine(ABC):
     on tokens.
     """
 
+    # Whether `process_text` and `process_batch` accept a `capabilities` argument:
+    # the NlpArtifacts attributes to compute, out of "tokens", "lemmas"
+    # and "entities", so that only the needed parts of the pipeline run.
+    supports_capabilities = False
+
     @abstractmethod
     def load(self) -> None:
         """Load the NLP model."""
@@ -24,6 +29,16 @@ class NlpEngine(ABC):
     def process_text(self, text: str, language: str) -> NlpArtifacts:
         """Execute the NLP pipeline on the given text and language."""
 
+    def tokenize(self, text: str, language: str) -> NlpArtifacts:
+        """Tokenize the given text, without running the rest of the NLP pipeline.
+
+        Used when no entities are needed (e.g. for context enhancement)
+        by engines which don't support capabilities.
+        Engines which can't split tokenization from the rest of their pipeline
+        run the full pipeline.
+        """
+        return self.process_text(text, language)
+
     @abstractmethod
     def process_batch(
         self,
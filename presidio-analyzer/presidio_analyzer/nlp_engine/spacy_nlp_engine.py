@@ -1,6 +1,7 @@
 import logging
+import re
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from typing import Any, Collection, Dict, Generator, List, Optional, Tuple, Union
 
 import spacy
 from spacy.language import Language
@@ -26,11 +27,32 @@ class SpacyNlpEngine(NlpEngine):
 
     engine_name = "spacy"
     is_available = bool(spacy)
+    supports_capabilities = True
+
+    # Attributes assigned by spaCy components which each capability needs.
+    # Lemmatizers rely on the part-of-speech annotations of previous components.
+    CAPABILITY_ATTRIBUTES = {
+        "tokens": (),
+        "lemmas": ("token.lemma", "token.pos", "token.tag", "token.morph"),
+        "entities": ("doc.ents", "token.ent_iob", "token.ent_type", "doc.spans"),
+    }
+
+    # Whitespace long texts are split at, by order of preference:
+    # between paragraphs, lines, sentences and words
+    LONG_TEXT_BOUNDARY_REGEXES = (
+        re.compile(r"\s*\n[^\S\n]*\n\s*"),
+        re.compile(r"\s*\n\s*"),
+        re.compile(r"(?<=[.!?。！？])\s+"),
+        re.compile(r"\s+"),
+    )
 
     def __init__(
         self,
         models: Optional[List[Dict[str, str]]] = None,
         ner_model_configuration: Optional[NerModelConfiguration] = None,
+        long_text_threshold: Optional[int] = None,
+        long_text_n_process: int = 1,
+        long_text_overlap: Optional[int] = None,
     ):
         """
         Initialize a wrapper on spaCy functionality.
@@ -39,6 +61,21 @@ class SpacyNlpEngine(NlpEngine):
         For example: models = [{"lang_code": "en", "model_name": "en_core_web_lg"}]
         :param ner_model_configuration: Parameters for the NER model.
         See conf/spacy.yaml for an example
+        :param long_text_threshold: Number of characters above which `process_text`
+        splits a text at paragraph (or else sentence) boundaries into pieces,
+        processes each with `long_text_overlap` characters of context around it,
+        in windows of at most this size, in parallel,
+        and merges them back into one document. None to process texts whole.
+        The tokens are those of the whole text, but statistical components
+        (e.g. NER) see each window alone, and may annotate it differently
+        :param long_text_n_process: Number of processes to process
+        the pieces of long texts with
+        :param long_text_overlap: Number of characters of context (at least half
+        of it, at a boundary) processed before and after each piece of a long text,
+        and whose entities are returned by the neighboring pieces.
+        Entities are never cut by a piece edge as long as they are shorter than
+        half of it. Must be less than half of `long_text_threshold`.
+        Defaults to a tenth of `long_text_threshold`
         """
         if not models:
             models = [{"lang_code": "en", "model_name": "en_core_web_lg"}]
@@ -48,6 +85,18 @@ class SpacyNlpEngine(NlpEngine):
             ner_model_configuration = NerModelConfiguration()
         self.ner_model_configuration = ner_model_configuration
 
+        if long_text_threshold:
+            if long_text_overlap is None:
+                long_text_overlap = long_text_threshold // 10
+            if long_text_overlap < 0 or long_text_threshold <= 2 * long_text_overlap:
+                raise ValueError(
+                    "long_text_overlap must be positive "
+                    "and less than half of long_text_threshold"
+                )
+        self.long_text_threshold = long_text_threshold
+        self.long_text_n_process = long_text_n_process
+        self.long_text_overlap = long_text_overlap or 0
+
         self.nlp = None
 
     def load(self) -> None:
@@ -103,13 +152,217 @@ class SpacyNlpEngine(NlpEngine):
         """Return True if the model is already loaded."""
         return self.nlp is not None
 
-    def process_text(self, text: str, language: str) -> NlpArtifacts:
-        """Execute the SpaCy NLP pipeline on the given text and language."""
+    def process_text(
+        self,
+        text: str,
+        language: str,
+        capabilities: Optional[Collection[str]] = None,
+    ) -> NlpArtifacts:
+        """Execute the SpaCy NLP pipeline on the given text and language.
+
+        :param text: The text to process
+        :param language: The language of the text
+        :param capabilities: The NlpArtifacts attributes to compute
+        ("tokens", "lemmas" and/or "entities").
+        Components not needed for them are disabled, and the attributes
+        not computed are left empty. If None, the full pipeline runs.
+        """
+        if not self.nlp:
+            raise ValueError("NLP engine is not loaded. Consider calling .load()")
+
+        if capabilities is not None and set(capabilities) <= {"tokens"}:
+            return self.tokenize(text, language)
+
+        disabled_pipes = self._get_disabled_pipes(language, capabilities)
+        if self.long_text_threshold and len(text) > self.long_text_threshold:
+            doc = self._process_long_text(text, language, disabled_pipes)
+        else:
+            doc = self.nlp[language](text, disable=disabled_pipes)
+        return self._doc_to_nlp_artifact(doc, language, capabilities)
+
+    def _process_long_text(
+        self, text: str, language: str, disabled_pipes: List[str]
+    ) -> Doc:
+        """Process a long text in pieces, in parallel, and merge them into one Doc.
+
+        Each piece is processed in a window with the text around it,
+        and provides the tokens it contains and the entities which start in it.
+        The merged Doc has the text, tokens, annotations and entities
+        of the pieces, with offsets in the whole text.
+        :param text: The text to process
+        :param language: The language of the text
+        :param disabled_pipes: The pipeline components not to run
+        """
+        n_process = self.long_text_n_process
+        overlap = self.long_text_overlap
+        # no larger than needed to give each process a piece
+        piece_size = min(
+            self.long_text_threshold - 2 * overlap, -(-len(text) // n_process)
+        )
+        pieces = self._split_long_text(text, piece_size)
+        logger.debug(f"Processing a long text in {len(pieces)} pieces")
+
+        windows = []
+        start = 0
+        for piece in pieces:
+            end = start + len(piece)
+            window_start = 0
+            if start > overlap:
+                window_start = self._find_cut(
+                    text, start - overlap, start - overlap, start - overlap // 2
+                )
+            window_end = len(text)
+            if end + overlap < len(text):
+                window_end = self._find_cut(
+                    text, end, end + overlap // 2, end + overlap
+                )
+            windows.append((window_start, window_end, start, end))
+            start = end
+
+        docs = list(
+            self.nlp[language].pipe(
+                [
+                    text[window_start:window_end]
+                    for window_start, window_end, _, _ in windows
+                ],
+                batch_size=1,
+                n_process=n_process,
+                disable=disabled_pipes,
+            )
+        )
+        return self._merge_docs(
+            docs,
+            [(window_start, start, end) for window_start, _, start, end in windows],
+        )
+
+    @classmethod
+    def _split_long_text(cls, text: str, piece_size: int) -> List[str]:
+        """Split a text into pieces of at most piece_size characters.
+
+        Each piece ends at the last paragraph boundary in its second half,
+        or else at the last line, sentence or word boundary. The pieces
+        joined together are the text, and are tokenized as the text is.
+        Only words or whitespace runs longer than half a piece are cut inside.
+        """
+        pieces = []
+        start = 0
+        while len(text) - start > piece_size:
+            cut = cls._find_cut(
+                text, start, start + piece_size // 2, start + piece_size
+            )
+            pieces.append(text[start:cut])
+            start = cut
+        pieces.append(text[start:])
+        return pieces
+
+    @classmethod
+    def _find_cut(cls, text: str, start: int, search_start: int, end: int) -> int:
+        """Return where to cut a text between start and end.
+
+        The cut is at the last paragraph boundary between search_start and end,
+        or else at the last line, sentence or word boundary, or else at end.
+        The text before and after the cut is tokenized as the text is:
+        the whitespace of the boundary goes after the cut, except for
+        a single space, which spaCy keeps with the preceding token.
+        """
+        for regex in cls.LONG_TEXT_BOUNDARY_REGEXES:
+            boundaries = [
+                match.start() for match in regex.finditer(text, search_start, end)
+            ]
+            if boundaries:
+                cut = boundaries[-1]
+                # the search may start inside a whitespace run:
+                # cut at its beginning, or at its end if it starts at start
+                while cut > start and text[cut - 1].isspace():
+                    cut -= 1
+                if cut == start:
+                    cut = boundaries[-1]
+                    while cut < end and text[cut].isspace():
+                        cut += 1
+                if text.startswith(" ", cut):
+                    cut += 1
+                return cut
+        return end
+
+    @staticmethod
+    def _merge_docs(docs: List[Doc], windows: List[Tuple[int, int, int]]) -> Doc:
+        """Merge the Docs of overlapping windows of a text into one Doc.
+
+        :param docs: The Docs of the windows
+        :param windows: The offset of each window in the text, and the start
+        and end of the piece of the text it provides. The tokens of the merged
+        Doc are those in the pieces, and its entities and spans those
+        which start in the pieces, without overlapping entities
+        """
+        pieces = []
+        for window_doc, (offset, start, end) in zip(docs, windows):
+            tokens = [
+                token.i for token in window_doc if start <= offset + token.idx < end
+            ]
+            pieces.append(window_doc[tokens[0] : tokens[-1] + 1].as_doc())
+        doc = Doc.from_docs(pieces, ensure_whitespace=False)
+
+        def owned_spans(spans, offset, start, end):
+            for index, span in enumerate(spans):
+                if start <= offset + span.start_char < end:
+                    merged_span = doc.char_span(
+                        offset + span.start_char,
+                        offset + span.end_char,
+                        label=span.label_,
+                    )
+                    if merged_span is not None:
+                        yield index, merged_span
+
+        ents = []
+        for window_doc, window in zip(docs, windows):
+            for _, ent in owned_spans(window_doc.ents, *window):
+                # an entity running into the next piece wins over its entities
+                if not ents or ent.start >= ents[-1].end:
+                    ents.append(ent)
+        doc.ents = ents
+
+        # span groups (e.g. the entities of spacy-huggingface-pipelines)
+        # and their attributes listing a value per span (e.g. the scores)
+        keys = {key: None for window_doc in docs for key in window_doc.spans}
+        for key in keys:
+            spans = []
+            attrs = {}
+            for window_doc, window in zip(docs, windows):
+                if key not in window_doc.spans:
+                    continue
+                span_group = window_doc.spans[key]
+                indices = []
+                for index, span in owned_spans(span_group, *window):
+                    indices.append(index)
+                    spans.append(span)
+                for name, value in span_group.attrs.items():
+                    if isinstance(value, list) and len(value) == len(span_group):
+                        attrs.setdefault(name, []).extend(
+                            value[index] for index in indices
+                        )
+            doc.spans[key] = spans
+            doc.spans[key].attrs.update(attrs)
+        return doc
+
+    def tokenize(self, text: str, language: str) -> NlpArtifacts:
+        """Run only the spaCy tokenizer on the given text and language.
+
+        The returned NlpArtifacts have no entities,
+        and the lemmas are the tokens' text.
+        """
         if not self.nlp:
             raise ValueError("NLP engine is not loaded. Consider calling .load()")
 
-        doc = self.nlp[language](text)
-        return self._doc_to_nlp_artifact(doc, language)
+        doc = self.nlp[language].make_doc(text)
+        return NlpArtifacts(
+            entities=[],
+            tokens=doc,
+            tokens_indices=[token.idx for token in doc],
+            lemmas=[token.text for token in doc],
+            nlp_engine=self,
+            language=language,
+            scores=[],
+        )
 
     def process_batch(
         self,
@@ -118,6 +371,7 @@ class SpacyNlpEngine(NlpEngine):
         batch_size: int = 1,
         n_process: int = 1,
         as_tuples: bool = False,
+        capabilities: Optional[Collection[str]] = None,
     ) -> Generator[
         Union[Tuple[Any, NlpArtifacts, Any], Tuple[Any, NlpArtifacts]], Any, None
     ]:
@@ -131,6 +385,8 @@ class SpacyNlpEngine(NlpEngine):
         :param as_tuples: If set to True, inputs should be a sequence of
             (text, context) tuples. Output will then be a sequence of
             (doc, context) tuples. Defaults to False.
+        :param capabilities: The NlpArtifacts attributes to compute,
+            see `process_text`. If None, the full pipeline runs.
 
         :return: A generator of tuples (text, NlpArtifacts, context) or
             (text, NlpArtifacts) depending on the value of as_tuples.
@@ -149,15 +405,54 @@ class SpacyNlpEngine(NlpEngine):
         else:
             texts = (str(text) for text in texts)
         batch_output = self.nlp[language].pipe(
-            texts, as_tuples=as_tuples, batch_size=batch_size, n_process=n_process
+            texts,
+            as_tuples=as_tuples,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=self._get_disabled_pipes(language, capabilities),
         )
         for output in batch_output:
             if as_tuples:
                 doc, context = output
-                yield doc.text, self._doc_to_nlp_artifact(doc, language), context
+                nlp_artifacts = self._doc_to_nlp_artifact(doc, language, capabilities)
+                yield doc.text, nlp_artifacts, context
             else:
                 doc = output
-                yield doc.text, self._doc_to_nlp_artifact(doc, language)
+                yield doc.text, self._doc_to_nlp_artifact(doc, language, capabilities)
+
+    def _get_disabled_pipes(
+        self, language: str, capabilities: Optional[Collection[str]]
+    ) -> List[str]:
+        """Return the pipeline components not needed for the given capabilities.
+
+        Components which don't declare the attributes they assign are kept,
+        as well as the shared embedding layers (e.g. tok2vec) kept components
+        listen to.
+        :param language: The language of the pipeline
+        :param capabilities: The NlpArtifacts attributes to compute,
+        or None for the full pipeline
+        """
+        if capabilities is None:
+            return []
+
+        nlp = self.nlp[language]
+        needed = set()
+        for capability in capabilities:
+            needed.update(self.CAPABILITY_ATTRIBUTES[capability])
+
+        kept = set()
+        # backwards, so that listeners are known before the layers they listen to
+        for name in reversed(nlp.pipe_names):
+            assigns = nlp.get_pipe_meta(name).assigns
+            listeners = getattr(nlp.get_pipe(name), "listening_components", ())
+            if (
+                not assigns
+                or not needed.isdisjoint(assigns)
+                or not kept.isdisjoint(listeners)
+            ):
+                kept.add(name)
+
+        return [name for name in nlp.pipe_names if name not in kept]
 
     def is_stopword(self, word: str, language: str) -> bool:
         """
@@ -184,14 +479,22 @@ class SpacyNlpEngine(NlpEngine):
         """
         return self.nlp[language]
 
-    def _doc_to_nlp_artifact(self, doc: Doc, language: str) -> NlpArtifacts:
+    def _doc_to_nlp_artifact(
+        self,
+        doc: Doc,
+        language: str,
+        capabilities: Optional[Collection[str]] = None,
+    ) -> NlpArtifacts:
         lemmas = [token.lemma_ for token in doc]
         tokens_indices = [token.idx for token in doc]
 
-        entities = self._get_entities(doc)
-        scores = self._get_scores_for_entities(doc)
+        if capabilities is None or "entities" in capabilities:
+            entities = self._get_entities(doc)
+            scores = self._get_scores_for_entities(doc)
 
-        entities, scores = self._get_updated_entities(entities, scores)
+            entities, scores = self._get_updated_entities(entities, scores)
+        else:
+            entities, scores = [], []
 
         return NlpArtifacts(
             entities=entities,
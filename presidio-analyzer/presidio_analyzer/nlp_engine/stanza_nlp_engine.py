@@ -1,6 +1,18 @@
 import logging
 import warnings
-from typing import Dict, List, Optional, Union
+from itertools import islice
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 try:
     import stanza
@@ -17,7 +29,11 @@ from spacy import Language, blank
 from spacy.tokens import Doc, Token
 from spacy.util import registry
 
-from presidio_analyzer.nlp_engine import NerModelConfiguration, SpacyNlpEngine
+from presidio_analyzer.nlp_engine import (
+    NerModelConfiguration,
+    NlpArtifacts,
+    SpacyNlpEngine,
+)
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -34,6 +50,10 @@ class StanzaNlpEngine(SpacyNlpEngine):
     For example: models = [{"lang_code": "en", "model_name": "en"}]
     :param ner_model_configuration: Parameters for the NER model.
     See conf/stanza.yaml for an example
+    :param download_if_missing: Whether to download missing Stanza models.
+    :param stanza_batch_size: The number of texts passed to each bulk call
+    of the Stanza pipeline in `process_batch`, independently of its
+    `batch_size`, which applies to the spaCy pipeline.
 
     """
 
@@ -45,9 +65,11 @@ class StanzaNlpEngine(SpacyNlpEngine):
         models: Optional[List[Dict[str, str]]] = None,
         ner_model_configuration: Optional[NerModelConfiguration] = None,
         download_if_missing: bool = True,
+        stanza_batch_size: int = 32,
     ):
         super().__init__(models, ner_model_configuration)
         self.download_if_missing = download_if_missing
+        self.stanza_batch_size = stanza_batch_size
 
     def load(self) -> None:
         """Load the NLP model."""
@@ -65,6 +87,59 @@ class StanzaNlpEngine(SpacyNlpEngine):
                 else None,
             )
 
+    def process_batch(
+        self,
+        texts: Union[List[str], List[Tuple[str, object]]],
+        language: str,
+        batch_size: int = 1,
+        n_process: int = 1,
+        as_tuples: bool = False,
+        capabilities: Optional[Collection[str]] = None,
+    ) -> Generator[
+        Union[Tuple[Any, NlpArtifacts, Any], Tuple[Any, NlpArtifacts]], Any, None
+    ]:
+        """Execute the NLP pipeline on a batch of texts.
+
+        The texts are processed by the Stanza pipeline in bulk,
+        `stanza_batch_size` texts per call, which batches them through its models.
+        See `SpacyNlpEngine.process_batch` for the parameters.
+        """
+        if not self.nlp:
+            raise ValueError("NLP engine is not loaded. Consider calling .load()")
+
+        if as_tuples:
+            if not all(isinstance(item, tuple) and len(item) == 2 for item in texts):
+                raise ValueError(
+                    "When 'as_tuples' is True, "
+                    "'texts' must be a list of tuples (text, context)."
+                )
+            contexts = [context for _, context in texts]
+            texts = [str(text) for text, _ in texts]
+        else:
+            texts = [str(text) for text in texts]
+
+        # spaCy's pipe tokenizes the texts one by one,
+        # so they are converted to Docs in bulk first
+        nlp = self.nlp[language]
+        docs = nlp.tokenizer.pipe(texts, batch_size=self.stanza_batch_size)
+        if as_tuples:
+            docs = zip(docs, contexts)
+        batch_output = nlp.pipe(
+            docs,
+            as_tuples=as_tuples,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=self._get_disabled_pipes(language, capabilities),
+        )
+        for output in batch_output:
+            if as_tuples:
+                doc, context = output
+                nlp_artifacts = self._doc_to_nlp_artifact(doc, language, capabilities)
+                yield doc.text, nlp_artifacts, context
+            else:
+                doc = output
+                yield doc.text, self._doc_to_nlp_artifact(doc, language, capabilities)
+
 
 # Code taken from https://github.com/explosion/spacy-stanza
 # Supports Stanza > 1.7.0
@@ -211,7 +286,38 @@ class StanzaTokenizer(object):
         elif text.isspace():
             return Doc(self.vocab, words=[text], spaces=[False])
 
-        snlp_doc = self.snlp(text)
+        return self._to_spacy_doc(self.snlp(text))
+
+    def pipe(self, texts: Iterable[str], batch_size: int = 32) -> Iterator[Doc]:
+        """Tokenize a stream of texts.
+
+        The texts are processed by the Stanza pipeline in bulk,
+        `batch_size` texts at a time.
+
+        texts: A sequence of Unicode texts.
+        batch_size: The number of texts processed by each Stanza pipeline call.
+        YIELDS (Doc): A sequence of Doc objects, in order.
+        """
+        texts = iter(texts)
+        while True:
+            batch = list(islice(texts, max(batch_size, 1)))
+            if not batch:
+                return
+
+            to_process = [text for text in batch if text and not text.isspace()]
+            snlp_docs = iter(self.snlp.bulk_process(to_process) if to_process else [])
+            for text in batch:
+                if text and not text.isspace():
+                    yield self._to_spacy_doc(next(snlp_docs))
+                else:
+                    yield self(text)
+
+    def _to_spacy_doc(self, snlp_doc) -> Doc:
+        """Convert a processed Stanza Document to a spaCy Doc.
+
+        snlp_doc (stanza.Document): The processed Stanza doc.
+        RETURNS (spacy.tokens.Doc): The spaCy Doc object.
+        """
         text = snlp_doc.text
         snlp_tokens, snlp_heads = self.__get_tokens_with_heads(snlp_doc)
         pos = []
@@ -234,10 +340,13 @@ class StanzaTokenizer(object):
                 "expanded tokens.",
                 stacklevel=4,
             )
-        offset = 0
+        # index in words of each Stanza token, to map the Stanza heads
+        # to the words once the space tokens are inserted
+        token_word_indices = []
         for i, word in enumerate(words):
+            token_index = len(token_word_indices)
             if word.isspace() and (
-                i + offset >= len(snlp_tokens) or word != snlp_tokens[i + offset].text
+                token_index >= len(snlp_tokens) or word != snlp_tokens[token_index].text
             ):
                 # insert a space token
                 pos.append("SPACE")
@@ -246,36 +355,26 @@ class StanzaTokenizer(object):
                 deps.append("")
                 lemmas.append(word)
 
-                # increment any heads left of this position that point beyond
-                # this position to the right (already present in heads)
-                for j in range(0, len(heads)):
-                    if j + heads[j] >= i:
-                        heads[j] += 1
-
-                # decrement any heads right of this position that point beyond
-                # this position to the left (yet to be added from snlp_heads)
-                for j in range(i + offset, len(snlp_heads)):
-                    if j + snlp_heads[j] < i + offset:
-                        snlp_heads[j] -= 1
-
                 # initial space tokens are attached to the following token,
                 # otherwise attach to the preceding token
                 if i == 0:
                     heads.append(1)
                 else:
-                    heads.append(-1)
-
-                offset -= 1
+                    heads.append(i - 1)
             else:
-                token = snlp_tokens[i + offset]
+                token = snlp_tokens[token_index]
                 assert word == token.text
 
                 pos.append(token.upos or "")
                 tags.append(token.xpos or token.upos or "")
                 morphs.append(token.feats or "")
                 deps.append(token.deprel or "")
-                heads.append(snlp_heads[i + offset])
+                heads.append(None)
                 lemmas.append(token.lemma or "")
+                token_word_indices.append(i)
+
+        for token_index, i in enumerate(token_word_indices):
+            heads[i] = token_word_indices[token_index + snlp_heads[token_index]]
 
         doc = Doc(
             self.vocab,
@@ -286,7 +385,7 @@ class StanzaTokenizer(object):
             morphs=morphs,
             lemmas=lemmas,
             deps=deps,
-            heads=[head + i for i, head in enumerate(heads)],
+            heads=heads,
         )
         ents = []
         for ent in snlp_doc.entities:
@@ -309,15 +408,6 @@ class StanzaTokenizer(object):
             doc.user_token_hooks["has_vector"] = self.token_has_vector
         return doc
 
-    def pipe(self, texts):
-        """Tokenize a stream of texts.
-
-        texts: A sequence of Unicode texts.
-        YIELDS (Doc): A sequence of Doc objects, in order.
-        """
-        for text in texts:
-            yield self(text)
-
     @staticmethod
     def __get_tokens_with_heads(snlp_doc):
         """Flatten the tokens in the Stanza Doc and extract the token indices.
@@ -1,5 +1,8 @@
 import logging
-from typing import Dict, List, Optional
+import tempfile
+from itertools import islice
+from pathlib import Path
+from typing import Any, Collection, Dict, Generator, List, Optional, Tuple, Union
 
 import spacy
 from spacy.tokens import Doc, Span
@@ -11,8 +14,17 @@ except ImportError:
     spacy_huggingface_pipelines = None
     transformers = None
 
+try:
+    from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForTokenClassification = None
+    ORTQuantizer = None
+    AutoQuantizationConfig = None
+
 from presidio_analyzer.nlp_engine import (
     NerModelConfiguration,
+    NlpArtifacts,
     SpacyNlpEngine,
 )
 
@@ -36,8 +48,19 @@ class TransformersNlpEngine(SpacyNlpEngine):
             "transformers": "dslim/bert-base-NER"
             }
     }]
+    Each model may also set the backend running the transformers model:
+    `"backend": "onnx"` runs it with ONNX Runtime instead of PyTorch
+    (requires optimum[onnxruntime]), and `"quantize": True` quantizes
+    its weights to int8 (dynamic quantization), for faster CPU inference.
+    The exported model is saved to and loaded from `"onnx_model_dir"`, if set,
+    so that it is only exported once.
     :param ner_model_configuration: Parameters for the NER model.
     See conf/transformers.yaml for an example
+    :param max_batch_tokens: Budget of tokens of the batches of `process_batch`.
+    Texts are batched by length, so that the texts of a batch have similar
+    lengths and little padding, up to this number of (padded) transformers
+    tokenizer tokens per batch.
+    If None, texts are batched in order, `batch_size` texts per batch.
 
 
     Note that since the spaCy model is not used for NER,
@@ -52,10 +75,18 @@ class TransformersNlpEngine(SpacyNlpEngine):
     engine_name = "transformers"
     is_available = bool(spacy_huggingface_pipelines)
 
+    # Number of texts of a batch sorted by length at once,
+    # which bounds the number of texts held in memory
+    LENGTH_SORTING_WINDOW = 1024
+
+    # Backends running the transformers model
+    BACKENDS = ("pytorch", "onnx")
+
     def __init__(
         self,
         models: Optional[List[Dict]] = None,
         ner_model_configuration: Optional[NerModelConfiguration] = None,
+        max_batch_tokens: Optional[int] = 4096,
     ):
         if not models:
             models = [
@@ -69,6 +100,7 @@ class TransformersNlpEngine(SpacyNlpEngine):
             ]
         super().__init__(models=models, ner_model_configuration=ner_model_configuration)
         self.entity_key = "bert-base-ner"
+        self.max_batch_tokens = max_batch_tokens
 
     def load(self) -> None:
         """Load the spaCy and transformers models."""
@@ -80,6 +112,11 @@ class TransformersNlpEngine(SpacyNlpEngine):
             self._validate_model_params(model)
             spacy_model = model["model_name"]["spacy"]
             transformers_model = model["model_name"]["transformers"]
+            if model.get("backend") == "onnx" and not ORTModelForTokenClassification:
+                raise ImportError(
+                    "optimum[onnxruntime] is not installed. "
+                    "Please install it to use the onnx backend."
+                )
             self._download_spacy_model_if_needed(spacy_model)
 
             nlp = spacy.load(spacy_model, disable=["parser", "ner"])
@@ -94,6 +131,14 @@ class TransformersNlpEngine(SpacyNlpEngine):
                     "annotate_spans_key": self.entity_key,
                 },
             )
+            if model.get("backend") == "onnx":
+                hf_token_pipe = nlp.get_pipe("hf_token_pipe")
+                hf_token_pipe.hf_pipeline = self._create_onnx_pipeline(
+                    transformers_model,
+                    tokenizer=hf_token_pipe.hf_pipeline.tokenizer,
+                    quantize=model.get("quantize", False),
+                    onnx_model_dir=model.get("onnx_model_dir"),
+                )
             self.nlp[model["lang_code"]] = nlp
 
     @staticmethod
@@ -110,6 +155,206 @@ class TransformersNlpEngine(SpacyNlpEngine):
             raise ValueError(
                 "transformers model name is missing from model configuration"
             )
+        backend = model.get("backend", "pytorch")
+        if backend not in TransformersNlpEngine.BACKENDS:
+            raise ValueError(
+                f"backend must be one of {TransformersNlpEngine.BACKENDS}, "
+                f"got {backend!r}"
+            )
+        if model.get("quantize") and backend != "onnx":
+            raise ValueError("quantize is only supported by the onnx backend")
+
+    def _create_onnx_pipeline(
+        self,
+        transformers_model: str,
+        tokenizer: Any,
+        quantize: bool = False,
+        onnx_model_dir: Optional[str] = None,
+    ) -> Any:
+        """Create a token classification pipeline running on ONNX Runtime.
+
+        The model is exported to ONNX (and quantized) unless already exported
+        to `onnx_model_dir`.
+        :param transformers_model: The name or path of the transformers model
+        :param tokenizer: The tokenizer of the model
+        :param quantize: Whether to quantize the model's weights to int8
+        :param onnx_model_dir: Directory to save the exported model to and load
+        it from. If None, the model is exported to a temporary directory
+        """
+        file_name = "model_quantized.onnx" if quantize else "model.onnx"
+        with tempfile.TemporaryDirectory(prefix="presidio-onnx-") as temp_dir:
+            model_dir = Path(onnx_model_dir or temp_dir)
+            if not (model_dir / file_name).exists():
+                logger.info(f"Exporting {transformers_model} to ONNX in {model_dir}")
+                ort_model = ORTModelForTokenClassification.from_pretrained(
+                    transformers_model, export=True
+                )
+                ort_model.save_pretrained(model_dir)
+                if quantize:
+                    quantizer = ORTQuantizer.from_pretrained(ort_model)
+                    quantization_config = AutoQuantizationConfig.avx2(
+                        is_static=False, per_channel=False
+                    )
+                    quantizer.quantize(
+                        save_dir=model_dir, quantization_config=quantization_config
+                    )
+
+            # the model is read into the inference session,
+            # so the temporary directory can be removed once it is loaded
+            ort_model = ORTModelForTokenClassification.from_pretrained(
+                model_dir, file_name=file_name
+            )
+
+        return transformers.pipeline(
+            task="token-classification",
+            model=ort_model,
+            tokenizer=tokenizer,
+            aggregation_strategy=self.ner_model_configuration.aggregation_strategy,
+            stride=self.ner_model_configuration.stride,
+        )
+
+    def process_batch(
+        self,
+        texts: Union[List[str], List[Tuple[str, object]]],
+        language: str,
+        batch_size: int = 1,
+        n_process: int = 1,
+        as_tuples: bool = False,
+        capabilities: Optional[Collection[str]] = None,
+    ) -> Generator[
+        Union[Tuple[Any, NlpArtifacts, Any], Tuple[Any, NlpArtifacts]], Any, None
+    ]:
+        """Execute the NLP pipeline on a batch of texts, batched by length.
+
+        Texts are sorted by number of (transformers tokenizer) tokens and grouped
+        into batches of up to `max_batch_tokens` padded tokens, so that the
+        transformers model doesn't process padding tokens of short texts batched
+        with long ones. Each batch is inferred by the model as one batch.
+        The results are returned in the order of the texts.
+
+        If `max_batch_tokens` is None or `n_process` is more than 1,
+        texts are batched in order (see `SpacyNlpEngine.process_batch`).
+        Otherwise `batch_size` is not used, as the token budget sets
+        the size of the batches.
+        See `SpacyNlpEngine.process_batch` for the parameters.
+        """
+        if not self.max_batch_tokens or n_process > 1:
+            yield from super().process_batch(
+                texts,
+                language,
+                batch_size=batch_size,
+                n_process=n_process,
+                as_tuples=as_tuples,
+                capabilities=capabilities,
+            )
+            return
+
+        if not self.nlp:
+            raise ValueError("NLP engine is not loaded. Consider calling .load()")
+
+        if as_tuples:
+            if not all(isinstance(item, tuple) and len(item) == 2 for item in texts):
+                raise ValueError(
+                    "When 'as_tuples' is True, "
+                    "'texts' must be a list of tuples (text, context)."
+                )
+        else:
+            texts = ((text, None) for text in texts)
+
+        nlp = self.nlp[language]
+        disabled_pipes = self._get_disabled_pipes(language, capabilities)
+        hf_pipeline = None
+        if "hf_token_pipe" in nlp.pipe_names and "hf_token_pipe" not in disabled_pipes:
+            hf_pipeline = getattr(nlp.get_pipe("hf_token_pipe"), "hf_pipeline", None)
+        texts = iter(texts)
+        while True:
+            window = list(islice(texts, self.LENGTH_SORTING_WINDOW))
+            if not window:
+                return
+
+            docs = [nlp.make_doc(str(text)) for text, _ in window]
+            if hf_pipeline is not None:
+                lengths = self._get_model_lengths(
+                    hf_pipeline.tokenizer, [doc.text for doc in docs]
+                )
+            else:
+                lengths = [len(doc) for doc in docs]
+            batches = self._get_length_batches(lengths, self.max_batch_tokens)
+            for batch in batches:
+                batch_docs = nlp.pipe(
+                    [docs[index] for index in batch],
+                    batch_size=len(batch),
+                    disable=disabled_pipes,
+                )
+                if hf_pipeline is None:
+                    for index, doc in zip(batch, batch_docs):
+                        docs[index] = doc
+                    continue
+
+                # hf_token_pipe calls the transformers pipeline without a
+                # batch_size, which then infers its default batch size of texts
+                # at once: set it to the batch, while the batch is processed
+                default_batch_size = hf_pipeline._batch_size
+                hf_pipeline._batch_size = len(batch)
+                try:
+                    for index, doc in zip(batch, batch_docs):
+                        docs[index] = doc
+                finally:
+                    hf_pipeline._batch_size = default_batch_size
+
+            for doc, (_, context) in zip(docs, window):
+                nlp_artifacts = self._doc_to_nlp_artifact(doc, language, capabilities)
+                if as_tuples:
+                    yield doc.text, nlp_artifacts, context
+                else:
+                    yield doc.text, nlp_artifacts
+
+    @staticmethod
+    def _get_model_lengths(tokenizer: Any, texts: List[str]) -> List[int]:
+        """Return the number of tokens the transformers model infers per text.
+
+        :param tokenizer: The tokenizer of the transformers model
+        :param texts: The texts
+        :return: The number of tokens of each text, including special tokens,
+        and at most the maximum length of the model, as longer texts are
+        split into windows of this length
+        """
+        if not texts:
+            return []
+        input_ids = tokenizer(texts, add_special_tokens=True, verbose=False)[
+            "input_ids"
+        ]
+        max_length = getattr(tokenizer, "model_max_length", None) or 0
+        # tokenizers without a maximum length report a very large number
+        if not 0 < max_length < 1_000_000:
+            return [len(ids) for ids in input_ids]
+        return [min(len(ids), max_length) for ids in input_ids]
+
+    @staticmethod
+    def _get_length_batches(
+        lengths: List[int], max_batch_tokens: int
+    ) -> List[List[int]]:
+        """Group texts into batches of similar lengths within a budget of tokens.
+
+        The texts are sorted by length, and each batch is filled while its texts,
+        padded to its longest text, hold at most `max_batch_tokens` tokens.
+        A text longer than the budget is batched alone.
+        :param lengths: The number of tokens of each text
+        :param max_batch_tokens: The maximum number of padded tokens of a batch
+        :return: The indices of the texts of each batch
+        """
+        batches = []
+        batch = []
+        for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+            # the texts are sorted, so this text is the longest of the batch
+            padded_tokens = (len(batch) + 1) * max(lengths[index], 1)
+            if batch and padded_tokens > max_batch_tokens:
+                batches.append(batch)
+                batch = []
+            batch.append(index)
+        if batch:
+            batches.append(batch)
+        return batches
 
     def _get_entities(self, doc: Doc) -> List[Span]:
         """
@@ -1,5 +1,6 @@
 import datetime
 import logging
+from functools import partial
 from typing import Dict, List, Optional
 
 import regex as re
@@ -11,6 +12,7 @@ from presidio_analyzer import (
     Pattern,
     RecognizerResult,
 )
+from presidio_analyzer.deny_list_matcher import DenyListMatcher
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -30,6 +32,12 @@ class PatternRecognizer(LocalRecognizer):
     including deny-lists.
     """
 
+    nlp_capabilities = frozenset()
+
+    # Deny lists of at least this size are matched with a DenyListMatcher
+    # instead of a regex, as the regex gets slow with many terms
+    DENY_LIST_MATCHER_THRESHOLD = 100
+
     def __init__(
         self,
         supported_entity: str,
@@ -65,10 +73,15 @@ class PatternRecognizer(LocalRecognizer):
         self.deny_list_score = deny_list_score
         self.global_regex_flags = global_regex_flags
 
+        self._deny_list_pattern = None
+        self._deny_list_matcher = None
         if deny_list:
             deny_list_pattern = self._deny_list_to_regex(deny_list)
             self.patterns.append(deny_list_pattern)
             self.deny_list = deny_list
+            if len(deny_list) >= self.DENY_LIST_MATCHER_THRESHOLD:
+                self._deny_list_pattern = deny_list_pattern
+                self._deny_list_matcher = DenyListMatcher(deny_list)
         else:
             self.deny_list = []
 
@@ -94,7 +107,7 @@ class PatternRecognizer(LocalRecognizer):
         results = []
 
         if self.patterns:
-            pattern_result = self.__analyze_patterns(text, regex_flags)
+            pattern_result = self._analyze_patterns(text, regex_flags)
             results.extend(pattern_result)
 
         return results
@@ -171,8 +184,56 @@ class PatternRecognizer(LocalRecognizer):
         )
         return explanation
 
-    def __analyze_patterns(
-        self, text: str, flags: int = None
+    def __build_explanation(
+        self,
+        pattern: Pattern,
+        validation_result: Optional[bool],
+        flags: int,
+        score: float,
+    ) -> AnalysisExplanation:
+        explanation = self.build_regex_explanation(
+            self.name,
+            pattern.name,
+            pattern.regex,
+            pattern.score,
+            validation_result,
+            flags,
+        )
+        # Update analysis explanation score following validation or invalidation
+        explanation.score = score
+        return explanation
+
+    def compile_patterns(self, flags: Optional[int] = None) -> None:
+        """
+        Compile the regexes of the patterns ahead of analysis.
+
+        Otherwise, each regex is compiled the first time it is matched.
+
+        :param flags: regex flags the patterns will be matched with,
+        defaults to the recognizer's global_regex_flags
+        """
+        flags = flags if flags else self.global_regex_flags
+        for pattern in self.patterns:
+            if (
+                pattern is self._deny_list_pattern
+                and DenyListMatcher.supports_flags(flags)
+            ):
+                continue
+            self.__get_compiled_regex(pattern, flags)
+
+    @staticmethod
+    def __get_compiled_regex(pattern: Pattern, flags: Optional[int]) -> re.Pattern:
+        # Compile regex if flags differ from flags the regex was compiled with
+        if not pattern.compiled_regex or pattern.compiled_with_flags != flags:
+            pattern.compiled_with_flags = flags
+            pattern.compiled_regex = re.compile(pattern.regex, flags=flags)
+        return pattern.compiled_regex
+
+    def _analyze_patterns(
+        self,
+        text: str,
+        flags: int = None,
+        patterns: Optional[List[Pattern]] = None,
     ) -> List[RecognizerResult]:
         """
         Evaluate all patterns in the provided text.
@@ -181,19 +242,28 @@ class PatternRecognizer(LocalRecognizer):
 
         :param text: text to analyze
         :param flags: regex flags
+        :param patterns: subset of this recognizer's patterns to evaluate,
+        for example the candidates found by a MultiPatternScanner.
+        If None, all patterns are evaluated.
         :return: A list of RecognizerResult
         """
         flags = flags if flags else self.global_regex_flags
+        patterns = self.patterns if patterns is None else patterns
         results = []
-        for pattern in self.patterns:
+        for pattern in patterns:
             match_start_time = datetime.datetime.now()
 
-            # Compile regex if flags differ from flags the regex was compiled with
-            if not pattern.compiled_regex or pattern.compiled_with_flags != flags:
-                pattern.compiled_with_flags = flags
-                pattern.compiled_regex = re.compile(pattern.regex, flags=flags)
+            if (
+                pattern is self._deny_list_pattern
+                and DenyListMatcher.supports_flags(flags)
+            ):
+                spans = self._deny_list_matcher.finditer(
+                    text, ignore_case=bool(flags and flags & re.IGNORECASE)
+                )
+            else:
+                matches = self.__get_compiled_regex(pattern, flags).finditer(text)
+                spans = (match.span() for match in matches)
 
-            matches = pattern.compiled_regex.finditer(text)
             match_time = datetime.datetime.now() - match_start_time
             logger.debug(
                 "--- match_time[%s]: %.6f seconds",
@@ -201,8 +271,7 @@ class PatternRecognizer(LocalRecognizer):
                 match_time.total_seconds()
             )
 
-            for match in matches:
-                start, end = match.span()
+            for start, end in spans:
                 current_match = text[start:end]
 
                 # Skip empty results
@@ -212,41 +281,33 @@ class PatternRecognizer(LocalRecognizer):
                 score = pattern.score
 
                 validation_result = self.validate_result(current_match)
-                description = self.build_regex_explanation(
-                    self.name,
-                    pattern.name,
-                    pattern.regex,
-                    score,
-                    validation_result,
-                    flags,
-                )
-                pattern_result = RecognizerResult(
-                    entity_type=self.supported_entities[0],
-                    start=start,
-                    end=end,
-                    score=score,
-                    analysis_explanation=description,
-                    recognition_metadata={
-                        RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
-                        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
-                    },
-                )
-
                 if validation_result is not None:
                     if validation_result:
-                        pattern_result.score = EntityRecognizer.MAX_SCORE
+                        score = EntityRecognizer.MAX_SCORE
                     else:
-                        pattern_result.score = EntityRecognizer.MIN_SCORE
+                        score = EntityRecognizer.MIN_SCORE
 
                 invalidation_result = self.invalidate_result(current_match)
                 if invalidation_result is not None and invalidation_result:
-                    pattern_result.score = EntityRecognizer.MIN_SCORE
+                    score = EntityRecognizer.MIN_SCORE
 
-                if pattern_result.score > EntityRecognizer.MIN_SCORE:
-                    results.append(pattern_result)
+                if score <= EntityRecognizer.MIN_SCORE:
+                    continue
 
-                # Update analysis explanation score following validation or invalidation
-                description.score = pattern_result.score
+                # the explanation is built only if it's used,
+                # with the score following validation or invalidation
+                description = partial(
+                    self.__build_explanation, pattern, validation_result, flags, score
+                )
+                pattern_result = RecognizerResult(
+                    entity_type=self.supported_entities[0],
+                    start=start,
+                    end=end,
+                    score=score,
+                    analysis_explanation=description,
+                    recognition_metadata=self.get_recognition_metadata(),
+                )
+                results.append(pattern_result)
 
         results = EntityRecognizer.remove_duplicates(results)
         return results
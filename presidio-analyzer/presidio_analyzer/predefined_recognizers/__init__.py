@@ -1,86 +1,151 @@
 """Predefined recognizers package. Holds all the default recognizers."""
 
-
-# Australia recognizers
-from presidio_analyzer.predefined_recognizers.nlp_engine_recognizers.transformers_recognizer import (  #noqa: E501
-    TransformersRecognizer,
-)
-
-from .country_specific.australia.au_abn_recognizer import AuAbnRecognizer
-from .country_specific.australia.au_acn_recognizer import AuAcnRecognizer
-from .country_specific.australia.au_medicare_recognizer import AuMedicareRecognizer
-from .country_specific.australia.au_tfn_recognizer import AuTfnRecognizer
-
-# Finland recognizers
-from .country_specific.finland.fi_personal_identity_code_recognizer import (
-    FiPersonalIdentityCodeRecognizer,
-)
-from .country_specific.india import (
-    InVehicleRegistrationRecognizer,
-)
-
-# India recognizers
-from .country_specific.india.in_aadhaar_recognizer import InAadhaarRecognizer
-from .country_specific.india.in_pan_recognizer import InPanRecognizer
-from .country_specific.india.in_passport_recognizer import InPassportRecognizer
-from .country_specific.india.in_voter_recognizer import InVoterRecognizer
-
-# Italy recognizers
-from .country_specific.italy.it_driver_license_recognizer import (
-    ItDriverLicenseRecognizer,
-)
-from .country_specific.italy.it_fiscal_code_recognizer import ItFiscalCodeRecognizer
-from .country_specific.italy.it_identity_card_recognizer import ItIdentityCardRecognizer
-from .country_specific.italy.it_passport_recognizer import ItPassportRecognizer
-from .country_specific.italy.it_vat_code import ItVatCodeRecognizer
-
-# Korea recognizers
-from .country_specific.korea.kr_rrn_recognizer import KrRrnRecognizer
-
-# Poland recognizers
-from .country_specific.poland.pl_pesel_recognizer import PlPeselRecognizer
-
-# Singapore recognizers
-from .country_specific.singapore.sg_fin_recognizer import SgFinRecognizer
-from .country_specific.singapore.sg_uen_recognizer import SgUenRecognizer
-
-# Spain recognizers
-from .country_specific.spain.es_nie_recognizer import EsNieRecognizer
-from .country_specific.spain.es_nif_recognizer import EsNifRecognizer
-
-# UK recognizers
-from .country_specific.uk.uk_nhs_recognizer import NhsRecognizer
-from .country_specific.uk.uk_nino_recognizer import UkNinoRecognizer
-
-# US recognizers
-from .country_specific.us.aba_routing_recognizer import AbaRoutingRecognizer
-from .country_specific.us.medical_license_recognizer import MedicalLicenseRecognizer
-from .country_specific.us.us_bank_recognizer import UsBankRecognizer
-from .country_specific.us.us_driver_license_recognizer import UsLicenseRecognizer
-from .country_specific.us.us_itin_recognizer import UsItinRecognizer
-from .country_specific.us.us_passport_recognizer import UsPassportRecognizer
-from .country_specific.us.us_ssn_recognizer import UsSsnRecognizer
-
-# Generic recognizers
-from .generic.credit_card_recognizer import CreditCardRecognizer
-from .generic.crypto_recognizer import CryptoRecognizer
-from .generic.date_recognizer import DateRecognizer
-from .generic.email_recognizer import EmailRecognizer
-from .generic.iban_recognizer import IbanRecognizer
-from .generic.ip_recognizer import IpRecognizer
-from .generic.phone_recognizer import PhoneRecognizer
-from .generic.url_recognizer import UrlRecognizer
-
-# NER recognizers
-from .ner.gliner_recognizer import GLiNERRecognizer
-
-# NLP Engine recognizers
-from .nlp_engine_recognizers.spacy_recognizer import SpacyRecognizer
-from .nlp_engine_recognizers.stanza_recognizer import StanzaRecognizer
-from .third_party.ahds_recognizer import AzureHealthDeidRecognizer
-
-# Third-party recognizers
-from .third_party.azure_ai_language import AzureAILanguageRecognizer
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Australia recognizers
+    from .country_specific.australia.au_abn_recognizer import AuAbnRecognizer
+    from .country_specific.australia.au_acn_recognizer import AuAcnRecognizer
+    from .country_specific.australia.au_medicare_recognizer import AuMedicareRecognizer
+    from .country_specific.australia.au_tfn_recognizer import AuTfnRecognizer
+
+    # Finland recognizers
+    from .country_specific.finland.fi_personal_identity_code_recognizer import (
+        FiPersonalIdentityCodeRecognizer,
+    )
+
+    # India recognizers
+    from .country_specific.india.in_aadhaar_recognizer import InAadhaarRecognizer
+    from .country_specific.india.in_pan_recognizer import InPanRecognizer
+    from .country_specific.india.in_passport_recognizer import InPassportRecognizer
+    from .country_specific.india.in_vehicle_registration_recognizer import (
+        InVehicleRegistrationRecognizer,
+    )
+    from .country_specific.india.in_voter_recognizer import InVoterRecognizer
+
+    # Italy recognizers
+    from .country_specific.italy.it_driver_license_recognizer import (
+        ItDriverLicenseRecognizer,
+    )
+    from .country_specific.italy.it_fiscal_code_recognizer import ItFiscalCodeRecognizer
+    from .country_specific.italy.it_identity_card_recognizer import (
+        ItIdentityCardRecognizer,
+    )
+    from .country_specific.italy.it_passport_recognizer import ItPassportRecognizer
+    from .country_specific.italy.it_vat_code import ItVatCodeRecognizer
+
+    # Korea recognizers
+    from .country_specific.korea.kr_rrn_recognizer import KrRrnRecognizer
+
+    # Poland recognizers
+    from .country_specific.poland.pl_pesel_recognizer import PlPeselRecognizer
+
+    # Singapore recognizers
+    from .country_specific.singapore.sg_fin_recognizer import SgFinRecognizer
+    from .country_specific.singapore.sg_uen_recognizer import SgUenRecognizer
+
+    # Spain recognizers
+    from .country_specific.spain.es_nie_recognizer import EsNieRecognizer
+    from .country_specific.spain.es_nif_recognizer import EsNifRecognizer
+
+    # UK recognizers
+    from .country_specific.uk.uk_nhs_recognizer import NhsRecognizer
+    from .country_specific.uk.uk_nino_recognizer import UkNinoRecognizer
+
+    # US recognizers
+    from .country_specific.us.aba_routing_recognizer import AbaRoutingRecognizer
+    from .country_specific.us.medical_license_recognizer import MedicalLicenseRecognizer
+    from .country_specific.us.us_bank_recognizer import UsBankRecognizer
+    from .country_specific.us.us_driver_license_recognizer import UsLicenseRecognizer
+    from .country_specific.us.us_itin_recognizer import UsItinRecognizer
+    from .country_specific.us.us_passport_recognizer import UsPassportRecognizer
+    from .country_specific.us.us_ssn_recognizer import UsSsnRecognizer
+
+    # Generic recognizers
+    from .generic.credit_card_recognizer import CreditCardRecognizer
+    from .generic.crypto_recognizer import CryptoRecognizer
+    from .generic.date_recognizer import DateRecognizer
+    from .generic.email_recognizer import EmailRecognizer
+    from .generic.iban_recognizer import IbanRecognizer
+    from .generic.ip_recognizer import IpRecognizer
+    from .generic.phone_recognizer import PhoneRecognizer
+    from .generic.url_recognizer import UrlRecognizer
+
+    # NER recognizers
+    from .ner.gliner_recognizer import GLiNERRecognizer
+
+    # NLP Engine recognizers
+    from .nlp_engine_recognizers.spacy_recognizer import SpacyRecognizer
+    from .nlp_engine_recognizers.stanza_recognizer import StanzaRecognizer
+    from .nlp_engine_recognizers.transformers_recognizer import TransformersRecognizer
+
+    # Third-party recognizers
+    from .third_party.ahds_recognizer import AzureHealthDeidRecognizer
+    from .third_party.azure_ai_language import AzureAILanguageRecognizer
+
+# The recognizers are only imported when first accessed,
+# as some of them import heavy or optional libraries (e.g. phonenumbers, azure)
+_LAZY_IMPORTS = {
+    # Australia recognizers
+    "AuAbnRecognizer": ".country_specific.australia.au_abn_recognizer",
+    "AuAcnRecognizer": ".country_specific.australia.au_acn_recognizer",
+    "AuMedicareRecognizer": ".country_specific.australia.au_medicare_recognizer",
+    "AuTfnRecognizer": ".country_specific.australia.au_tfn_recognizer",
+    # Finland recognizers
+    "FiPersonalIdentityCodeRecognizer": ".country_specific.finland.fi_personal_identity_code_recognizer",  # noqa: E501
+    # India recognizers
+    "InAadhaarRecognizer": ".country_specific.india.in_aadhaar_recognizer",
+    "InPanRecognizer": ".country_specific.india.in_pan_recognizer",
+    "InPassportRecognizer": ".country_specific.india.in_passport_recognizer",
+    "InVehicleRegistrationRecognizer": ".country_specific.india.in_vehicle_registration_recognizer",  # noqa: E501
+    "InVoterRecognizer": ".country_specific.india.in_voter_recognizer",
+    # Italy recognizers
+    "ItDriverLicenseRecognizer": ".country_specific.italy.it_driver_license_recognizer",
+    "ItFiscalCodeRecognizer": ".country_specific.italy.it_fiscal_code_recognizer",
+    "ItIdentityCardRecognizer": ".country_specific.italy.it_identity_card_recognizer",
+    "ItPassportRecognizer": ".country_specific.italy.it_passport_recognizer",
+    "ItVatCodeRecognizer": ".country_specific.italy.it_vat_code",
+    # Korea recognizers
+    "KrRrnRecognizer": ".country_specific.korea.kr_rrn_recognizer",
+    # Poland recognizers
+    "PlPeselRecognizer": ".country_specific.poland.pl_pesel_recognizer",
+    # Singapore recognizers
+    "SgFinRecognizer": ".country_specific.singapore.sg_fin_recognizer",
+    "SgUenRecognizer": ".country_specific.singapore.sg_uen_recognizer",
+    # Spain recognizers
+    "EsNieRecognizer": ".country_specific.spain.es_nie_recognizer",
+    "EsNifRecognizer": ".country_specific.spain.es_nif_recognizer",
+    # UK recognizers
+    "NhsRecognizer": ".country_specific.uk.uk_nhs_recognizer",
+    "UkNinoRecognizer": ".country_specific.uk.uk_nino_recognizer",
+    # US recognizers
+    "AbaRoutingRecognizer": ".country_specific.us.aba_routing_recognizer",
+    "MedicalLicenseRecognizer": ".country_specific.us.medical_license_recognizer",
+    "UsBankRecognizer": ".country_specific.us.us_bank_recognizer",
+    "UsLicenseRecognizer": ".country_specific.us.us_driver_license_recognizer",
+    "UsItinRecognizer": ".country_specific.us.us_itin_recognizer",
+    "UsPassportRecognizer": ".country_specific.us.us_passport_recognizer",
+    "UsSsnRecognizer": ".country_specific.us.us_ssn_recognizer",
+    # Generic recognizers
+    "CreditCardRecognizer": ".generic.credit_card_recognizer",
+    "CryptoRecognizer": ".generic.crypto_recognizer",
+    "DateRecognizer": ".generic.date_recognizer",
+    "EmailRecognizer": ".generic.email_recognizer",
+    "IbanRecognizer": ".generic.iban_recognizer",
+    "IpRecognizer": ".generic.ip_recognizer",
+    "PhoneRecognizer": ".generic.phone_recognizer",
+    "UrlRecognizer": ".generic.url_recognizer",
+    # NER recognizers
+    "GLiNERRecognizer": ".ner.gliner_recognizer",
+    # NLP Engine recognizers
+    "SpacyRecognizer": ".nlp_engine_recognizers.spacy_recognizer",
+    "StanzaRecognizer": ".nlp_engine_recognizers.stanza_recognizer",
+    "TransformersRecognizer": ".nlp_engine_recognizers.transformers_recognizer",
+    # Third-party recognizers
+    "AzureHealthDeidRecognizer": ".third_party.ahds_recognizer",
+    "AzureAILanguageRecognizer": ".third_party.azure_ai_language",
+}
 
 PREDEFINED_RECOGNIZERS = [
     "PhoneRecognizer",
@@ -94,10 +159,11 @@ PREDEFINED_RECOGNIZERS = [
     "UrlRecognizer",
 ]
 
-NLP_RECOGNIZERS = {
-    "spacy": SpacyRecognizer,
-    "stanza": StanzaRecognizer,
-    "transformers": TransformersRecognizer,
+# Names of the NLP recognizers classes, per NLP engine name
+_NLP_RECOGNIZER_NAMES = {
+    "spacy": "SpacyRecognizer",
+    "stanza": "StanzaRecognizer",
+    "transformers": "TransformersRecognizer",
 }
 
 __all__ = [
@@ -147,3 +213,24 @@ __all__ = [
     "AzureHealthDeidRecognizer",
     "KrRrnRecognizer",
 ]
+
+
+def __getattr__(name: str):
+    """Import the recognizers (and NLP_RECOGNIZERS) on first access."""
+    if name == "NLP_RECOGNIZERS":
+        value = {
+            engine_name: __getattr__(recognizer_name)
+            for engine_name, recognizer_name in _NLP_RECOGNIZER_NAMES.items()
+        }
+    elif name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the attributes of the module, including the lazily imported ones."""
+    return sorted([*globals(), *_LAZY_IMPORTS, "NLP_RECOGNIZERS"])
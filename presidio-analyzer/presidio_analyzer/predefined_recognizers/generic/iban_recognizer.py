@@ -1,5 +1,6 @@
 import logging
 import string
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
 import regex as re
@@ -150,7 +151,8 @@ class IbanRecognizer(PatternRecognizer):
                     score = pattern.score
 
                     validation_result = self.validate_result(current_match)
-                    description = PatternRecognizer.build_regex_explanation(
+                    description = partial(
+                        PatternRecognizer.build_regex_explanation,
                         self.name,
                         pattern.name,
                         pattern.regex,
@@ -164,10 +166,7 @@ class IbanRecognizer(PatternRecognizer):
                         end=end,
                         score=score,
                         analysis_explanation=description,
-                        recognition_metadata={
-                            RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
-                            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
-                        },
+                        recognition_metadata=self.get_recognition_metadata(),
                     )
 
                     if validation_result is not None:
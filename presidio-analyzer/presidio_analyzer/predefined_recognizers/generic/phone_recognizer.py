@@ -1,3 +1,4 @@
+from functools import partial
 from typing import List, Optional
 
 import phonenumbers
@@ -24,6 +25,7 @@ class PhoneRecognizer(LocalRecognizer):
     """
 
     SCORE = 0.4
+    nlp_capabilities = frozenset()
     CONTEXT = ["phone", "number", "telephone", "cell", "cellphone", "mobile", "call"]
     DEFAULT_SUPPORTED_REGIONS = ("US", "UK", "DE", "FE", "IL", "IN", "CA", "BR")
 
@@ -86,11 +88,8 @@ class PhoneRecognizer(LocalRecognizer):
             start=match.start,
             end=match.end,
             score=self.SCORE,
-            analysis_explanation=self._get_analysis_explanation(region),
-            recognition_metadata={
-                RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
-                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
-            },
+            analysis_explanation=partial(self._get_analysis_explanation, region),
+            recognition_metadata=self.get_recognition_metadata(),
         )
 
         return result
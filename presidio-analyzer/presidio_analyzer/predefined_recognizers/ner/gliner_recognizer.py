@@ -1,11 +1,13 @@
 import json
 import logging
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 from presidio_analyzer import (
     AnalysisExplanation,
     LocalRecognizer,
     RecognizerResult,
+    TextChunker,
 )
 from presidio_analyzer.nlp_engine import NerModelConfiguration, NlpArtifacts
 
@@ -22,6 +24,8 @@ logger = logging.getLogger("presidio-analyzer")
 class GLiNERRecognizer(LocalRecognizer):
     """GLiNER model based entity recognizer."""
 
+    nlp_capabilities = frozenset()
+
     def __init__(
         self,
         supported_entities: Optional[List[str]] = None,
@@ -35,6 +39,10 @@ class GLiNERRecognizer(LocalRecognizer):
         multi_label: bool = False,
         threshold: float = 0.30,
         map_location: str = "cpu",
+        chunk_size: Optional[int] = 384,
+        chunk_overlap: int = 50,
+        load_onnx_model: bool = False,
+        onnx_model_file: str = "model.onnx",
     ):
         """GLiNER model based entity recognizer.
 
@@ -54,7 +62,18 @@ class GLiNERRecognizer(LocalRecognizer):
         :param threshold: The threshold for the model's output
         (see GLiNER's documentation)
         :param map_location: The device to use for the model
-
+        :param chunk_size: Maximum number of words passed to the model at once.
+        Longer texts are split into overlapping chunks, preferably at sentence
+        boundaries, which are inferred as a single batch.
+        Defaults to GLiNER's default maximum length. None disables chunking
+        (the model then truncates long texts)
+        :param chunk_overlap: Number of words shared by consecutive chunks.
+        Entities of up to this length crossing a chunk boundary are found whole
+        :param load_onnx_model: Whether to run the model with ONNX Runtime
+        instead of PyTorch. The model repository or directory must hold
+        an ONNX export of the model (see GLiNER's convert_to_onnx)
+        :param onnx_model_file: The ONNX file of the model, e.g.
+        "model_quantized.onnx" for an int8 quantized export
 
         """
 
@@ -86,6 +105,13 @@ class GLiNERRecognizer(LocalRecognizer):
         self.flat_ner = flat_ner
         self.multi_label = multi_label
         self.threshold = threshold
+        self.load_onnx_model = load_onnx_model
+        self.onnx_model_file = onnx_model_file
+        self.text_chunker = (
+            TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+            if chunk_size
+            else None
+        )
 
         self.gliner = None
 
@@ -103,7 +129,15 @@ class GLiNERRecognizer(LocalRecognizer):
         """Load the GLiNER model."""
         if not GLiNER:
             raise ImportError("GLiNER is not installed. Please install it.")
-        self.gliner = GLiNER.from_pretrained(self.model_name)
+        if self.load_onnx_model:
+            self.gliner = GLiNER.from_pretrained(
+                self.model_name,
+                load_onnx_model=True,
+                load_tokenizer=True,
+                onnx_model_file=self.onnx_model_file,
+            )
+        else:
+            self.gliner = GLiNER.from_pretrained(self.model_name)
 
     def analyze(
         self,
@@ -118,6 +152,10 @@ class GLiNERRecognizer(LocalRecognizer):
         :param nlp_artifacts: N/A for this recognizer
         """
 
+        chunks = self.__chunk(text)
+        if len(chunks) > 1:
+            return self.analyze_batch([text], entities)[0]
+
         # combine the input labels as this model allows for ad-hoc labels
         labels = self.__create_input_labels(entities)
 
@@ -128,6 +166,97 @@ class GLiNERRecognizer(LocalRecognizer):
             threshold=self.threshold,
             multi_label=self.multi_label,
         )
+        return self.__to_recognizer_results(predictions, entities)
+
+    def analyze_batch(
+        self,
+        texts: List[str],
+        entities: List[str],
+        nlp_artifacts_list: Optional[List[Optional[NlpArtifacts]]] = None,
+    ) -> List[List[RecognizerResult]]:
+        """Analyze several texts in a single GLiNER batch prediction.
+
+        Long texts are split into chunks, which are all part of the batch.
+        Their results are mapped back to the offsets of the text,
+        and entities found in the overlap of two chunks are de-duplicated.
+
+        :param texts: The texts to be analyzed
+        :param entities: The list of entities this recognizer is requested to return
+        :param nlp_artifacts_list: N/A for this recognizer
+        :return: The results per text
+        """
+        if not texts:
+            return []
+
+        labels = self.__create_input_labels(entities)
+
+        chunks_per_text = [self.__chunk(text) for text in texts]
+        chunk_texts = [
+            text[start:end]
+            for text, chunks in zip(texts, chunks_per_text)
+            for start, end in chunks
+        ]
+
+        batch_predictions = iter(
+            self.gliner.batch_predict_entities(
+                texts=chunk_texts,
+                labels=labels,
+                flat_ner=self.flat_ner,
+                threshold=self.threshold,
+                multi_label=self.multi_label,
+            )
+        )
+
+        results = []
+        for chunks in chunks_per_text:
+            chunk_results = [
+                self.__to_recognizer_results(next(batch_predictions), entities, start)
+                for start, _ in chunks
+            ]
+            if len(chunk_results) == 1:
+                results.append(chunk_results[0])
+            else:
+                results.append(self.__merge_chunk_results(chunk_results))
+        return results
+
+    def __chunk(self, text: str) -> List[Tuple[int, int]]:
+        if not self.text_chunker:
+            return [(0, len(text))]
+        return self.text_chunker.chunk(text)
+
+    @staticmethod
+    def __merge_chunk_results(
+        chunk_results: List[List[RecognizerResult]],
+    ) -> List[RecognizerResult]:
+        """Merge the results of a text's chunks, which overlap.
+
+        An entity found in two chunks (possibly cut by the boundary of one of them)
+        is kept once, with its longest span, then highest score.
+        """
+        merged = []  # (chunk index, result)
+        for index, results in enumerate(chunk_results):
+            for result in results:
+                duplicates = [
+                    kept
+                    for kept in merged
+                    if kept[0] != index
+                    and kept[1].entity_type == result.entity_type
+                    and kept[1].intersects(result)
+                ]
+                if any(
+                    (kept.end - kept.start, kept.score)
+                    >= (result.end - result.start, result.score)
+                    for _, kept in duplicates
+                ):
+                    continue
+                merged = [kept for kept in merged if kept not in duplicates]
+                merged.append((index, result))
+
+        return [result for _, result in merged]
+
+    def __to_recognizer_results(
+        self, predictions: List[Dict], entities: List[str], offset: int = 0
+    ) -> List[RecognizerResult]:
         recognizer_results = []
         for prediction in predictions:
             presidio_entity = self.model_to_presidio_entity_mapping.get(
@@ -136,17 +265,15 @@ class GLiNERRecognizer(LocalRecognizer):
             if entities and presidio_entity not in entities:
                 continue
 
-            analysis_explanation = AnalysisExplanation(
-                recognizer=self.name,
-                original_score=prediction["score"],
-                textual_explanation=f"Identified as {presidio_entity} by GLiNER",
+            analysis_explanation = partial(
+                self.__build_explanation, presidio_entity, prediction["score"]
             )
 
             recognizer_results.append(
                 RecognizerResult(
                     entity_type=presidio_entity,
-                    start=prediction["start"],
-                    end=prediction["end"],
+                    start=prediction["start"] + offset,
+                    end=prediction["end"] + offset,
                     score=prediction["score"],
                     analysis_explanation=analysis_explanation,
                 )
@@ -154,6 +281,15 @@ class GLiNERRecognizer(LocalRecognizer):
 
         return recognizer_results
 
+    def __build_explanation(
+        self, presidio_entity: str, original_score: float
+    ) -> AnalysisExplanation:
+        return AnalysisExplanation(
+            recognizer=self.name,
+            original_score=original_score,
+            textual_explanation=f"Identified as {presidio_entity} by GLiNER",
+        )
+
     def __create_input_labels(self, entities):
         """Append the entities requested by the user to the list of labels if it's not there."""  # noqa: E501
         labels = self.gliner_labels
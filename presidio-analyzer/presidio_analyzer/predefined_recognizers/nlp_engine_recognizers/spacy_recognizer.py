@@ -1,5 +1,6 @@
 import logging
 import warnings
+from functools import partial
 from typing import List, Optional, Set, Tuple
 
 from presidio_analyzer import (
@@ -23,6 +24,8 @@ class SpacyRecognizer(LocalRecognizer):
 
     ENTITIES = ["DATE_TIME", "NRP", "LOCATION", "PERSON", "ORGANIZATION"]
 
+    nlp_capabilities = frozenset({"entities"})
+
     DEFAULT_EXPLANATION = "Identified as {} by Spacy's Named Entity Recognition"
 
     # deprecated, use MODEL_TO_PRESIDIO_MAPPING in NerModelConfiguration instead
@@ -114,17 +117,16 @@ class SpacyRecognizer(LocalRecognizer):
                 continue
 
             textual_explanation = self.DEFAULT_EXPLANATION.format(ner_entity.label_)
-            explanation = self.build_explanation(ner_score, textual_explanation)
+            explanation = partial(
+                self.build_explanation, ner_score, textual_explanation
+            )
             spacy_result = RecognizerResult(
                 entity_type=ner_entity.label_,
                 start=ner_entity.start_char,
                 end=ner_entity.end_char,
                 score=ner_score,
                 analysis_explanation=explanation,
-                recognition_metadata={
-                    RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
-                    RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
-                },
+                recognition_metadata=self.get_recognition_metadata(),
             )
             results.append(spacy_result)
 
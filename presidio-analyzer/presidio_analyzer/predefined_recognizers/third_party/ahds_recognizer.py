@@ -1,4 +1,5 @@
 import os
+from functools import partial
 from typing import List, Optional
 
 try:
@@ -23,6 +24,8 @@ from presidio_analyzer.nlp_engine import NlpArtifacts
 class AzureHealthDeidRecognizer(RemoteRecognizer):
     """Wrapper for PHI detection using Azure Health Data Services de-identification."""
 
+    nlp_capabilities = frozenset()
+
     def __init__(
         self,
         supported_entities: Optional[List[str]] = None,
@@ -119,8 +122,8 @@ class AzureHealthDeidRecognizer(RemoteRecognizer):
                 category = entity.category.upper()
                 if category not in [e.upper() for e in entities]:
                     continue
-                analysis_explanation = AzureHealthDeidRecognizer._build_explanation(
-                    entity_type=category
+                analysis_explanation = partial(
+                    AzureHealthDeidRecognizer._build_explanation, entity_type=category
                 )
                 recognizer_results.append(
                     RecognizerResult(
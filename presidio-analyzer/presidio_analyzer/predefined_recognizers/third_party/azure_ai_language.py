@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import partial
 from typing import List, Optional
 
 try:
@@ -18,6 +19,12 @@ logger = logging.getLogger("presidio-analyzer")
 class AzureAILanguageRecognizer(RemoteRecognizer):
     """Wrapper for PII detection using Azure AI Language."""
 
+    nlp_capabilities = frozenset()
+
+    # Limits of a single PII detection request
+    MAX_BATCH_DOCUMENTS = 5
+    MAX_BATCH_CHARACTERS = 125000
+
     def __init__(
         self,
         supported_entities: Optional[List[str]] = None,
@@ -37,11 +44,14 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         the client will be created using the key and endpoint.
         :param azure_ai_key: Azure AI for language key
         :param azure_ai_endpoint: Azure AI for language endpoint
-        :param kwargs: Additional arguments required by the parent class
+        :param kwargs: Additional arguments required by the parent class,
+        e.g. the `analyze_batch` limits (by default, the service's limits)
 
         For more info, see https://learn.microsoft.com/en-us/azure/ai-services/language-service/personally-identifiable-information/overview
         """  # noqa E501
 
+        kwargs.setdefault("max_batch_documents", self.MAX_BATCH_DOCUMENTS)
+        kwargs.setdefault("max_batch_characters", self.MAX_BATCH_CHARACTERS)
         super().__init__(
             supported_entities=supported_entities,
             supported_language=supported_language,
@@ -119,35 +129,54 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         :param nlp_artifacts: Object of type NlpArtifacts, not used in this recognizer.
         :return: A list of RecognizerResult, one per each entity found in the text.
         """
+        return self.analyze_documents([text], entities)[0]
+
+    def analyze_documents(
+        self, texts: List[str], entities: List[str] = None
+    ) -> List[List[RecognizerResult]]:
+        """
+        Analyze several texts using a single Azure AI Language request.
+
+        :param texts: Texts to analyze
+        :param entities: List of entities to return
+        :return: A list of RecognizerResult per text, in the texts order.
+        """
         if not entities:
             entities = self.supported_entities
         response = self.ta_client.recognize_pii_entities(
-            [text], language=self.supported_language
+            texts, language=self.supported_language
         )
-        results = [doc for doc in response if not doc.is_error]
+        return [
+            [] if doc.is_error else self.__to_recognizer_results(doc, entities)
+            for doc in response
+        ]
+
+    def __to_recognizer_results(
+        self, doc: object, entities: List[str]
+    ) -> List[RecognizerResult]:
         recognizer_results = []
-        for res in results:
-            for entity in res.entities:
-                entity.category = entity.category.upper()
-                if entity.category.lower() not in [
-                    ent.lower() for ent in self.supported_entities
-                ]:
-                    continue
-                if entity.category.lower() not in [ent.lower() for ent in entities]:
-                    continue
-                analysis_explanation = AzureAILanguageRecognizer._build_explanation(
-                    original_score=entity.confidence_score,
+        for entity in doc.entities:
+            entity.category = entity.category.upper()
+            if entity.category.lower() not in [
+                ent.lower() for ent in self.supported_entities
+            ]:
+                continue
+            if entity.category.lower() not in [ent.lower() for ent in entities]:
+                continue
+            analysis_explanation = partial(
+                AzureAILanguageRecognizer._build_explanation,
+                original_score=entity.confidence_score,
+                entity_type=entity.category,
+            )
+            recognizer_results.append(
+                RecognizerResult(
                     entity_type=entity.category,
+                    start=entity.offset,
+                    end=entity.offset + entity.length,
+                    score=entity.confidence_score,
+                    analysis_explanation=analysis_explanation,
                 )
-                recognizer_results.append(
-                    RecognizerResult(
-                        entity_type=entity.category,
-                        start=entity.offset,
-                        end=entity.offset + entity.length,
-                        score=entity.confidence_score,
-                        analysis_explanation=analysis_explanation,
-                    )
-                )
+            )
 
         return recognizer_results
 
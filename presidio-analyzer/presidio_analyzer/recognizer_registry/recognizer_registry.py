@@ -1,7 +1,6 @@
-import copy
 import logging
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Type, Union
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
 
 import regex as re
 import yaml
@@ -36,8 +35,19 @@ class RecognizerRegistry:
     including deny-lists
     :param supported_languages: List of languages supported by this registry.
 
+    Changes to the recognizers list and to the languages of its recognizers
+    are taken into account by `get_recognizers`. Other changes to a registered
+    recognizer (e.g. to its supported entities) are not: remove it and add it
+    again with `remove_recognizer` and `add_recognizer`.
     """
 
+    # Maximum number of recognizer lists kept by get_recognizers,
+    # per language and requested entities
+    MAX_CACHED_RECOGNIZER_LISTS = 256
+
+    # Index of the recognizers by language and entity, see __get_index
+    _index: Optional["_RecognizersIndex"] = None
+
     def __init__(
         self,
         recognizers: Optional[Iterable[EntityRecognizer]] = None,
@@ -157,36 +167,37 @@ class RecognizerRegistry:
         if entities is None and all_fields is False:
             raise ValueError("No entities provided")
 
-        all_possible_recognizers = copy.copy(self.recognizers)
-        if ad_hoc_recognizers:
-            all_possible_recognizers.extend(ad_hoc_recognizers)
+        requested_entities = None if all_fields else frozenset(entities)
+        to_return, missing_entities = self.__get_index().get_recognizers(
+            language, requested_entities
+        )
 
-        # filter out unwanted recognizers
-        to_return = set()
-        if all_fields:
-            to_return = [
+        # ad hoc recognizers are merged on top of the registry's recognizers
+        if ad_hoc_recognizers:
+            ad_hoc_subset = [
                 rec
-                for rec in all_possible_recognizers
+                for rec in ad_hoc_recognizers
                 if language == rec.supported_language
+                and (
+                    requested_entities is None
+                    or not requested_entities.isdisjoint(rec.supported_entities)
+                )
+            ]
+            to_return = list(dict.fromkeys([*to_return, *ad_hoc_subset]))
+            missing_entities = [
+                entity
+                for entity in missing_entities
+                if not any(entity in rec.supported_entities for rec in ad_hoc_subset)
             ]
         else:
-            for entity in entities:
-                subset = [
-                    rec
-                    for rec in all_possible_recognizers
-                    if entity in rec.supported_entities
-                    and language == rec.supported_language
-                ]
-
-                if not subset:
-                    logger.warning(
-                        "Entity %s doesn't have the corresponding"
-                        " recognizer in language : %s",
-                        entity,
-                        language,
-                    )
-                else:
-                    to_return.update(set(subset))
+            to_return = list(to_return)
+
+        for entity in missing_entities:
+            logger.warning(
+                "Entity %s doesn't have the corresponding recognizer in language : %s",
+                entity,
+                language,
+            )
 
         logger.debug(
             "Returning a total of %s recognizers",
@@ -196,7 +207,23 @@ class RecognizerRegistry:
         if not to_return:
             raise ValueError("No matching recognizers were found to serve the request.")
 
-        return list(to_return)
+        return to_return
+
+    def __get_index(self) -> "_RecognizersIndex":
+        """Return the index of the recognizers, rebuilt if they changed.
+
+        Besides add_recognizer and remove_recognizer, which reset the index,
+        changes to the recognizers list (e.g. appending, replacing a recognizer
+        or assigning a new list) and to the languages of the recognizers
+        are detected, see `_RecognizersIndex.is_valid_for`.
+        """
+        index = self._index
+        if index is None or not index.is_valid_for(self.recognizers):
+            index = _RecognizersIndex(
+                self.recognizers, max_cached_lists=self.MAX_CACHED_RECOGNIZER_LISTS
+            )
+            self._index = index
+        return index
 
     def add_recognizer(self, recognizer: EntityRecognizer) -> None:
         """
@@ -208,6 +235,7 @@ class RecognizerRegistry:
             raise ValueError("Input is not of type EntityRecognizer")
 
         self.recognizers.append(recognizer)
+        self._index = None
 
     def remove_recognizer(
         self, recognizer_name: str, language: Optional[str] = None
@@ -247,6 +275,7 @@ class RecognizerRegistry:
             )
 
         self.recognizers = new_recognizers
+        self._index = None
 
     def add_pattern_recognizer_from_dict(self, recognizer_dict: Dict) -> None:
         """
@@ -335,3 +364,93 @@ class RecognizerRegistry:
                 supported_entities.extend(recognizer.get_supported_entities())
 
         return list(set(supported_entities))
+
+
+class _RecognizersIndex:
+    """
+    Recognizers by language and supported entity, for RecognizerRegistry.
+
+    Also keeps the recognizers resolved for the last requested entities
+    combinations, as requests tend to repeat the same entities.
+
+    :param recognizers: The recognizers of the registry
+    :param max_cached_lists: Maximum number of resolved recognizer lists kept
+    """
+
+    def __init__(self, recognizers: List[EntityRecognizer], max_cached_lists: int):
+        self.recognizers = recognizers
+        # each recognizer and its language when indexed, to detect changes
+        self.entries = [(rec, rec.supported_language) for rec in recognizers]
+        self.max_cached_lists = max_cached_lists
+
+        # language -> entity -> recognizers, in the registry order
+        self.by_language: Dict[str, Dict[str, List[EntityRecognizer]]] = {}
+        # language -> all of its recognizers, in the registry order
+        self.all_by_language: Dict[str, List[EntityRecognizer]] = {}
+        for rec in recognizers:
+            self.all_by_language.setdefault(rec.supported_language, []).append(rec)
+            by_entity = self.by_language.setdefault(rec.supported_language, {})
+            for entity in dict.fromkeys(rec.supported_entities):
+                by_entity.setdefault(entity, []).append(rec)
+
+        self.resolved: Dict[
+            Tuple[str, Optional[FrozenSet[str]]],
+            Tuple[Tuple[EntityRecognizer, ...], Tuple[str, ...]],
+        ] = {}
+
+    def is_valid_for(self, recognizers: List[EntityRecognizer]) -> bool:
+        """Return whether the index was built for this recognizers list.
+
+        The list must be the same, with the same recognizers in the same order,
+        and the same languages. Changes to the supported entities
+        of a recognizer are not detected.
+        """
+        return (
+            recognizers is self.recognizers
+            and len(recognizers) == len(self.entries)
+            and all(
+                rec is indexed_rec and rec.supported_language == language
+                for rec, (indexed_rec, language) in zip(recognizers, self.entries)
+            )
+        )
+
+    def get_recognizers(
+        self, language: str, entities: Optional[FrozenSet[str]]
+    ) -> Tuple[Tuple[EntityRecognizer, ...], Tuple[str, ...]]:
+        """
+        Return the recognizers of the entities, and the entities without any.
+
+        :param language: The requested language
+        :param entities: The requested entities, None for all
+        """
+        key = (language, entities)
+        resolved = self.resolved.get(key)
+        if resolved is not None:
+            return resolved
+
+        language_recognizers = self.all_by_language.get(language, [])
+        if entities is None:
+            resolved = (tuple(language_recognizers), ())
+        else:
+            by_entity = self.by_language.get(language, {})
+            selected = set()
+            missing_entities = []
+            for entity in sorted(entities):
+                if entity in by_entity:
+                    selected.update(by_entity[entity])
+                else:
+                    missing_entities.append(entity)
+            resolved = (
+                tuple(rec for rec in language_recognizers if rec in selected),
+                tuple(missing_entities),
+            )
+
+        if len(self.resolved) >= self.max_cached_lists:
+            # evict the oldest list. The registry may be shared by threads,
+            # which may evict it first or change the dict while it is iterated
+            try:
+                self.resolved.pop(next(iter(self.resolved), None), None)
+            except RuntimeError:
+                pass
+        self.resolved[key] = resolved
+        return resolved
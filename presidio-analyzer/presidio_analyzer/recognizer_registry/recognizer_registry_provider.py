@@ -9,6 +9,9 @@ from presidio_analyzer import EntityRecognizer
 from presidio_analyzer.nlp_engine import NlpEngine
 from presidio_analyzer.predefined_recognizers import SpacyRecognizer
 from presidio_analyzer.recognizer_registry import RecognizerRegistry
+from presidio_analyzer.recognizer_registry.recognizer_registry_snapshot import (
+    RecognizerRegistrySnapshot,
+)
 from presidio_analyzer.recognizer_registry.recognizers_loader_utils import (
     RecognizerConfigurationLoader,
     RecognizerListLoader,
@@ -25,6 +28,11 @@ class RecognizerRegistryProvider:
 
     :param conf_file: Path to yaml file containing registry configuration
     :param registry_configuration: Dict containing registry configuration
+    :param nlp_engine: The NLP engine the registry is created for
+    :param snapshot_file: Path of a registry snapshot file
+    (see RecognizerRegistrySnapshot). The registry is loaded from the snapshot
+    if it was built for this configuration, otherwise it is created
+    and saved to the snapshot file, for the next processes to load it.
     :example:
         {
             "supported_languages": ["de", "es"],
@@ -51,14 +59,39 @@ class RecognizerRegistryProvider:
         conf_file: Optional[Union[Path, str]] = None,
         registry_configuration: Optional[Dict] = None,
         nlp_engine: Optional[NlpEngine] = None,
+        snapshot_file: Optional[Union[Path, str]] = None,
     ):
         self.configuration = RecognizerConfigurationLoader.get(
             conf_file=conf_file, registry_configuration=registry_configuration
         )
         self.nlp_engine = nlp_engine
+        self.snapshot_file = snapshot_file
 
     def create_recognizer_registry(self) -> RecognizerRegistry:
         """Create a recognizer registry according to configuration loaded previously."""
+        if not self.snapshot_file:
+            return self.__create_recognizer_registry()
+
+        snapshot = RecognizerRegistrySnapshot(self.snapshot_file)
+        fingerprint = RecognizerRegistrySnapshot.get_fingerprint(
+            self.configuration, self.nlp_engine
+        )
+        registry = snapshot.load(fingerprint)
+        if registry:
+            return registry
+
+        registry = self.__create_recognizer_registry()
+        try:
+            snapshot.save(registry, fingerprint)
+        except Exception as e:
+            # e.g. recognizers holding objects which can't be pickled
+            logger.warning(
+                f"Failed to save recognizer registry snapshot "
+                f"{self.snapshot_file}: {e}"
+            )
+        return registry
+
+    def __create_recognizer_registry(self) -> RecognizerRegistry:
         supported_languages = self.configuration.get("supported_languages")
         global_regex_flags = self.configuration.get("global_regex_flags")
         recognizers_conf = self.configuration.get("recognizers")
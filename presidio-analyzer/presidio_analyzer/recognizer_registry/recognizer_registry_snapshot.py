@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import regex as re
+
+from presidio_analyzer import PatternRecognizer
+from presidio_analyzer.nlp_engine import NlpEngine
+from presidio_analyzer.recognizer_registry import RecognizerRegistry
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class RecognizerRegistrySnapshot:
+    """
+    A file holding a built RecognizerRegistry, to load it quickly at startup.
+
+    Loading a snapshot skips parsing the configuration, resolving and
+    instantiating the recognizers, and compiling their patterns:
+    the snapshot holds the recognizers with their regex patterns compiled.
+    The snapshot is keyed by a fingerprint of the registry configuration,
+    NLP engine and library versions, so that a snapshot built for another
+    configuration is detected when loaded.
+
+    Snapshots are pickle files: only load snapshots written by a trusted process.
+
+    :param path: Path of the snapshot file
+    """
+
+    # Version of the snapshot file layout, part of the fingerprint
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: Union[Path, str]):
+        self.path = Path(path)
+
+    @classmethod
+    def get_fingerprint(
+        cls,
+        configuration: Dict[str, Any],
+        nlp_engine: Optional[NlpEngine] = None,
+    ) -> str:
+        """
+        Return the fingerprint of a registry built from a configuration.
+
+        :param configuration: The registry configuration,
+        as loaded by RecognizerConfigurationLoader
+        :param nlp_engine: The NLP engine the registry is built for,
+        which determines the NLP recognizers of the registry
+        """
+        nlp_engine_data = None
+        if nlp_engine:
+            nlp_engine_data = {
+                "class": type(nlp_engine).__qualname__,
+                "supported_languages": nlp_engine.get_supported_languages(),
+                "supported_entities": nlp_engine.get_supported_entities(),
+            }
+
+        data = {
+            "format_version": cls.FORMAT_VERSION,
+            "python_version": list(sys.version_info[:2]),
+            "presidio_analyzer_version": cls.__get_package_version(),
+            "regex_version": re.__version__,
+            "configuration": configuration,
+            "nlp_engine": nlp_engine_data,
+        }
+        serialized = json.dumps(data, sort_keys=True, default=repr)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def load(self, fingerprint: str) -> Optional[RecognizerRegistry]:
+        """
+        Load the registry of the snapshot, if it was built for the fingerprint.
+
+        :param fingerprint: The fingerprint of the expected registry,
+        see `get_fingerprint`
+        :return: The registry, or None if the snapshot is missing, unreadable
+        or built for another fingerprint
+        """
+        if not self.path.exists():
+            logger.info(f"Recognizer registry snapshot {self.path} not found")
+            return None
+
+        try:
+            with open(self.path, "rb") as file:
+                snapshot = pickle.load(file)
+        except Exception as e:
+            logger.warning(
+                f"Failed to load recognizer registry snapshot {self.path}: {e}"
+            )
+            return None
+
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("fingerprint") != fingerprint
+            or not isinstance(snapshot.get("registry"), RecognizerRegistry)
+        ):
+            logger.info(
+                f"Recognizer registry snapshot {self.path} "
+                f"was built for another configuration"
+            )
+            return None
+
+        logger.info(f"Loaded recognizer registry snapshot {self.path}")
+        return snapshot["registry"]
+
+    def save(self, registry: RecognizerRegistry, fingerprint: str) -> None:
+        """
+        Compile the patterns of the registry's recognizers and save the snapshot.
+
+        The file is replaced atomically, so that processes loading the snapshot
+        while it is saved (e.g. other workers) read either snapshot whole.
+
+        :param registry: The registry to save
+        :param fingerprint: The fingerprint of the registry's configuration,
+        see `get_fingerprint`
+        """
+        for recognizer in registry.recognizers:
+            if isinstance(recognizer, PatternRecognizer):
+                recognizer.compile_patterns()
+
+        snapshot = {"fingerprint": fingerprint, "registry": registry}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}."
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        logger.info(f"Saved recognizer registry snapshot {self.path}")
+
+    @staticmethod
+    def __get_package_version() -> Optional[str]:
+        try:
+            return metadata.version("presidio_analyzer")
+        except metadata.PackageNotFoundError:
+            return None
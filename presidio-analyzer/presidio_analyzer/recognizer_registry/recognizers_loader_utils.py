@@ -7,7 +7,11 @@ from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 import yaml
 
-from presidio_analyzer import EntityRecognizer, PatternRecognizer
+from presidio_analyzer import (
+    EntityRecognizer,
+    PatternRecognizer,
+    predefined_recognizers,
+)
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -172,6 +176,10 @@ class RecognizerListLoader:
 
         if not cls:
             cls = EntityRecognizer
+            # the predefined recognizers are imported on first access,
+            # import them all so that they are found as subclasses
+            for name in predefined_recognizers.__all__:
+                getattr(predefined_recognizers, name)
 
         return set(cls.__subclasses__()).union(
             [
@@ -1,5 +1,6 @@
 import logging
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Union
 
 from presidio_analyzer import AnalysisExplanation
 
@@ -15,12 +16,26 @@ class RecognizerResult:
     :param end: the end location of the detected entity
     :param score: the score of the detection
     :param analysis_explanation: contains the explanation of why this
-                                 entity was identified
+                                 entity was identified, or a function
+                                 building it, called on first access
+                                 (explanations are then only built when
+                                 the decision process is returned or traced)
     :param recognition_metadata: a dictionary of metadata to be used in
     recognizer specific cases, for example specific recognized context words
-    and recognizer name
+    and recognizer name. A read-only mapping (MappingProxyType) can be shared
+    by several results, and is copied to a dictionary of the result
+    the first time `recognition_metadata` is accessed
     """
 
+    __slots__ = (
+        "entity_type",
+        "start",
+        "end",
+        "score",
+        "_analysis_explanation",
+        "_recognition_metadata",
+    )
+
     # Keys for recognizer metadata
     RECOGNIZER_NAME_KEY = "recognizer_name"
     RECOGNIZER_IDENTIFIER_KEY = "recognizer_identifier"
@@ -37,8 +52,10 @@ class RecognizerResult:
         start: int,
         end: int,
         score: float,
-        analysis_explanation: AnalysisExplanation = None,
-        recognition_metadata: Dict = None,
+        analysis_explanation: Union[
+            AnalysisExplanation, Callable[[], AnalysisExplanation], None
+        ] = None,
+        recognition_metadata: Union[Dict, Mapping, None] = None,
     ):
         self.entity_type = entity_type
         self.start = start
@@ -54,6 +71,73 @@ class RecognizerResult:
 
         self.recognition_metadata = recognition_metadata
 
+    @property
+    def analysis_explanation(self) -> Optional[AnalysisExplanation]:
+        """Return the explanation of why this entity was identified."""
+        if callable(self._analysis_explanation):
+            self._analysis_explanation = self._analysis_explanation()
+        return self._analysis_explanation
+
+    @analysis_explanation.setter
+    def analysis_explanation(
+        self,
+        analysis_explanation: Union[
+            AnalysisExplanation, Callable[[], AnalysisExplanation], None
+        ],
+    ) -> None:
+        self._analysis_explanation = analysis_explanation
+
+    @property
+    def recognition_metadata(self) -> Optional[Dict]:
+        """Return the recognition metadata of this result, which can be modified."""
+        if isinstance(self._recognition_metadata, MappingProxyType):
+            self._recognition_metadata = dict(self._recognition_metadata)
+        return self._recognition_metadata
+
+    @recognition_metadata.setter
+    def recognition_metadata(
+        self, recognition_metadata: Union[Dict, Mapping, None]
+    ) -> None:
+        self._recognition_metadata = recognition_metadata
+
+    def get_recognition_metadata_value(self, key: str, default: Any = None) -> Any:
+        """
+        Return a value of the recognition metadata.
+
+        Unlike `recognition_metadata`, metadata shared with other results
+        is not copied.
+
+        :param key: The metadata key, e.g. RECOGNIZER_IDENTIFIER_KEY
+        :param default: The value returned if the key is missing
+        """
+        if not self._recognition_metadata:
+            return default
+        return self._recognition_metadata.get(key, default)
+
+    def __copy__(self) -> "RecognizerResult":
+        """Return a shallow copy, sharing the explanation or its pending builder."""
+        result = type(self).__new__(type(self))
+        for name in RecognizerResult.__slots__:
+            setattr(result, name, getattr(self, name))
+        if hasattr(self, "__dict__"):
+            result.__dict__.update(self.__dict__)
+        return result
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle or deep copy, with the explanation built."""
+        state = dict(getattr(self, "__dict__", {}))
+        for name in RecognizerResult.__slots__:
+            state[name] = getattr(self, name)
+        state["_analysis_explanation"] = self.analysis_explanation
+        if isinstance(self._recognition_metadata, MappingProxyType):
+            state["_recognition_metadata"] = dict(self._recognition_metadata)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore the state of a pickled or copied result."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def append_analysis_explanation_text(self, text: str) -> None:
         """Add text to the analysis explanation."""
         if self.analysis_explanation:
@@ -65,7 +149,14 @@ class RecognizerResult:
 
         :return: a dictionary
         """
-        return self.__dict__
+        return {
+            "entity_type": self.entity_type,
+            "start": self.start,
+            "end": self.end,
+            "score": self.score,
+            "analysis_explanation": self.analysis_explanation,
+            "recognition_metadata": self.recognition_metadata,
+        }
 
     @classmethod
     def from_json(cls, data: Dict) -> "RecognizerResult":
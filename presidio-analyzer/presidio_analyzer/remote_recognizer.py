@@ -1,7 +1,10 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, List, Optional
 
-from presidio_analyzer import EntityRecognizer
+from presidio_analyzer import EntityRecognizer, RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 
@@ -13,6 +16,14 @@ class RemoteRecognizer(ABC, EntityRecognizer):
     :param name: name of recognizer
     :param supported_language: The language this recognizer can detect entities in
     :param version: Version of this recognizer
+    :param context: list of context words
+    :param max_batch_documents: Maximum number of documents sent to the
+    external service in a single call by `analyze_batch`
+    :param max_batch_characters: Maximum number of characters sent to the
+    external service in a single call by `analyze_batch` (None for no limit).
+    Longer documents are sent alone.
+    :param max_concurrent_requests: Maximum number of calls to the
+    external service in flight at the same time in `analyze_batch`
     """
 
     def __init__(
@@ -22,6 +33,9 @@ class RemoteRecognizer(ABC, EntityRecognizer):
         supported_language: str,
         version: str,
         context: Optional[List[str]] = None,
+        max_batch_documents: int = 1,
+        max_batch_characters: Optional[int] = None,
+        max_concurrent_requests: int = 4,
     ):
         super().__init__(
             supported_entities=supported_entities,
@@ -30,6 +44,14 @@ class RemoteRecognizer(ABC, EntityRecognizer):
             version=version,
             context=context,
         )
+        if max_batch_documents < 1:
+            raise ValueError("max_batch_documents must be at least 1")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+
+        self.max_batch_documents = max_batch_documents
+        self.max_batch_characters = max_batch_characters
+        self.max_concurrent_requests = max_concurrent_requests
 
     def load(self):  # noqa D102
         pass
@@ -49,6 +71,104 @@ class RemoteRecognizer(ABC, EntityRecognizer):
         # 2. Translate results into List[RecognizerResult]
         pass
 
+    async def analyze_async(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+    ) -> List[RecognizerResult]:
+        """
+        Call an external service for PII detection, without blocking the event loop.
+
+        Used by `AnalyzerEngine.analyze_async` to call remote recognizers
+        concurrently. By default, `analyze` runs in the event loop's
+        default executor. Recognizers having an async client can override
+        this method to use it instead.
+
+        :param text: text to be analyzed
+        :param entities: Entities that should be looked for
+        :param nlp_artifacts: Additional metadata from the NLP engine
+        :return: List of identified PII entities
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.analyze, text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            ),
+        )
+
+    def analyze_documents(
+        self, texts: List[str], entities: List[str]
+    ) -> List[List[RecognizerResult]]:
+        """
+        Call the external service once for several documents.
+
+        Recognizers whose service accepts several documents per request
+        should override this method, together with `max_batch_documents`.
+        By default, `analyze` is called for each document.
+
+        :param texts: The documents to analyze, within the batch limits
+        :param entities: Entities that should be looked for
+        :return: List of identified PII entities per document, in the texts order
+        """
+        return [
+            self.analyze(text=text, entities=entities, nlp_artifacts=None)
+            for text in texts
+        ]
+
+    def analyze_batch(
+        self,
+        texts: List[str],
+        entities: List[str],
+        nlp_artifacts_list: Optional[List[Optional[NlpArtifacts]]] = None,
+    ) -> List[List[RecognizerResult]]:
+        """
+        Call the external service for a batch of documents.
+
+        Documents are grouped into calls to `analyze_documents` within the
+        `max_batch_documents` and `max_batch_characters` limits,
+        with up to `max_concurrent_requests` calls in flight.
+        Recognizers using the NlpArtifacts analyze each document separately.
+
+        :param texts: The documents to analyze
+        :param entities: Entities that should be looked for
+        :param nlp_artifacts_list: The NlpArtifacts of each document, if available
+        :return: List of identified PII entities per document, in the texts order
+        """
+        if nlp_artifacts_list and self.nlp_capabilities != frozenset():
+            return super().analyze_batch(texts, entities, nlp_artifacts_list)
+
+        chunks = list(self.__chunk(texts))
+        analyze_chunk = partial(self.analyze_documents, entities=entities)
+        if len(chunks) > 1 and self.max_concurrent_requests > 1:
+            workers = min(len(chunks), self.max_concurrent_requests)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                chunk_results = list(executor.map(analyze_chunk, chunks))
+        else:
+            chunk_results = map(analyze_chunk, chunks)
+
+        return [results for chunk in chunk_results for results in chunk]
+
+    def __chunk(self, texts: List[str]) -> Iterator[List[str]]:
+        chunk = []
+        chunk_characters = 0
+        for text in texts:
+            if chunk and (
+                len(chunk) == self.max_batch_documents
+                or (
+                    self.max_batch_characters is not None
+                    and chunk_characters + len(text) > self.max_batch_characters
+                )
+            ):
+                yield chunk
+                chunk = []
+                chunk_characters = 0
+            chunk.append(text)
+            chunk_characters += len(text)
+        if chunk:
+            yield chunk
+
     @abstractmethod
     def get_supported_entities(self) -> List[str]:  # noqa D102
         pass
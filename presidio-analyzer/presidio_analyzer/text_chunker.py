@@ -0,0 +1,67 @@
+import re
+from typing import List, Tuple
+
+
+class TextChunker:
+    """
+    Split long texts into overlapping chunks, at sentence boundaries where possible.
+
+    Used to run models with a limited input length (e.g. GLiNER) on long texts.
+    Chunk sizes are counted in words, split the same way GLiNER splits its input.
+
+    :param chunk_size: Maximum number of words in a chunk
+    :param chunk_overlap: Number of words at the end of a chunk which are repeated
+    at the start of the next one, so that entities crossing the boundary between
+    two chunks are found whole in one of them
+    """
+
+    WORD_REGEX = re.compile(r"\w+(?:[-_]\w+)*|\S")
+    SENTENCE_END_REGEX = re.compile(r"[.!?。！？]")
+
+    def __init__(self, chunk_size: int, chunk_overlap: int = 0):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be between 0 and chunk_size - 1")
+
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    def chunk(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Return the start and end offsets of the text's chunks.
+
+        A text of at most `chunk_size` words is returned as a single chunk.
+        Otherwise, each chunk ends at the last sentence boundary
+        (sentence-ending punctuation or line break) in its second half,
+        or after `chunk_size` words if there is none.
+
+        :param text: The text to split
+        :return: The (start, end) character offsets of each chunk, in order
+        """
+        words = [match.span() for match in self.WORD_REGEX.finditer(text)]
+        if len(words) <= self.chunk_size:
+            return [(0, len(text))]
+
+        chunks = []
+        start = 0
+        while start + self.chunk_size < len(words):
+            end = self._find_sentence_boundary(text, words, start)
+            chunks.append((words[start][0], words[end - 1][1]))
+            start = max(end - self.chunk_overlap, start + 1)
+
+        chunks.append((words[start][0], len(text)))
+        return chunks
+
+    def _find_sentence_boundary(
+        self, text: str, words: List[Tuple[int, int]], start: int
+    ) -> int:
+        """Return the index of the word following the chunk starting at `start`."""
+        end = start + self.chunk_size
+        for index in range(end - 1, start + self.chunk_size // 2 - 1, -1):
+            word_start, word_end = words[index]
+            if self.SENTENCE_END_REGEX.fullmatch(text, word_start, word_end):
+                return index + 1
+            if "\n" in text[word_end : words[index + 1][0]]:
+                return index + 1
+        return end
@@ -0,0 +1,121 @@
+import copy
+import pickle
+
+import regex as re
+
+from presidio_analyzer import AdHocRecognizerCache, AnalyzerEngine, AnalyzerRequest
+
+ZIP_RECOGNIZER = {
+    "name": "Zip code Recognizer",
+    "supported_language": "en",
+    "patterns": [{"name": "zip code (weak)", "regex": "(\\b\\d{5}(?:\\-\\d{4})?\\b)", "score": 0.01}],
+    "context": ["zip", "code"],
+    "supported_entity": "ZIP",
+}
+
+
+def test_when_same_definition_then_same_recognizer_returned():
+    cache = AdHocRecognizerCache()
+
+    first = cache.get_recognizer(ZIP_RECOGNIZER)
+    second = cache.get_recognizer(dict(reversed(list(ZIP_RECOGNIZER.items()))))
+
+    assert first is second
+    assert len(cache) == 1
+
+
+def test_when_get_recognizer_then_patterns_compiled_and_definition_unchanged():
+    cache = AdHocRecognizerCache()
+    flags = re.IGNORECASE
+
+    recognizer = cache.get_recognizer(ZIP_RECOGNIZER, regex_flags=flags)
+
+    assert recognizer.patterns[0].compiled_regex is not None
+    assert recognizer.patterns[0].compiled_with_flags == flags
+    assert isinstance(ZIP_RECOGNIZER["patterns"][0], dict)
+    results = recognizer.analyze("zip 12345", entities=["ZIP"], regex_flags=flags)
+    assert [(result.start, result.end) for result in results] == [(4, 9)]
+
+
+def test_when_different_definitions_or_flags_then_different_recognizers():
+    cache = AdHocRecognizerCache()
+    other = {**ZIP_RECOGNIZER, "context": ["postal"]}
+
+    recognizer = cache.get_recognizer(ZIP_RECOGNIZER)
+
+    assert cache.get_recognizer(other) is not recognizer
+    assert cache.get_recognizer(ZIP_RECOGNIZER, regex_flags=re.IGNORECASE) is not (
+        recognizer
+    )
+    assert len(cache) == 3
+
+
+def test_when_cache_full_then_least_recently_used_evicted():
+    cache = AdHocRecognizerCache(max_size=2)
+    definitions = [{**ZIP_RECOGNIZER, "name": f"zip {i}"} for i in range(3)]
+
+    first = cache.get_recognizer(definitions[0])
+    cache.get_recognizer(definitions[1])
+    assert cache.get_recognizer(definitions[0]) is first
+    cache.get_recognizer(definitions[2])
+
+    assert len(cache) == 2
+    assert cache.get_recognizer(definitions[0]) is first
+    assert cache.get_recognizer(definitions[1]).name == "zip 1"
+
+
+def test_when_analyzer_request_with_cache_then_recognizers_reused():
+    cache = AdHocRecognizerCache()
+    request_data = {"text": "zip 12345", "ad_hoc_recognizers": [ZIP_RECOGNIZER]}
+
+    first = AnalyzerRequest(request_data, ad_hoc_recognizer_cache=cache)
+    second = AnalyzerRequest(request_data, ad_hoc_recognizer_cache=cache)
+    # without a cache, the request's definitions are changed by from_dict
+    uncached = AnalyzerRequest(copy.deepcopy(request_data))
+
+    assert first.ad_hoc_recognizers[0] is second.ad_hoc_recognizers[0]
+    assert uncached.ad_hoc_recognizers[0] is not first.ad_hoc_recognizers[0]
+    assert first.ad_hoc_recognizers[0].patterns[0].compiled_with_flags == (
+        first.regex_flags
+    )
+
+
+def test_when_analyze_with_cached_ad_hoc_recognizer_then_entities_found(
+    analyzer_engine_simple,
+):
+    request_data = {
+        "text": "my zip code is 12345",
+        "language": "en",
+        "ad_hoc_recognizers": [ZIP_RECOGNIZER],
+    }
+
+    for _ in range(2):
+        request = AnalyzerRequest(
+            request_data,
+            ad_hoc_recognizer_cache=analyzer_engine_simple.ad_hoc_recognizer_cache,
+        )
+        results = analyzer_engine_simple.analyze(
+            text=request.text,
+            language=request.language,
+            entities=["ZIP"],
+            ad_hoc_recognizers=request.ad_hoc_recognizers,
+            regex_flags=request.regex_flags,
+        )
+        assert [(result.start, result.end) for result in results] == [(15, 20)]
+
+    assert len(analyzer_engine_simple.ad_hoc_recognizer_cache) == 1
+
+
+def test_when_analyzer_engine_pickled_then_ad_hoc_recognizers_still_cached(
+    mock_registry, mock_nlp_engine
+):
+    analyzer_engine = AnalyzerEngine(registry=mock_registry, nlp_engine=mock_nlp_engine)
+    analyzer_engine.ad_hoc_recognizer_cache.get_recognizer(ZIP_RECOGNIZER)
+
+    engine = pickle.loads(pickle.dumps(analyzer_engine))
+
+    cache = engine.ad_hoc_recognizer_cache
+    assert len(cache) == 1
+    recognizer = cache.get_recognizer(ZIP_RECOGNIZER)
+    assert cache.get_recognizer(ZIP_RECOGNIZER) is recognizer
+    assert len(cache) == 1
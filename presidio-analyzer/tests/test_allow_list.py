@@ -0,0 +1,120 @@
+import sys
+import threading
+
+import pytest
+import regex as re
+
+from presidio_analyzer import AllowList, RecognizerResult
+
+TEXT = "visit bing.com or microsoft.com"
+
+
+@pytest.fixture(scope="module")
+def url_results():
+    return [
+        RecognizerResult("URL", 6, 14, 0.5),
+        RecognizerResult("URL", 18, 31, 0.5),
+    ]
+
+
+def test_when_exact_allow_list_then_exact_words_removed(url_results):
+    allow_list = AllowList(["bing.com", "bing"])
+
+    results = allow_list.remove_allowed(url_results, TEXT)
+
+    assert [TEXT[r.start : r.end] for r in results] == ["microsoft.com"]
+    assert "bing.com" in allow_list
+    assert "BING.COM" not in allow_list
+
+
+def test_when_regex_allow_list_then_matching_words_removed(url_results):
+    allow_list = AllowList(["^BING", "azure"], allow_list_match="regex")
+
+    assert len(allow_list.remove_allowed(url_results, TEXT, regex_flags=0)) == 2
+    results = allow_list.remove_allowed(url_results, TEXT, regex_flags=re.IGNORECASE)
+    assert [TEXT[r.start : r.end] for r in results] == ["microsoft.com"]
+    assert allow_list.is_allowed("bing.com", regex_flags=re.IGNORECASE)
+
+
+def test_when_regex_allow_list_reused_then_compiled_once_per_flags():
+    allow_list = AllowList(["bing"], allow_list_match="regex")
+
+    for _ in range(3):
+        allow_list.is_allowed("bing.com", regex_flags=re.IGNORECASE)
+        allow_list.is_allowed("bing.com")
+
+    assert len(allow_list._compiled_regexes) == 2
+
+
+def test_when_invalid_allow_list_match_then_value_error():
+    with pytest.raises(ValueError):
+        AllowList(["bing.com"], allow_list_match="fuzzy")
+
+
+def test_when_allow_list_object_passed_to_analyze_then_results_removed(
+    analyzer_engine_simple,
+):
+    allow_list = AllowList(["bing.com"])
+
+    results = analyzer_engine_simple.analyze(
+        TEXT, language="en", entities=["URL"], allow_list=allow_list
+    )
+
+    assert [TEXT[r.start : r.end] for r in results] == ["microsoft.com"]
+
+
+def test_when_same_allow_list_passed_again_then_prepared_once(analyzer_engine_simple):
+    allow_list = ["bing.com"]
+
+    first = analyzer_engine_simple._get_allow_list(allow_list, "exact")
+
+    assert analyzer_engine_simple._get_allow_list(allow_list, "exact") is first
+    assert analyzer_engine_simple._get_allow_list(["bing.com"], "exact") is not first
+    assert analyzer_engine_simple._get_allow_list(allow_list, "regex") is not first
+
+
+def test_when_allow_lists_passed_from_threads_then_cache_eviction_is_safe(
+    analyzer_engine_simple, monkeypatch
+):
+    monkeypatch.setattr(analyzer_engine_simple, "MAX_CACHED_ALLOW_LISTS", 2)
+    errors = []
+
+    def get_allow_lists():
+        try:
+            for i in range(20000):
+                allow_list = [f"site{i % 7}.com"]
+                prepared = analyzer_engine_simple._get_allow_list(allow_list, "exact")
+                assert prepared.allow_list == allow_list
+        except Exception as e:
+            errors.append(e)
+
+    # switch threads often, for the threads to evict concurrently
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [threading.Thread(target=get_allow_lists) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+
+
+def test_when_allow_list_changed_between_calls_then_changes_applied(
+    analyzer_engine_simple,
+):
+    allow_list = ["bing.com"]
+    results = analyzer_engine_simple.analyze(
+        TEXT, language="en", entities=["URL"], allow_list=allow_list
+    )
+    assert [TEXT[r.start : r.end] for r in results] == ["microsoft.com"]
+
+    allow_list.append("microsoft.com")
+    results = analyzer_engine_simple.analyze(
+        TEXT, language="en", entities=["URL"], allow_list=allow_list
+    )
+
+    assert results == []
@@ -1,4 +1,5 @@
 import copy
+import io
 from abc import ABC
 from contextlib import nullcontext
 from typing import List, Optional
@@ -935,3 +936,198 @@ def test_when_multiple_nameless_recognizers_context_is_correct(spacy_nlp_engine)
 
     for recognizer_result in recognizer_results:
         assert recognizer_result.score > 0.3
+
+
+def test_when_no_recognizer_requires_nlp_artifacts_then_nlp_engine_not_run(
+    mocker, zip_code_recognizer
+):
+    nlp_engine = NlpEngineMock()
+    process_text = mocker.spy(nlp_engine, "process_text")
+    tokenize = mocker.spy(nlp_engine, "tokenize")
+    registry = RecognizerRegistry(recognizers=[zip_code_recognizer])
+    analyzer_engine = AnalyzerEngine(registry=registry, nlp_engine=nlp_engine)
+
+    no_results = analyzer_engine.analyze("no zip code here", language="en")
+    assert no_results == []
+    assert tokenize.call_count == 0
+
+    results = analyzer_engine.analyze("my zip code is 90210", language="en")
+    assert len(results) == 1
+    assert tokenize.call_count == 1
+
+    # NlpEngineMock.tokenize falls back to process_text
+    assert process_text.call_count == tokenize.call_count
+
+
+def test_when_recognizer_requires_nlp_artifacts_then_nlp_engine_run(
+    mocker, zip_code_recognizer
+):
+    class NlpRecognizer(EntityRecognizer):
+        def load(self):
+            pass
+
+        def analyze(self, text, entities, nlp_artifacts=None):
+            assert nlp_artifacts is not None
+            return []
+
+    nlp_engine = NlpEngineMock()
+    process_text = mocker.spy(nlp_engine, "process_text")
+    registry = RecognizerRegistry(
+        recognizers=[zip_code_recognizer, NlpRecognizer(supported_entities=["NLP"])]
+    )
+    analyzer_engine = AnalyzerEngine(registry=registry, nlp_engine=nlp_engine)
+
+    analyzer_engine.analyze("my zip code is 90210", language="en")
+    assert process_text.call_count == 1
+
+    analyzer_engine.analyze("no zip code here", language="en", entities=["ZIP"])
+    assert process_text.call_count == 1
+
+
+def test_when_recognizers_need_some_nlp_capabilities_then_only_those_computed(
+    mocker, zip_code_recognizer
+):
+    import spacy
+    from presidio_analyzer.predefined_recognizers import SpacyRecognizer
+
+    nlp_engine = SpacyNlpEngine()
+    nlp_engine.nlp = {"en": spacy.blank("en")}
+    process_text = mocker.spy(nlp_engine, "process_text")
+
+    registry = RecognizerRegistry(recognizers=[zip_code_recognizer])
+    analyzer_engine = AnalyzerEngine(registry=registry, nlp_engine=nlp_engine)
+    analyzer_engine.analyze("my zip code is 90210", language="en")
+
+    process_text.assert_called_once_with(
+        "my zip code is 90210", "en", capabilities=frozenset({"tokens", "lemmas"})
+    )
+
+    registry.add_recognizer(SpacyRecognizer())
+    analyzer_engine.analyze("my zip code is 90210", language="en")
+
+    assert process_text.call_args.kwargs["capabilities"] == frozenset(
+        {"tokens", "lemmas", "entities"}
+    )
+
+
+def test_when_enhance_using_context_then_other_results_grouped_by_recognizer(
+    zip_code_recognizer,
+):
+    class RelatedEntitiesRecognizer(PatternRecognizer):
+        def enhance_using_context(
+            self,
+            text,
+            raw_recognizer_results,
+            other_raw_recognizer_results,
+            nlp_artifacts,
+            context=None,
+        ):
+            self.other_results = other_raw_recognizer_results
+            return raw_recognizer_results
+
+    related_recognizer = RelatedEntitiesRecognizer(
+        "CITY", patterns=[Pattern("city", r"Seattle", 0.5)]
+    )
+    registry = RecognizerRegistry(
+        recognizers=[zip_code_recognizer, related_recognizer]
+    )
+    analyzer_engine = AnalyzerEngine(registry=registry, nlp_engine=NlpEngineMock())
+
+    results = analyzer_engine.analyze("Seattle 98101", language="en")
+
+    assert {result.entity_type for result in results} == {"CITY", "ZIP"}
+    assert [result.entity_type for result in related_recognizer.other_results] == [
+        "ZIP"
+    ]
+    # the default implementation returns the results as is, and isn't called
+    assert not AnalyzerEngine._implements_enhance_using_context(zip_code_recognizer)
+    assert AnalyzerEngine._implements_enhance_using_context(related_recognizer)
+
+
+def create_stream_test_text():
+    lines = []
+    for i in range(60):
+        lines.append(f"line {i} visit https://www.site{i}.com or call 425 882 {i:04d}")
+        lines.append(f"card number 4012888888881881 for customer {i}.")
+    return "\n".join(lines) + "\n"
+
+
+def get_spans(results):
+    return sorted((r.entity_type, r.start, r.end, r.score) for r in results)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 37, 5000, 100000])
+def test_when_analyze_stream_then_same_results_as_analyze(
+    analyzer_engine_simple, chunk_size
+):
+    text = create_stream_test_text()
+    chunks = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+    expected = analyzer_engine_simple.analyze(text, language="en")
+    results = list(
+        analyzer_engine_simple.analyze_stream(
+            chunks, language="en", window_size=500, window_overlap=100
+        )
+    )
+
+    assert len(text) > 10 * 500
+    assert get_spans(results) == get_spans(expected)
+    assert [r.start for r in results] == sorted(r.start for r in results)
+
+
+def test_when_analyze_stream_with_file_then_same_results_as_analyze(
+    analyzer_engine_simple,
+):
+    text = create_stream_test_text()
+
+    expected = analyzer_engine_simple.analyze(text, language="en", entities=["URL"])
+    results = analyzer_engine_simple.analyze_stream(
+        io.StringIO(text),
+        language="en",
+        window_size=300,
+        window_overlap=100,
+        entities=["URL"],
+    )
+
+    assert get_spans(results) == get_spans(expected)
+
+
+def test_when_analyze_stream_then_results_yielded_before_stream_consumed(
+    analyzer_engine_simple,
+):
+    text = create_stream_test_text()
+    lines = text.splitlines(keepends=True)
+    read_lines = []
+
+    def read():
+        for line in lines:
+            read_lines.append(line)
+            yield line
+
+    results = analyzer_engine_simple.analyze_stream(
+        read(), language="en", window_size=500, window_overlap=100
+    )
+    first = next(results)
+
+    assert text[first.start : first.end] == "https://www.site0.com"
+    assert len(read_lines) < len(lines) / 4
+
+
+def test_when_analyze_stream_empty_then_no_results(analyzer_engine_simple):
+    assert list(analyzer_engine_simple.analyze_stream([], language="en")) == []
+    assert list(analyzer_engine_simple.analyze_stream(["", ""], language="en")) == []
+
+
+@pytest.mark.parametrize("window_size, window_overlap", [(100, 50), (100, -1)])
+def test_when_analyze_stream_with_invalid_window_then_value_error(
+    analyzer_engine_simple, window_size, window_overlap
+):
+    with pytest.raises(ValueError):
+        list(
+            analyzer_engine_simple.analyze_stream(
+                ["text"],
+                language="en",
+                window_size=window_size,
+                window_overlap=window_overlap,
+            )
+        )
@@ -339,3 +339,23 @@ def test_analyzer_engine_stanza_without_recognizer_creates_recognizer():
         nlp_recognizers[1].supported_language,
     }
     assert supported_languages == {"en", "es"}
+
+
+def test_analyzer_engine_provider_when_registry_snapshot_then_same_registry(
+    tmp_path,
+):
+    snapshot_file = tmp_path / "registry.pkl"
+    engine = AnalyzerEngineProvider(
+        recognizer_registry_snapshot_file=snapshot_file
+    ).create_engine()
+    assert snapshot_file.exists()
+
+    loaded_engine = AnalyzerEngineProvider(
+        recognizer_registry_snapshot_file=snapshot_file
+    ).create_engine()
+
+    assert [rec.id for rec in loaded_engine.registry.recognizers] == [
+        rec.id for rec in engine.registry.recognizers
+    ]
+    results = loaded_engine.analyze("My email is a@b.com", language="en")
+    assert [result.entity_type for result in results] == ["EMAIL_ADDRESS"]
@@ -87,3 +87,34 @@ def test_mocked_entities_match_recognizer_results():
         assert expected.offset == actual.start
         assert expected.length == actual.end - actual.start
         assert expected.confidence_score == actual.score
+
+
+def test_when_analyze_batch_then_documents_sent_in_bulk():
+    try:
+        importlib.import_module("azure.ai.textanalytics")
+    except ImportError:
+        pytest.skip("Skipping test because 'azure.ai.textanalytics' is not installed")
+
+    from azure.ai.textanalytics import PiiEntity, TextAnalyticsClient, \
+        RecognizePiiEntitiesResult
+    from azure.core.credentials import AzureKeyCredential
+
+    def recognize_pii_entities(documents, language):
+        return [
+            RecognizePiiEntitiesResult(
+                entities=[PiiEntity(text=text, category="Person", length=len(text),
+                                    offset=0, confidence_score=0.8)]
+            )
+            for text in documents
+        ]
+
+    ta_client = TextAnalyticsClient(endpoint="", credential=AzureKeyCredential(key=""))
+    ta_client.recognize_pii_entities = MagicMock(side_effect=recognize_pii_entities)
+
+    azure_ai_recognizer = AzureAILanguageRecognizer(ta_client=ta_client)
+    texts = ["Raj", "Dana", "Avi", "Noa", "Tal", "Lee", "Ron"]
+    results = azure_ai_recognizer.analyze_batch(texts, entities=["PERSON"])
+
+    assert ta_client.recognize_pii_entities.call_count == 2
+    assert [len(result) for result in results] == [1] * len(texts)
+    assert [result[0].end for result in results] == [len(text) for text in texts]
@@ -1,5 +1,12 @@
 import pytest
-from presidio_analyzer import RecognizerResult, BatchAnalyzerEngine, DictAnalyzerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    BatchAnalyzerEngine,
+    DictAnalyzerResult,
+    EntityRecognizer,
+    RecognizerRegistry,
+    RecognizerResult,
+)
 
 
 @pytest.fixture(scope="module")
@@ -288,3 +295,124 @@ def test_batch_analyze_iterator_returns_list_of_recognizer_results(
     assert len(results) == len(expected_output)
     for result, expected_result in zip(results, expected_output):
         assert result == expected_result
+
+
+def test_when_no_recognizer_requires_nlp_artifacts_then_batch_not_processed(
+    batch_analyzer_engine_simple, mocker
+):
+    nlp_engine = batch_analyzer_engine_simple.analyzer_engine.nlp_engine
+    process_batch = mocker.spy(nlp_engine, "process_batch")
+
+    results = batch_analyzer_engine_simple.analyze_iterator(
+        texts=["Call me at 2352351232", "", 5], language="en"
+    )
+
+    assert process_batch.call_count == 0
+    assert [len(result) for result in results] == [1, 0, 0]
+
+
+def test_when_n_workers_then_same_results_in_input_order(
+    batch_analyzer_engine_simple, mocker
+):
+    mocker.patch.object(BatchAnalyzerEngine, "WORKER_SHARD_SIZE", 3)
+    texts = [
+        f"Call me at 20255512{i:02d}" if i % 3 else f"Nothing here {i}"
+        for i in range(20)
+    ]
+
+    expected = batch_analyzer_engine_simple.analyze_iterator(
+        texts=texts, language="en"
+    )
+    results = batch_analyzer_engine_simple.analyze_iterator(
+        texts=texts, language="en", n_workers=2
+    )
+
+    assert results == expected
+    assert [len(result) for result in results] == [
+        0 if i % 3 == 0 else 1 for i in range(20)
+    ]
+
+
+
+def test_when_n_workers_spawned_then_engine_pickled_and_same_results(
+    analyzer_engine_simple,
+):
+    batch_analyzer = BatchAnalyzerEngine(
+        analyzer_engine=analyzer_engine_simple, mp_context="spawn"
+    )
+    texts = [
+        f"Call me at 20255512{i:02d}" if i % 3 else f"Nothing here {i}"
+        for i in range(6)
+    ]
+
+    expected = batch_analyzer.analyze_iterator(texts=texts, language="en")
+    results = batch_analyzer.analyze_iterator(texts=texts, language="en", n_workers=2)
+
+    assert results == expected
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_when_analyze_iterator_columnar_then_same_results_as_columns(
+    batch_analyzer_engine_simple, n_workers
+):
+    texts = [
+        f"Call me at 20255512{i:02d}" if i % 3 else f"Nothing here {i}"
+        for i in range(10)
+    ]
+
+    expected = batch_analyzer_engine_simple.analyze_iterator(
+        texts=texts, language="en"
+    )
+    results = batch_analyzer_engine_simple.analyze_iterator_columnar(
+        texts=texts, language="en", n_workers=n_workers
+    )
+
+    assert results.n_docs == len(texts)
+    assert results.to_results() == expected
+    assert results.doc_index.tolist() == [i for i in range(10) if i % 3]
+
+
+class BatchLengthRecognizer(EntityRecognizer):
+    """Detect texts longer than 5 characters, recording the batches it gets."""
+
+    def __init__(self):
+        super().__init__(supported_entities=["LONG_TEXT"])
+        self.batches = []
+
+    def load(self):
+        pass
+
+    def analyze(self, text, entities, nlp_artifacts=None):
+        if len(text) <= 5:
+            return []
+        return [RecognizerResult("LONG_TEXT", 0, len(text), 0.6)]
+
+    def analyze_batch(self, texts, entities, nlp_artifacts_list=None):
+        self.batches.append(list(texts))
+        return super().analyze_batch(texts, entities, nlp_artifacts_list)
+
+
+@pytest.mark.parametrize("length_bucketing", [True, False])
+def test_when_recognizer_implements_analyze_batch_then_called_in_batches(
+    mock_nlp_engine, length_bucketing
+):
+    recognizer = BatchLengthRecognizer()
+    registry = RecognizerRegistry(recognizers=[recognizer])
+    analyzer_engine = AnalyzerEngine(registry=registry, nlp_engine=mock_nlp_engine)
+    batch_analyzer = BatchAnalyzerEngine(
+        analyzer_engine, recognizer_batch_size=3, length_bucketing=length_bucketing
+    )
+    texts = ["a" * (i * 7 % 10) for i in range(10)]
+
+    expected = [analyzer_engine.analyze(text, language="en") for text in texts]
+    recognizer.batches.clear()
+    results = batch_analyzer.analyze_iterator(texts, language="en")
+
+    assert results == expected
+    assert [len(batch) for batch in recognizer.batches] == [3, 3, 3, 1]
+    if length_bucketing:
+        assert [text for batch in recognizer.batches for text in batch] == sorted(
+            texts, key=len
+        )
+    else:
+        assert [text for batch in recognizer.batches for text in batch] == texts
@@ -0,0 +1,90 @@
+import pytest
+
+from presidio_analyzer import ColumnarRecognizerResults, RecognizerResult
+
+
+@pytest.fixture
+def results_list():
+    return [
+        [
+            RecognizerResult("PERSON", 0, 4, 0.85),
+            RecognizerResult("PHONE_NUMBER", 10, 20, 0.4),
+        ],
+        [],
+        [RecognizerResult("PERSON", 5, 9, 0.6)],
+        [],
+    ]
+
+
+def test_when_from_results_then_columns_expected(results_list):
+    results = ColumnarRecognizerResults.from_results(iter(results_list))
+
+    assert len(results) == 3
+    assert results.n_docs == 4
+    assert results.doc_index.tolist() == [0, 0, 2]
+    assert results.start.tolist() == [0, 10, 5]
+    assert results.end.tolist() == [4, 20, 9]
+    assert results.entity_types == ["PERSON", "PHONE_NUMBER"]
+    assert results.entity_type.tolist() == [0, 1, 0]
+    assert results.score.tolist() == [0.85, 0.4, 0.6]
+
+
+def test_when_to_results_then_same_as_object_results(results_list):
+    results = ColumnarRecognizerResults.from_results(results_list)
+
+    assert results.to_results() == results_list
+    assert results.get_document_results(2) == results_list[2]
+    assert type(results.to_results()[0][0].start) is int
+
+
+def test_when_no_results_then_empty_columns():
+    results = ColumnarRecognizerResults.from_results([])
+
+    assert len(results) == 0
+    assert results.n_docs == 0
+    assert results.to_results() == []
+
+
+def test_when_filter_then_rows_selected(results_list):
+    results = ColumnarRecognizerResults.from_results(results_list)
+
+    filtered = results.filter(results.score >= 0.5)
+
+    assert filtered.n_docs == 4
+    assert filtered.to_results() == [[results_list[0][0]], [], results_list[2], []]
+
+
+@pytest.mark.parametrize(
+    "entities, score_threshold, expected_starts",
+    [
+        (None, None, [0, 10, 5]),
+        (["PERSON"], None, [0, 5]),
+        (["PHONE_NUMBER", "EMAIL_ADDRESS"], None, [10]),
+        (None, 0.7, [0]),
+        (["PERSON"], 0.7, [0]),
+        ([], None, []),
+    ],
+)
+def test_when_filter_entities_then_rows_selected(
+    results_list, entities, score_threshold, expected_starts
+):
+    results = ColumnarRecognizerResults.from_results(results_list)
+
+    filtered = results.filter_entities(
+        entities=entities, score_threshold=score_threshold
+    )
+
+    assert filtered.start.tolist() == expected_starts
+
+
+def test_when_columns_of_different_lengths_then_value_error():
+    with pytest.raises(ValueError):
+        ColumnarRecognizerResults(
+            doc_index=[0, 1],
+            start=[0],
+            end=[1],
+            entity_type=[0],
+            score=[0.5],
+            entity_types=["PERSON"],
+            n_docs=2,
+        )
@@ -0,0 +1,69 @@
+import pytest
+import regex as re
+
+from presidio_analyzer import DenyListMatcher, PatternRecognizer
+
+
+def deny_list_regex_spans(deny_list, text, flags):
+    pattern = PatternRecognizer(
+        supported_entity="TEST", deny_list=deny_list
+    )._deny_list_to_regex(deny_list)
+    return [match.span() for match in re.finditer(pattern.regex, text, flags=flags)]
+
+
+@pytest.mark.parametrize(
+    "deny_list, text, expected",
+    [
+        (["john"], "John met JOHN and johnny", [(0, 4), (9, 13)]),
+        (["Mr.", "Mrs."], "mr. and MRS. Smith", [(0, 3), (8, 12)]),
+        (["A B", "B C"], "A B C", [(0, 3)]),
+        (["A B", "B C"], "A B B C", [(0, 3), (4, 7)]),
+        (["new", "new york"], "new york", [(0, 3)]),
+        (["new york", "new"], "new york", [(0, 8)]),
+        (["straße"], "STRASSE Straße STRAẞE", [(8, 14), (15, 21)]),
+        (["i"], "I İ ı", [(0, 1), (2, 3)]),
+        (["İ"], "I İ i", [(2, 3), (4, 5)]),
+        (["도로공사"], "한국도로공사 도로공사", [(7, 11)]),
+        (["", "x"], "x", [(0, 1)]),
+        ([""], "x", []),
+    ],
+)
+def test_when_deny_list_matched_then_same_spans_as_regex(deny_list, text, expected):
+    flags = re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+    spans = list(DenyListMatcher(deny_list).finditer(text, ignore_case=True))
+
+    assert spans == expected
+    assert spans == deny_list_regex_spans(deny_list, text, flags)
+
+
+def test_when_case_sensitive_then_case_respected():
+    matcher = DenyListMatcher(["John"])
+
+    spans = list(matcher.finditer("John and JOHN", ignore_case=False))
+
+    assert spans == [(0, 4)]
+    assert spans == deny_list_regex_spans(["John"], "John and JOHN", re.DOTALL)
+
+
+@pytest.mark.parametrize(
+    "flags, expected",
+    [
+        (None, True),
+        (re.DOTALL | re.MULTILINE | re.IGNORECASE, True),
+        (re.IGNORECASE | re.ASCII, False),
+        (re.IGNORECASE | re.FULLCASE | re.V1, False),
+    ],
+)
+def test_when_checking_flags_then_unsupported_flags_detected(flags, expected):
+    assert DenyListMatcher.supports_flags(flags) == expected
+
+
+def test_when_large_deny_list_then_matched_in_linear_time():
+    deny_list = [f"name{i}" for i in range(100_000)]
+    text = "Hello Name99999, meet name0 and name100000. " * 100
+
+    spans = list(DenyListMatcher(deny_list).finditer(text))
+
+    assert len(spans) == 200
+    assert text[spans[0][0] : spans[0][1]] == "Name99999"
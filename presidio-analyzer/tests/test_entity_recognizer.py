@@ -1,3 +1,5 @@
+import random
+
 from presidio_analyzer import EntityRecognizer, RecognizerResult, AnalysisExplanation
 
 
@@ -120,6 +122,56 @@ def test_when_remove_duplicates_contained_shorter_length_results_removed():
     results = EntityRecognizer.remove_duplicates(arr)
     assert len(results) == 1
 
+def test_when_remove_duplicates_contained_in_lower_score_result_then_kept():
+    arr = [
+        RecognizerResult(start=0, end=10, score=0.5, entity_type="x"),
+        RecognizerResult(start=2, end=5, score=0.8, entity_type="x"),
+        RecognizerResult(start=2, end=5, score=0.3, entity_type="x"),
+        RecognizerResult(start=2, end=5, score=0.3, entity_type="y"),
+        RecognizerResult(start=6, end=7, score=0, entity_type="y"),
+    ]
+    results = EntityRecognizer.remove_duplicates(arr)
+    assert results == [arr[1], arr[0], arr[3]]
+
+
+def test_when_remove_duplicates_then_same_results_as_pairwise_comparison():
+    rng = random.Random(0)
+    for _ in range(200):
+        arr = []
+        for _ in range(rng.randint(0, 40)):
+            start = rng.randrange(30)
+            arr.append(
+                RecognizerResult(
+                    entity_type=rng.choice(["x", "y"]),
+                    start=start,
+                    end=start + rng.randint(0, 8),
+                    score=rng.choice([0, 0.3, 0.5, 1.0]),
+                )
+            )
+
+        distinct = set(arr)
+        expected = {
+            result
+            for result in distinct
+            if result.score != 0
+            and not any(
+                other != result
+                and other.score != 0
+                and other.entity_type == result.entity_type
+                and result.contained_in(other)
+                and other.score >= result.score
+                for other in distinct
+            )
+        }
+
+        results = EntityRecognizer.remove_duplicates(arr)
+        assert len(results) == len(expected)
+        assert set(results) == expected
+        assert results == sorted(
+            results, key=lambda x: (-x.score, x.start, -(x.end - x.start))
+        )
+
+
 import pytest
 
 sanitizer_test_set = [
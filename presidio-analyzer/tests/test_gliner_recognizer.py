@@ -131,3 +131,81 @@ def test_analyze_with_no_entities(mock_gliner):
 
     # Should return no results
     assert len(results) == 0
+
+
+def test_analyze_batch_uses_batch_prediction(mock_gliner):
+    if sys.version_info < (3, 10):
+        pytest.skip("gliner requires Python >= 3.10")
+
+    mock_gliner.batch_predict_entities.return_value = [
+        [{"label": "person", "start": 11, "end": 19, "score": 0.95}],
+        [],
+        [{"label": "location", "start": 0, "end": 7, "score": 0.85}],
+    ]
+
+    gliner_recognizer = GLiNERRecognizer(
+        entity_mapping={"person": "PERSON", "location": "LOC"},
+    )
+    gliner_recognizer.gliner = mock_gliner
+
+    texts = ["My name is John Doe", "Nothing here", "Seattle is rainy"]
+    results = gliner_recognizer.analyze_batch(texts, ["PERSON", "LOC"])
+
+    assert mock_gliner.batch_predict_entities.call_count == 1
+    assert mock_gliner.batch_predict_entities.call_args.kwargs["texts"] == texts
+    assert [[r.entity_type for r in result] for result in results] == [
+        ["PERSON"],
+        [],
+        ["LOC"],
+    ]
+
+
+def test_analyze_long_text_chunks_inferred_as_one_batch(mock_gliner):
+    if sys.version_info < (3, 10):
+        pytest.skip("gliner requires Python >= 3.10")
+
+    def predict_names(texts, **kwargs):
+        predictions = []
+        for text in texts:
+            start = text.find("John Doe")
+            predictions.append(
+                []
+                if start == -1
+                else [{"label": "person", "start": start, "end": start + 8, "score": 0.9}]
+            )
+        return predictions
+
+    mock_gliner.batch_predict_entities.side_effect = predict_names
+
+    gliner_recognizer = GLiNERRecognizer(
+        entity_mapping={"person": "PERSON"}, chunk_size=8, chunk_overlap=3
+    )
+    gliner_recognizer.gliner = mock_gliner
+
+    # "John Doe" is in the overlap of the first two chunks
+    text = "one two three four five John Doe six seven. eight nine ten John Doe"
+    results = gliner_recognizer.analyze(text, ["PERSON"])
+
+    assert mock_gliner.batch_predict_entities.call_count == 1
+    assert len(mock_gliner.batch_predict_entities.call_args.kwargs["texts"]) > 1
+    assert not mock_gliner.predict_entities.called
+    assert sorted((r.start, r.end) for r in results) == [(24, 32), (59, 67)]
+    assert all(text[r.start : r.end] == "John Doe" for r in results)
+
+
+def test_load_onnx_model_passes_onnx_file_to_gliner():
+    pytest.importorskip("gliner", reason="GLiNER package is not installed")
+    if sys.version_info < (3, 10):
+        pytest.skip("gliner requires Python >= 3.10")
+
+    with patch("gliner.GLiNER.from_pretrained") as from_pretrained:
+        GLiNERRecognizer(
+            load_onnx_model=True, onnx_model_file="model_quantized.onnx"
+        )
+
+    from_pretrained.assert_called_once_with(
+        "urchade/gliner_multi_pii-v1",
+        load_onnx_model=True,
+        load_tokenizer=True,
+        onnx_model_file="model_quantized.onnx",
+    )
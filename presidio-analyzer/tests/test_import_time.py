@@ -0,0 +1,64 @@
+import json
+import subprocess
+import sys
+
+# Generous budget for importing presidio_analyzer and creating a PatternRecognizer,
+# which takes about 0.1 second, while importing spaCy alone takes more than 1
+IMPORT_TIME_BUDGET_SECONDS = 0.75
+
+IMPORT_PRESIDIO = """
+import json, sys, time
+start = time.perf_counter()
+from presidio_analyzer import Pattern, PatternRecognizer
+PatternRecognizer(supported_entity="ZIP", patterns=[Pattern("zip", r"\\d{5}", 0.5)])
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "modules": list(sys.modules)}))
+"""
+
+
+def import_presidio_in_new_process():
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PRESIDIO],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_when_import_presidio_analyzer_then_nlp_libraries_not_imported():
+    modules = import_presidio_in_new_process()["modules"]
+
+    for heavy_module in (
+        "spacy",
+        "stanza",
+        "transformers",
+        "phonenumbers",
+        "numpy",
+        "presidio_analyzer.predefined_recognizers.generic",
+        "presidio_analyzer.nlp_engine.spacy_nlp_engine",
+    ):
+        assert heavy_module not in modules
+
+
+def test_when_import_presidio_analyzer_then_within_time_budget():
+    # the fastest of a few runs, to be robust to a busy machine
+    seconds = min(import_presidio_in_new_process()["seconds"] for _ in range(3))
+
+    assert seconds < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_when_lazy_attributes_accessed_then_imported():
+    import presidio_analyzer
+    from presidio_analyzer import nlp_engine, predefined_recognizers
+
+    assert presidio_analyzer.AnalyzerEngine.__name__ == "AnalyzerEngine"
+    assert nlp_engine.SpacyNlpEngine.__name__ == "SpacyNlpEngine"
+    assert (
+        predefined_recognizers.NLP_RECOGNIZERS["spacy"]
+        is predefined_recognizers.SpacyRecognizer
+    )
+    for module in (presidio_analyzer, nlp_engine, predefined_recognizers):
+        for name in module.__all__:
+            assert name in dir(module)
+            assert getattr(module, name) is not None
@@ -1,4 +1,15 @@
-from presidio_analyzer import LemmaContextAwareEnhancer
+from unittest.mock import Mock
+
+import pytest
+
+from presidio_analyzer import (
+    AnalysisExplanation,
+    LemmaContextAwareEnhancer,
+    Pattern,
+    PatternRecognizer,
+    RecognizerResult,
+)
+from presidio_analyzer.nlp_engine import NlpArtifacts
 
 
 def test_when_index_finding_then_succeed():
@@ -13,3 +24,132 @@ def test_when_index_finding_then_succeed():
         match, start, tokens, tokens_indices
     )
     assert index == 3
+
+
+@pytest.mark.parametrize(
+    "start, expected_index",
+    [(0, 0), (2, 1), (3, 1), (9, 2), (23, 4), (24, 5), (32, 7)],
+)
+def test_when_index_finding_between_tokens_then_next_token(start, expected_index):
+    tokens = ["my", "phone", "number", "is:(425", ")", "882", "-", "9090"]
+    tokens_indices = [0, 3, 9, 16, 23, 25, 28, 29]
+    index = LemmaContextAwareEnhancer._find_index_of_match_token(
+        "word", start, tokens, tokens_indices
+    )
+    assert index == expected_index
+
+
+def test_when_index_finding_after_last_token_then_value_error():
+    with pytest.raises(ValueError):
+        LemmaContextAwareEnhancer._find_index_of_match_token(
+            "word", 8, ["my", "phone"], [0, 3]
+        )
+
+
+class StopwordNlpEngine:
+    def is_stopword(self, word, language):
+        return word in ("my", "is")
+
+    def is_punct(self, word, language):
+        return word in (":", "-")
+
+
+def test_when_context_words_around_results_then_only_those_enhanced():
+    words = ["my", "phone", "is", "1234", "and", "zip", "is", "5678", "-", "1234"]
+    text = " ".join(words)
+    tokens_indices = [sum(len(word) + 1 for word in words[:i]) for i in range(10)]
+    nlp_artifacts = NlpArtifacts(
+        entities=[],
+        tokens=words,
+        tokens_indices=tokens_indices,
+        lemmas=words,
+        nlp_engine=StopwordNlpEngine(),
+        language="en",
+    )
+    recognizer = PatternRecognizer(
+        "NUMBER", patterns=[Pattern("number", r"\d{4}", 0.1)], context=["phone"]
+    )
+    results = [
+        RecognizerResult(
+            "NUMBER",
+            start,
+            start + 4,
+            0.1,
+            analysis_explanation=AnalysisExplanation("test", 0.1),
+            recognition_metadata={
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: recognizer.id
+            },
+        )
+        for start in (tokens_indices[3], tokens_indices[7], tokens_indices[9])
+    ]
+
+    enhancer = LemmaContextAwareEnhancer(context_prefix_count=2)
+    enhanced = enhancer.enhance_using_context(
+        text, results, nlp_artifacts, [recognizer]
+    )
+
+    # "phone" is the second keyword before the first result only
+    assert [result.score for result in enhanced] == pytest.approx([0.45, 0.1, 0.1])
+    assert enhanced[0].analysis_explanation.supportive_context_word == "phone"
+    # only the enhanced result is copied, the input results are unchanged
+    assert enhanced[0] is not results[0]
+    assert enhanced[1:] == results[1:]
+    assert enhanced[1] is results[1]
+    assert [result.score for result in results] == [0.1, 0.1, 0.1]
+    assert results[0].analysis_explanation.supportive_context_word == ""
+
+    enhanced = enhancer.enhance_using_context(
+        text, results, nlp_artifacts, [recognizer], context=["Phone"]
+    )
+    assert [result.score for result in enhanced] == pytest.approx([0.45, 0.45, 0.45])
+
+
+def test_when_result_enhanced_then_explanation_built_on_access():
+    text = "my phone is 1234"
+    nlp_artifacts = NlpArtifacts(
+        entities=[],
+        tokens=text.split(),
+        tokens_indices=[0, 3, 9, 12],
+        lemmas=text.split(),
+        nlp_engine=StopwordNlpEngine(),
+        language="en",
+    )
+    recognizer = PatternRecognizer(
+        "NUMBER", patterns=[Pattern("number", r"\d{4}", 0.1)], context=["phone"]
+    )
+    build_explanation = Mock(side_effect=lambda: AnalysisExplanation("test", 0.1))
+    result = RecognizerResult(
+        "NUMBER",
+        12,
+        16,
+        0.1,
+        analysis_explanation=build_explanation,
+        recognition_metadata={
+            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: recognizer.id
+        },
+    )
+
+    enhanced = LemmaContextAwareEnhancer().enhance_using_context(
+        text, [result], nlp_artifacts, [recognizer]
+    )
+
+    build_explanation.assert_not_called()
+    assert enhanced[0].score == pytest.approx(0.45)
+    explanation = enhanced[0].analysis_explanation
+    assert explanation.supportive_context_word == "phone"
+    assert explanation.score == pytest.approx(0.45)
+    assert explanation.score_context_improvement == pytest.approx(0.35)
+    assert result.analysis_explanation.supportive_context_word == ""
+    assert result.analysis_explanation.score == 0.1
+
+
+def test_when_add_n_words_then_keywords_around_index_collected():
+    enhancer = LemmaContextAwareEnhancer()
+    lemmas = ["my", "phone", "number", "be", "555", "call", "me", "now"]
+    keywords = ["phone", "number", "call", "now"]
+
+    assert enhancer._add_n_words_backward(4, 1, lemmas, keywords) == [
+        "number",
+        "phone",
+    ]
+    assert enhancer._add_n_words_forward(4, 5, lemmas, keywords) == ["call", "now"]
@@ -0,0 +1,186 @@
+import pickle
+
+import pytest
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    MultiPatternScanner,
+    Pattern,
+    PatternRecognizer,
+    RecognizerRegistry,
+)
+from presidio_analyzer.predefined_recognizers import (
+    CreditCardRecognizer,
+    CryptoRecognizer,
+    DateRecognizer,
+    EmailRecognizer,
+    IbanRecognizer,
+    IpRecognizer,
+    KrRrnRecognizer,
+    UrlRecognizer,
+    UsSsnRecognizer,
+)
+
+
+@pytest.fixture(scope="module")
+def pattern_recognizers():
+    pytest.importorskip("re2", reason="google-re2 package is not installed")
+
+    return [
+        CreditCardRecognizer(),
+        CryptoRecognizer(),
+        DateRecognizer(),
+        EmailRecognizer(),
+        IpRecognizer(),
+        KrRrnRecognizer(supported_language="en"),
+        UrlRecognizer(),
+        UsSsnRecognizer(),
+        PatternRecognizer(
+            supported_entity="TITLE", deny_list=["Mr.", "Mrs.", "Dr."]
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def scanner(pattern_recognizers):
+    return MultiPatternScanner(pattern_recognizers)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "No PII in this text at all",
+        "안녕하세요 도로공사 민원입니다",
+        "My email is john@example.com and my ssn is 078-05-1121",
+        "Card 4012888888881881 used on 12/03/1990 from 192.168.0.1",
+        "Mr. Smith visited https://www.microsoft.com/en-us yesterday",
+        "RRN 900101-1234567, wallet 16Yeky6GMjeNkAiNcBY7ZhrLoMSgg1BoyZ",
+        "Dates: 2021-12-31, 31.12.2021 and 31-Dec-2021\nIPv6: fe80::1",
+        "Arabic-Indic digits ١٢/٠٣/١٩٩٠ and Dr. Who",
+    ],
+)
+def test_when_scanning_then_results_identical_to_recognizers(
+    pattern_recognizers, scanner, text
+):
+    scanned = scanner.analyze(text)
+
+    assert set(scanned.keys()) == {rec.id for rec in pattern_recognizers}
+    for recognizer in pattern_recognizers:
+        expected = recognizer.analyze(text, entities=[])
+        actual = scanned[recognizer.id]
+        assert sorted(map(str, actual)) == sorted(map(str, expected))
+
+
+def test_when_text_has_no_candidates_then_no_pattern_evaluated(
+    pattern_recognizers, scanner, mocker
+):
+    spies = [
+        mocker.spy(recognizer, "_analyze_patterns")
+        for recognizer in pattern_recognizers
+    ]
+
+    scanner.analyze("nothing to see here")
+
+    assert all(spy.call_count == 0 for spy in spies)
+
+
+def test_when_recognizer_overrides_analyze_then_not_supported(scanner):
+    assert not MultiPatternScanner.is_supported(IbanRecognizer())
+    with pytest.raises(ValueError):
+        MultiPatternScanner([IbanRecognizer()])
+
+
+@pytest.mark.parametrize(
+    "regex, expected",
+    [
+        (r"abc", r"(?ims)abc"),
+        (r"(?<=\W)ab(?!c)", r"(?ims)(?:)ab(?:)"),
+        (r"\bab\b", r"(?ims)(?:)ab(?:)"),
+        (r"a{,3}", r"(?ims)a{0,3}"),
+        (r"a++b*+", r"(?ims)a+b*"),
+        (r"a+?", r"(?ims)a+?"),
+        (r"(?i)(?P<x>a)(?P=x)", r"(?ims)(?P<x>a)(?:(?s:.*))"),
+        (r"(a)\1", r"(?ims)(a)(?s:.*)"),
+        (r"(?>a)(?#comment)", r"(?ims)(?:a)"),
+        (r"[]a{]\}", r"(?ims)[\]a{]\}"),
+        (r"\u00e9", r"(?ims)\x{00e9}"),
+    ],
+)
+def test_when_translating_to_re2_then_pattern_relaxed(regex, expected):
+    assert MultiPatternScanner.to_re2(regex) == expected
+
+
+@pytest.mark.parametrize(
+    "regex", [r"(?(1)a|b)", r"[[:alpha:]]", r"[\W]", r"(?x)a b", r"(a", r"\N{DASH}"]
+)
+def test_when_pattern_cant_be_translated_then_none(regex):
+    assert MultiPatternScanner.to_re2(regex) is None
+
+
+def test_when_shorthand_class_then_unicode_ranges_used():
+    pytest.importorskip("re2", reason="google-re2 package is not installed")
+    import re2
+
+    digits = re2.compile(MultiPatternScanner.to_re2(r"^\d+$"))
+    words = re2.compile(MultiPatternScanner.to_re2(r"^\w+$"))
+
+    assert digits.search("١٢٣")
+    assert words.search("도로공사")
+
+
+def test_when_pattern_cant_be_translated_then_always_evaluated(mocker):
+    pytest.importorskip("re2", reason="google-re2 package is not installed")
+    recognizer = PatternRecognizer(
+        supported_entity="CONDITIONAL",
+        patterns=[Pattern("conditional", r"(a)?(?(1)b|c)", 0.5)],
+    )
+    spy = mocker.spy(recognizer, "_analyze_patterns")
+
+    results = MultiPatternScanner([recognizer]).analyze("xyz")
+
+    assert results[recognizer.id] == []
+    assert spy.call_count == 1
+
+
+def test_when_multi_pattern_scanning_then_engine_results_unchanged(
+    pattern_recognizers, mock_nlp_engine
+):
+    registry = RecognizerRegistry(recognizers=list(pattern_recognizers))
+    engine = AnalyzerEngine(registry=registry, nlp_engine=mock_nlp_engine)
+    scanning_engine = AnalyzerEngine(
+        registry=registry, nlp_engine=mock_nlp_engine, multi_pattern_scanning=True
+    )
+    ad_hoc = PatternRecognizer(supported_entity="ZIP", deny_list=["12345"])
+    text = (
+        "Mr. Smith (john@example.com, 078-05-1121) lives in 12345 "
+        "and visited https://www.microsoft.com on 12/03/1990"
+    )
+
+    expected = engine.analyze(text, language="en", ad_hoc_recognizers=[ad_hoc])
+    actual = scanning_engine.analyze(
+        text, language="en", ad_hoc_recognizers=[ad_hoc]
+    )
+
+    assert sorted(map(str, actual)) == sorted(map(str, expected))
+    assert len(scanning_engine._pattern_scanners) == 1
+
+    scanning_engine.analyze(text, language="en", ad_hoc_recognizers=[ad_hoc])
+    assert len(scanning_engine._pattern_scanners) == 1
+
+
+def test_when_engine_with_scanners_pickled_then_same_results(
+    pattern_recognizers, mock_nlp_engine
+):
+    registry = RecognizerRegistry(recognizers=list(pattern_recognizers))
+    engine = AnalyzerEngine(
+        registry=registry, nlp_engine=mock_nlp_engine, multi_pattern_scanning=True
+    )
+    text = "Mr. Smith (john@example.com, 078-05-1121) visited https://microsoft.com"
+    expected = engine.analyze(text, language="en")
+
+    unpickled = pickle.loads(pickle.dumps(engine))
+
+    assert len(unpickled._pattern_scanners) == 1
+    results = unpickled.analyze(text, language="en")
+    assert sorted(map(str, results)) == sorted(map(str, expected))
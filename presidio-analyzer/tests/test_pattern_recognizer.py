@@ -128,6 +128,67 @@ def test_when_validation_occurs_then_analysis_explanation_is_updated():
     assert results[0].analysis_explanation.score == 1
 
 
+def test_when_analyze_then_analysis_explanation_built_on_access(mocker):
+    patterns = [Pattern(name="test_pattern", regex="([0-9]{1,9})", score=0.5)]
+    mock_recognizer = MockRecognizer(
+        entity="TEST",
+        patterns=patterns,
+        deny_list=None,
+        name="MockRecognizer",
+        context=None,
+    )
+    build_regex_explanation = mocker.patch.object(
+        MockRecognizer,
+        "build_regex_explanation",
+        wraps=PatternRecognizer.build_regex_explanation,
+    )
+
+    results = mock_recognizer.analyze(text="Testing 1 2 3", entities=["TEST"])
+
+    assert len(results) == 3
+    assert build_regex_explanation.call_count == 0
+    assert results[0].analysis_explanation.pattern_name == "test_pattern"
+    assert build_regex_explanation.call_count == 1
+
+
+def test_when_build_regex_explanation_overridden_then_override_used_with_score():
+    class ExplainingRecognizer(PatternRecognizer):
+        @staticmethod
+        def build_regex_explanation(
+            recognizer_name,
+            pattern_name,
+            pattern,
+            original_score,
+            validation_result,
+            regex_flags,
+        ):
+            explanation = PatternRecognizer.build_regex_explanation(
+                recognizer_name,
+                pattern_name,
+                pattern,
+                original_score,
+                validation_result,
+                regex_flags,
+            )
+            explanation.textual_explanation = "overridden"
+            return explanation
+
+        def validate_result(self, pattern_text):
+            return True
+
+    recognizer = ExplainingRecognizer(
+        supported_entity="TEST",
+        patterns=[Pattern(name="test_pattern", regex="[0-9]+", score=0.5)],
+    )
+
+    results = recognizer.analyze(text="Testing 1", entities=["TEST"])
+
+    explanation = results[0].analysis_explanation
+    assert explanation.textual_explanation == "overridden"
+    assert explanation.original_score == 0.5
+    assert explanation.score == 1.0
+
+
 @pytest.mark.parametrize(
     "text, expected_len, deny_list",
     [
@@ -219,3 +280,34 @@ def test_global_regex_flag_deny_list_returns_right_result(global_flag, expected_
 
     results = recognizer_ignore_case.analyze(text=text, entities=["TITLE"])
     assert len(results) == expected_len
+
+
+@pytest.mark.parametrize(
+    "text, deny_list",
+    [
+        ("Mr. PLUM", ["Mr.", "Mrs."]),
+        ("\\Mr.\\ PLUM...,mrs. Plum", ["Mr.", "Mrs."]),
+        ("MMrrrMrs.", ["Mr.", "Mrs."]),
+        ("A B B C", ["A B", "B C"]),
+        ("Hi A.,.\\.B Hi", ["A.,.\\.B"]),
+        ("John Smith and JOHN met Smith", ["John", "Smith", "John Smith"]),
+    ],
+)
+def test_when_deny_list_above_threshold_then_same_results_as_regex(
+    text, deny_list, monkeypatch
+):
+    regex_recognizer = PatternRecognizer(supported_entity="NAME", deny_list=deny_list)
+    monkeypatch.setattr(PatternRecognizer, "DENY_LIST_MATCHER_THRESHOLD", 1)
+    matcher_recognizer = PatternRecognizer(
+        supported_entity="NAME", deny_list=deny_list
+    )
+
+    assert regex_recognizer._deny_list_matcher is None
+    assert matcher_recognizer._deny_list_matcher is not None
+
+    expected = regex_recognizer.analyze(text, entities=["NAME"])
+    actual = matcher_recognizer.analyze(text, entities=["NAME"])
+    assert [(r.start, r.end, r.score) for r in actual] == [
+        (r.start, r.end, r.score) for r in expected
+    ]
+    assert matcher_recognizer.patterns[0].compiled_regex is None
@@ -1,3 +1,6 @@
+import itertools
+import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -245,3 +248,142 @@ def test_remove_recognizer_when_multiple_instances_exist():
     assert len([rec for rec in registry.recognizers
                 if rec.name == "SpacyRecognizer"]) == 1
 
+
+
+def test_when_get_recognizers_twice_then_same_recognizers_in_new_lists(
+    mock_recognizer_registry,
+):
+    registry = mock_recognizer_registry
+    first = registry.get_recognizers(language="he", entities=["PERSON", "ADDRESS"])
+    first.clear()
+    second = registry.get_recognizers(language="he", entities=["ADDRESS", "PERSON"])
+
+    assert [rec.name for rec in second] == ["4", "5"]
+
+
+def test_when_add_recognizer_after_get_recognizers_then_it_is_returned(
+    mock_recognizer_registry,
+):
+    registry = mock_recognizer_registry
+    assert len(registry.get_recognizers(language="en", entities=["PERSON"])) == 1
+
+    registry.add_recognizer(create_mock_pattern_recognizer("en", "PERSON", "6"))
+    recognizers = registry.get_recognizers(language="en", entities=["PERSON"])
+
+    assert [rec.name for rec in recognizers] == ["1", "6"]
+
+
+def test_when_remove_recognizer_after_get_recognizers_then_it_is_not_returned(
+    mock_recognizer_registry,
+):
+    registry = mock_recognizer_registry
+    assert len(registry.get_recognizers(language="he", all_fields=True)) == 2
+
+    registry.remove_recognizer("4")
+    recognizers = registry.get_recognizers(language="he", all_fields=True)
+
+    assert [rec.name for rec in recognizers] == ["5"]
+
+
+def test_when_recognizers_list_changed_directly_then_get_recognizers_updated(
+    mock_recognizer_registry,
+):
+    registry = mock_recognizer_registry
+    assert len(registry.get_recognizers(language="de", entities=["PERSON"])) == 1
+
+    registry.recognizers.append(create_mock_pattern_recognizer("de", "PERSON", "6"))
+    assert len(registry.get_recognizers(language="de", entities=["PERSON"])) == 2
+
+    registry.recognizers = [create_mock_pattern_recognizer("de", "PERSON", "7")]
+    recognizers = registry.get_recognizers(language="de", entities=["PERSON"])
+    assert [rec.name for rec in recognizers] == ["7"]
+
+
+def test_when_recognizer_replaced_in_place_then_get_recognizers_updated():
+    registry = RecognizerRegistry(
+        [
+            create_mock_pattern_recognizer("en", "PERSON", "1"),
+            create_mock_pattern_recognizer("en", "ADDRESS", "2"),
+        ]
+    )
+    assert len(registry.get_recognizers(language="en", entities=["ADDRESS"])) == 1
+
+    registry.recognizers[1] = create_mock_pattern_recognizer("en", "PHONE", "3")
+    recognizers = registry.get_recognizers(language="en", entities=["PHONE"])
+    assert [rec.name for rec in recognizers] == ["3"]
+
+    registry.recognizers[0].supported_language = "de"
+    recognizers = registry.get_recognizers(language="de", entities=["PERSON"])
+    assert [rec.name for rec in recognizers] == ["1"]
+    recognizers = registry.get_recognizers(language="en", all_fields=True)
+    assert [rec.name for rec in recognizers] == ["3"]
+
+
+def test_when_get_recognizers_with_ad_hoc_then_merged_and_not_cached(
+    mock_recognizer_registry,
+):
+    registry = mock_recognizer_registry
+    ad_hoc = [
+        create_mock_pattern_recognizer("en", "ZIP", "ad_hoc_en"),
+        create_mock_pattern_recognizer("de", "ZIP", "ad_hoc_de"),
+    ]
+
+    recognizers = registry.get_recognizers(
+        language="en", entities=["PERSON", "ZIP"], ad_hoc_recognizers=ad_hoc
+    )
+    assert [rec.name for rec in recognizers] == ["1", "ad_hoc_en"]
+
+    recognizers = registry.get_recognizers(language="en", entities=["PERSON", "ZIP"])
+    assert [rec.name for rec in recognizers] == ["1"]
+
+
+def test_when_get_recognizers_only_ad_hoc_entity_then_ad_hoc_returned(
+    mock_recognizer_registry,
+):
+    registry = mock_recognizer_registry
+    ad_hoc = [create_mock_pattern_recognizer("en", "ZIP", "ad_hoc")]
+
+    recognizers = registry.get_recognizers(
+        language="en", entities=["ZIP"], ad_hoc_recognizers=ad_hoc
+    )
+    assert [rec.name for rec in recognizers] == ["ad_hoc"]
+
+    with pytest.raises(ValueError):
+        registry.get_recognizers(language="en", entities=["ZIP"])
+
+
+def test_when_get_recognizers_from_threads_then_cache_eviction_is_safe(monkeypatch):
+    entities = [f"ENTITY_{i}" for i in range(6)]
+    registry = RecognizerRegistry(
+        recognizers=[
+            create_mock_pattern_recognizer("en", entity, entity) for entity in entities
+        ]
+    )
+    monkeypatch.setattr(registry, "MAX_CACHED_RECOGNIZER_LISTS", 2)
+    # switch threads often, for the threads to evict concurrently
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    combinations = list(itertools.combinations(entities, 2))
+    errors = []
+
+    def get_recognizers():
+        try:
+            for _ in range(500):
+                for combination in combinations:
+                    recognizers = registry.get_recognizers(
+                        language="en", entities=list(combination)
+                    )
+                    assert [rec.name for rec in recognizers] == list(combination)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=get_recognizers) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
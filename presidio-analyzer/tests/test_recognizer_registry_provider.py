@@ -5,8 +5,14 @@ from typing import List
 from inspect import signature
 
 from presidio_analyzer.predefined_recognizers import SpacyRecognizer
-from presidio_analyzer.recognizer_registry import RecognizerRegistryProvider
-from presidio_analyzer.recognizer_registry.recognizers_loader_utils import RecognizerConfigurationLoader
+from presidio_analyzer.recognizer_registry import (
+    RecognizerRegistryProvider,
+    RecognizerRegistrySnapshot,
+)
+from presidio_analyzer.recognizer_registry.recognizers_loader_utils import (
+    RecognizerConfigurationLoader,
+    RecognizerListLoader,
+)
 from presidio_analyzer import RecognizerRegistry
 
 
@@ -149,4 +155,66 @@ def test_default_attributes_equal_recognizer_registry_signature():
     registry_provider = RecognizerRegistryProvider()
     provider_fields = set(RecognizerConfigurationLoader.mandatory_keys)
 
-    assert registry_fields == provider_fields
\ No newline at end of file
+    assert registry_fields == provider_fields
+
+def test_recognizer_registry_provider_when_snapshot_then_saved_and_loaded(
+    tmp_path, mocker
+):
+    snapshot_file = tmp_path / "registry.pkl"
+    provider = RecognizerRegistryProvider(snapshot_file=snapshot_file)
+    registry = provider.create_recognizer_registry()
+    assert snapshot_file.exists()
+
+    load_recognizers = mocker.spy(RecognizerListLoader, "get")
+    loaded_registry = RecognizerRegistryProvider(
+        snapshot_file=snapshot_file
+    ).create_recognizer_registry()
+
+    load_recognizers.assert_not_called()
+    assert [rec.id for rec in loaded_registry.recognizers] == [
+        rec.id for rec in registry.recognizers
+    ]
+    email_recognizer = loaded_registry.get_recognizers(
+        language="en", entities=["EMAIL_ADDRESS"]
+    )[0]
+    assert all(pattern.compiled_regex for pattern in email_recognizer.patterns)
+    assert email_recognizer.analyze("mail me at a@b.com", ["EMAIL_ADDRESS"])
+
+
+def test_recognizer_registry_provider_when_snapshot_of_other_configuration_then_rebuilt(
+    tmp_path,
+):
+    snapshot_file = tmp_path / "registry.pkl"
+    RecognizerRegistryProvider(snapshot_file=snapshot_file).create_recognizer_registry()
+
+    registry = RecognizerRegistryProvider(
+        registry_configuration={"supported_languages": ["en", "es"]},
+        snapshot_file=snapshot_file,
+    ).create_recognizer_registry()
+    assert "es" in registry.supported_languages
+
+    loaded_registry = RecognizerRegistrySnapshot(snapshot_file).load(
+        RecognizerRegistrySnapshot.get_fingerprint(
+            RecognizerConfigurationLoader.get(
+                registry_configuration={"supported_languages": ["en", "es"]}
+            )
+        )
+    )
+    assert loaded_registry.supported_languages == registry.supported_languages
+
+
+def test_recognizer_registry_provider_when_snapshot_corrupt_then_rebuilt(
+    tmp_path, mandatory_recognizers
+):
+    snapshot_file = tmp_path / "registry.pkl"
+    snapshot_file.write_bytes(b"not a snapshot")
+
+    registry = RecognizerRegistryProvider(
+        snapshot_file=snapshot_file
+    ).create_recognizer_registry()
+
+    assert_default_configuration(registry, mandatory_recognizers)
+    fingerprint = RecognizerRegistrySnapshot.get_fingerprint(
+        RecognizerConfigurationLoader.get()
+    )
+    assert RecognizerRegistrySnapshot(snapshot_file).load(fingerprint)
@@ -1,6 +1,10 @@
+import copy
+import pickle
+from unittest.mock import Mock
+
 import pytest
 
-from presidio_analyzer import RecognizerResult
+from presidio_analyzer import AnalysisExplanation, PatternRecognizer, RecognizerResult
 
 
 @pytest.mark.parametrize(
@@ -202,6 +206,107 @@ def test_given_recognizer_result_then_one_is_not_greater_then_another(start, end
     assert not first.__gt__(second)
 
 
+def test_given_explanation_builder_then_built_once_on_access():
+    explanation = AnalysisExplanation(recognizer="test", original_score=0.5)
+    build_explanation = Mock(return_value=explanation)
+    result = RecognizerResult("TEST", 0, 5, 0.5, analysis_explanation=build_explanation)
+
+    build_explanation.assert_not_called()
+    assert result.analysis_explanation is explanation
+    assert result.to_dict()["analysis_explanation"] is explanation
+    build_explanation.assert_called_once_with()
+
+
+def test_given_explanation_builder_then_not_built_when_removed():
+    build_explanation = Mock()
+    result = RecognizerResult("TEST", 0, 5, 0.5, analysis_explanation=build_explanation)
+
+    result.analysis_explanation = None
+
+    assert result.analysis_explanation is None
+    build_explanation.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "copy_result", [copy.deepcopy, lambda r: pickle.loads(pickle.dumps(r))]
+)
+def test_given_explanation_builder_when_copied_then_explanation_built(copy_result):
+    result = RecognizerResult(
+        "TEST",
+        0,
+        5,
+        0.5,
+        analysis_explanation=lambda: AnalysisExplanation("test", original_score=0.5),
+        recognition_metadata={RecognizerResult.RECOGNIZER_NAME_KEY: "test"},
+    )
+
+    copied = copy_result(result)
+
+    assert copied == result
+    assert copied.recognition_metadata == result.recognition_metadata
+    assert copied.analysis_explanation.recognizer == "test"
+
+
+def test_given_explanation_builder_when_shallow_copied_then_still_pending():
+    build_explanation = Mock(
+        side_effect=lambda: AnalysisExplanation("test", original_score=0.5)
+    )
+    result = RecognizerResult("TEST", 0, 5, 0.5, analysis_explanation=build_explanation)
+
+    copied = copy.copy(result)
+    copied.score = 0.9
+
+    build_explanation.assert_not_called()
+    assert result.score == 0.5
+    assert copied.analysis_explanation.recognizer == "test"
+    build_explanation.assert_called_once_with()
+
+
+def test_given_shared_metadata_then_copied_on_access():
+    recognizer = PatternRecognizer(supported_entity="TEST", deny_list=["a"])
+    metadata = recognizer.get_recognition_metadata()
+    first = RecognizerResult("TEST", 0, 1, 0.5, recognition_metadata=metadata)
+    second = RecognizerResult("TEST", 2, 3, 0.5, recognition_metadata=metadata)
+
+    recognizer_id = first.get_recognition_metadata_value(
+        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY
+    )
+    assert recognizer_id == recognizer.id
+    first.recognition_metadata[RecognizerResult.IS_SCORE_ENHANCED_BY_CONTEXT_KEY] = True
+
+    assert first.get_recognition_metadata_value(
+        RecognizerResult.IS_SCORE_ENHANCED_BY_CONTEXT_KEY
+    )
+    assert RecognizerResult.IS_SCORE_ENHANCED_BY_CONTEXT_KEY not in metadata
+    assert second.recognition_metadata == {
+        RecognizerResult.RECOGNIZER_NAME_KEY: recognizer.name,
+        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: recognizer.id,
+    }
+
+
+def test_given_pattern_recognizer_results_then_metadata_shared():
+    recognizer = PatternRecognizer(supported_entity="TEST", deny_list=["a", "b"])
+
+    first, second = recognizer.analyze("a b", entities=["TEST"])
+
+    assert first._recognition_metadata is second._recognition_metadata
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(first.analysis_explanation, "__dict__")
+
+
+def test_given_shared_metadata_when_pickled_then_metadata_restored():
+    recognizer = PatternRecognizer(supported_entity="TEST", deny_list=["a"])
+    (result,) = recognizer.analyze("a", entities=["TEST"])
+
+    unpickled = pickle.loads(pickle.dumps(result))
+    assert unpickled == result
+    assert unpickled.recognition_metadata == dict(recognizer.get_recognition_metadata())
+    assert (
+        unpickled.analysis_explanation.to_dict()
+        == result.analysis_explanation.to_dict()
+    )
+
+
 def create_recognizer_result(entity_type: str, score: float, start: int, end: int):
     data = {"entity_type": entity_type, "score": score, "start": start, "end": end}
     return RecognizerResult.from_json(data)
@@ -0,0 +1,247 @@
+import asyncio
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import pytest
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    BatchAnalyzerEngine,
+    RecognizerRegistry,
+    RecognizerResult,
+    RemoteRecognizer,
+)
+
+
+class StubPiiHandler(BaseHTTPRequestHandler):
+    """Detect a fixed word in the posted text, after a delay given in the path."""
+
+    def do_POST(self):
+        delay, word = self.path.strip("/").split("/")
+        text = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        time.sleep(float(delay))
+
+        start = text.find(word)
+        entities = [] if start == -1 else [[start, start + len(word)]]
+        body = json.dumps(entities).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubRemoteRecognizer(RemoteRecognizer):
+    nlp_capabilities = frozenset()
+
+    def __init__(self, url: str, entity: str, **kwargs):
+        super().__init__(
+            supported_entities=[entity],
+            name=f"Stub {entity}",
+            supported_language="en",
+            version="1.0.0",
+            **kwargs,
+        )
+        self.url = url
+
+    def get_supported_entities(self) -> List[str]:
+        return self.supported_entities
+
+    def analyze(self, text, entities, nlp_artifacts=None):
+        request = urllib.request.Request(self.url, data=text.encode())
+        with urllib.request.urlopen(request) as response:
+            spans = json.loads(response.read())
+        return [
+            RecognizerResult(self.supported_entities[0], start, end, 0.9)
+            for start, end in spans
+        ]
+
+
+@pytest.fixture(scope="module")
+def stub_server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPiiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.fixture(scope="module")
+def remote_analyzer_engine(stub_server_url, zip_code_recognizer, mock_nlp_engine):
+    registry = RecognizerRegistry(
+        recognizers=[
+            zip_code_recognizer,
+            StubRemoteRecognizer(f"{stub_server_url}/0.5/Acme", "ORGANIZATION"),
+            StubRemoteRecognizer(f"{stub_server_url}/0.5/Bob", "PERSON"),
+        ]
+    )
+    return AnalyzerEngine(registry=registry, nlp_engine=mock_nlp_engine)
+
+
+def test_when_analyze_async_then_same_results_as_analyze(remote_analyzer_engine):
+    text = "Bob from Acme lives in 90210"
+
+    expected = remote_analyzer_engine.analyze(text, language="en")
+    results = asyncio.run(remote_analyzer_engine.analyze_async(text, language="en"))
+
+    assert results == expected
+    assert {result.entity_type for result in results} == {
+        "ORGANIZATION",
+        "PERSON",
+        "ZIP",
+    }
+
+
+class NlpStubRemoteRecognizer(StubRemoteRecognizer):
+    """Stub recognizer using the NlpArtifacts, so called after the NLP pipeline."""
+
+    nlp_capabilities = None
+
+
+def test_when_analyze_async_then_remote_results_match_their_recognizers(
+    stub_server_url, mock_nlp_engine
+):
+    needs_nlp = NlpStubRemoteRecognizer(f"{stub_server_url}/0/Acme", "ORGANIZATION")
+    no_nlp = StubRemoteRecognizer(f"{stub_server_url}/0/Bob", "PERSON")
+    registry = RecognizerRegistry(recognizers=[needs_nlp, no_nlp])
+    analyzer_engine = AnalyzerEngine(registry=registry, nlp_engine=mock_nlp_engine)
+    text = "Bob from Acme"
+
+    results = asyncio.run(analyzer_engine.analyze_async(text, language="en"))
+
+    assert results == analyzer_engine.analyze(text, language="en")
+    recognizer_names = {
+        result.entity_type: result.recognition_metadata[
+            RecognizerResult.RECOGNIZER_NAME_KEY
+        ]
+        for result in results
+    }
+    assert recognizer_names == {
+        "ORGANIZATION": needs_nlp.name,
+        "PERSON": no_nlp.name,
+    }
+
+
+def test_when_analyze_async_then_remote_recognizers_called_concurrently(
+    remote_analyzer_engine,
+):
+    text = "Bob from Acme lives in 90210"
+
+    start = time.perf_counter()
+    asyncio.run(remote_analyzer_engine.analyze_async(text, language="en"))
+    elapsed = time.perf_counter() - start
+
+    # each remote call takes 0.5 seconds
+    assert elapsed < 0.9
+
+
+def test_when_remote_recognizer_analyze_async_then_analyze_called(
+    stub_server_url,
+):
+    recognizer = StubRemoteRecognizer(f"{stub_server_url}/0/Acme", "ORGANIZATION")
+
+    results = asyncio.run(
+        recognizer.analyze_async("Acme Corp", entities=["ORGANIZATION"])
+    )
+
+    assert results == [RecognizerResult("ORGANIZATION", 0, 4, 0.9)]
+
+
+class BulkStubRemoteRecognizer(StubRemoteRecognizer):
+    """Stub recognizer recording the documents sent per call."""
+
+    def __init__(self, url: str, entity: str, **kwargs):
+        super().__init__(url, entity, **kwargs)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def analyze_documents(self, texts, entities):
+        with self.lock:
+            self.calls.append(list(texts))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return super().analyze_documents(texts, entities)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def test_when_analyze_batch_then_texts_chunked_within_limits(stub_server_url):
+    recognizer = BulkStubRemoteRecognizer(
+        f"{stub_server_url}/0/Acme",
+        "ORGANIZATION",
+        max_batch_documents=3,
+        max_batch_characters=12,
+    )
+    texts = ["Acme", "b", "c", "Acme Corp", "long text by Acme", "e", "f", "g"]
+
+    results = recognizer.analyze_batch(texts, entities=["ORGANIZATION"])
+
+    assert recognizer.calls == [
+        ["Acme", "b", "c"],
+        ["Acme Corp"],
+        ["long text by Acme"],
+        ["e", "f", "g"],
+    ]
+    assert results == [
+        recognizer.analyze(text, entities=["ORGANIZATION"]) for text in texts
+    ]
+
+
+def test_when_analyze_batch_then_concurrency_bounded(stub_server_url):
+    recognizer = BulkStubRemoteRecognizer(
+        f"{stub_server_url}/0.1/Acme",
+        "ORGANIZATION",
+        max_batch_documents=2,
+        max_concurrent_requests=3,
+    )
+
+    start = time.perf_counter()
+    results = recognizer.analyze_batch(["Acme"] * 12, entities=["ORGANIZATION"])
+    elapsed = time.perf_counter() - start
+
+    assert len(recognizer.calls) == 6
+    assert recognizer.max_in_flight == 3
+    # 12 documents, 2 per call, 3 calls in flight, 0.1 seconds per document
+    assert elapsed < 1.2
+    assert len(results) == 12
+
+
+@pytest.mark.parametrize(
+    "remote_recognizer_kwargs",
+    [{}, {"max_batch_documents": 1000}, {"max_batch_characters": 1}],
+)
+def test_when_batch_analyzer_then_remote_recognizer_called_in_bulk(
+    stub_server_url,
+    zip_code_recognizer,
+    mock_nlp_engine,
+    mocker,
+    remote_recognizer_kwargs,
+):
+    recognizer = BulkStubRemoteRecognizer(
+        f"{stub_server_url}/0/Acme", "ORGANIZATION", **remote_recognizer_kwargs
+    )
+    registry = RecognizerRegistry(recognizers=[zip_code_recognizer, recognizer])
+    analyzer_engine = AnalyzerEngine(registry=registry, nlp_engine=mock_nlp_engine)
+    texts = ["Acme in 90210", "nothing", 90210, "Acme"] * 3
+
+    expected = [analyzer_engine.analyze(str(text), language="en") for text in texts]
+    recognizer.calls.clear()
+    analyze = mocker.spy(recognizer, "analyze")
+    results = BatchAnalyzerEngine(analyzer_engine).analyze_iterator(
+        texts, language="en"
+    )
+
+    assert results == expected
+    assert sum(map(len, recognizer.calls)) == len(texts)
+    assert analyze.call_count == len(texts)  # only through analyze_documents
@@ -102,4 +102,263 @@ def test_batch_processing_with_as_tuples_returns_context(spacy_nlp_engine, texts
     else:
         for text, nlp_artifacts in nlp_artifacts_batch:
             assert text == "simple text"
-            assert len(nlp_artifacts.tokens) == 2
\ No newline at end of file
+            assert len(nlp_artifacts.tokens) == 2
+
+def test_when_tokenize_then_only_tokenizer_runs():
+    import spacy
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    spacy_nlp_engine = SpacyNlpEngine()
+    spacy_nlp_engine.nlp = {"en": nlp}
+
+    nlp_artifacts = spacy_nlp_engine.tokenize("Call me at 555-1234.", language="en")
+
+    assert [token.text for token in nlp_artifacts.tokens] == [
+        "Call", "me", "at", "555", "-", "1234", ".",
+    ]
+    assert nlp_artifacts.tokens_indices == [0, 5, 8, 11, 14, 15, 19]
+    assert nlp_artifacts.lemmas == [token.text for token in nlp_artifacts.tokens]
+    assert nlp_artifacts.entities == []
+    assert not nlp_artifacts.tokens.has_annotation("SENT_START")
+
+
+@pytest.fixture(scope="module")
+def pipeline_nlp_engine():
+    import spacy
+    from spacy.lookups import Lookups
+    from spacy.training import Example
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe(
+        "tagger",
+        config={
+            "model": {
+                "@architectures": "spacy.Tagger.v2",
+                "tok2vec": {
+                    "@architectures": "spacy.Tok2VecListener.v1",
+                    "width": 96,
+                    "upstream": "*",
+                },
+            }
+        },
+    )
+    nlp.add_pipe("parser")
+    doc = nlp.make_doc("John lives in Paris")
+    example = Example.from_dict(
+        doc,
+        {
+            "tags": ["NNP", "VBZ", "IN", "NNP"],
+            "heads": [1, 1, 1, 2],
+            "deps": ["nsubj", "ROOT", "prep", "pobj"],
+        },
+    )
+    nlp.initialize(lambda: [example])
+
+    lemmatizer = nlp.add_pipe("lemmatizer", config={"mode": "lookup"})
+    lemmatizer.lookups = Lookups()
+    lemmatizer.lookups.add_table("lemma_lookup", {"lives": "live"})
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "GPE", "pattern": "Paris"}])
+
+    spacy_nlp_engine = SpacyNlpEngine()
+    spacy_nlp_engine.nlp = {"en": nlp}
+    return spacy_nlp_engine
+
+
+@pytest.mark.parametrize(
+    "capabilities, disabled",
+    [
+        (None, []),
+        ({"tokens"}, ["tok2vec", "tagger", "parser", "lemmatizer", "entity_ruler"]),
+        ({"tokens", "lemmas"}, ["parser", "entity_ruler"]),
+        ({"entities"}, ["tok2vec", "tagger", "parser", "lemmatizer"]),
+        ({"tokens", "lemmas", "entities"}, ["parser"]),
+    ],
+)
+def test_when_capabilities_then_unneeded_pipes_disabled(
+    pipeline_nlp_engine, capabilities, disabled
+):
+    assert pipeline_nlp_engine._get_disabled_pipes("en", capabilities) == disabled
+
+
+def test_when_process_text_with_capabilities_then_only_needed_pipes_run(
+    pipeline_nlp_engine,
+):
+    nlp_artifacts = pipeline_nlp_engine.process_text(
+        "John lives in Paris", language="en", capabilities={"tokens", "lemmas"}
+    )
+
+    assert nlp_artifacts.lemmas == ["John", "live", "in", "Paris"]
+    assert nlp_artifacts.entities == []
+    assert nlp_artifacts.tokens.has_annotation("TAG")
+    assert not nlp_artifacts.tokens.has_annotation("DEP")
+
+    nlp_artifacts = pipeline_nlp_engine.process_text(
+        "John lives in Paris", language="en", capabilities={"entities"}
+    )
+
+    assert [entity.text for entity in nlp_artifacts.entities] == ["Paris"]
+    assert not nlp_artifacts.tokens.has_annotation("TAG")
+
+
+def test_when_process_batch_with_capabilities_then_only_needed_pipes_run(
+    pipeline_nlp_engine,
+):
+    nlp_artifacts_batch = list(
+        pipeline_nlp_engine.process_batch(
+            ["John lives in Paris", "Paris"],
+            language="en",
+            capabilities={"tokens", "lemmas"},
+        )
+    )
+
+    assert len(nlp_artifacts_batch) == 2
+    for _, nlp_artifacts in nlp_artifacts_batch:
+        assert nlp_artifacts.entities == []
+        assert not nlp_artifacts.tokens.has_annotation("DEP")
+    assert nlp_artifacts_batch[0][1].lemmas[1] == "live"
+
+
+@pytest.fixture(scope="module")
+def ruler_nlp():
+    import spacy
+    from spacy.lookups import Lookups
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    lemmatizer = nlp.add_pipe("lemmatizer", config={"mode": "lookup"})
+    lemmatizer.lookups = Lookups()
+    lemmatizer.lookups.add_table("lemma_lookup", {"lives": "live"})
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns(
+        [
+            {"label": "GPE", "pattern": "Paris"},
+            {"label": "GPE", "pattern": "New York"},
+            {"label": "PERSON", "pattern": "John"},
+        ]
+    )
+    return nlp
+
+
+@pytest.mark.parametrize("n_process", [1, 2])
+def test_when_long_text_then_same_artifacts_as_whole_text(ruler_nlp, n_process):
+    text = "".join(
+        f"John lives in Paris, house {i}. He likes it!  \n\n"
+        + ("Second line here. " * (i % 4))
+        + "\n"
+        for i in range(100)
+    )
+    whole_engine = SpacyNlpEngine()
+    whole_engine.nlp = {"en": ruler_nlp}
+    long_text_engine = SpacyNlpEngine(
+        long_text_threshold=300, long_text_n_process=n_process
+    )
+    long_text_engine.nlp = {"en": ruler_nlp}
+
+    expected = whole_engine.process_text(text, language="en")
+    nlp_artifacts = long_text_engine.process_text(text, language="en")
+
+    assert nlp_artifacts.tokens.text == text
+    assert [token.text for token in nlp_artifacts.tokens] == [
+        token.text for token in expected.tokens
+    ]
+    assert nlp_artifacts.tokens_indices == expected.tokens_indices
+    assert nlp_artifacts.lemmas == expected.lemmas
+    assert [
+        (ent.start_char, ent.end_char, ent.label_) for ent in nlp_artifacts.entities
+    ] == [(ent.start_char, ent.end_char, ent.label_) for ent in expected.entities]
+    assert nlp_artifacts.scores == expected.scores
+    assert [token.is_sent_start for token in nlp_artifacts.tokens] == [
+        token.is_sent_start for token in expected.tokens
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, piece_size, expected_pieces",
+    [
+        ("First one.\n\nSecond one. Third.", 20, ["First one.", "\n\nSecond one. Third."]),
+        ("One two. Three four five", 16, ["One two. ", "Three four five"]),
+        ("One two three four", 10, ["One two ", "three four"]),
+        ("abcdefghij", 4, ["abcd", "efgh", "ij"]),
+        ("a" * 18 + "\n" * 4 + "b" * 30, 40, ["a" * 18, "\n" * 4 + "b" * 30]),
+        ("\n" * 30 + "b" * 20, 40, ["\n" * 30, "b" * 20]),
+    ],
+)
+def test_when_split_long_text_then_split_at_boundaries(
+    text, piece_size, expected_pieces
+):
+    pieces = SpacyNlpEngine._split_long_text(text, piece_size)
+
+    assert pieces == expected_pieces
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "a" * 18 + "\n" * 4 + "b" * 30,
+        "one.  \n\n   two " * 20,
+        "\n" * 30 + "b" * 20,
+    ],
+)
+def test_when_split_inside_whitespace_run_then_same_tokens_as_whole_text(
+    ruler_nlp, text
+):
+    pieces = SpacyNlpEngine._split_long_text(text, 40)
+    starts = [sum(len(piece) for piece in pieces[:i]) for i in range(len(pieces))]
+
+    doc = SpacyNlpEngine._merge_docs(
+        [ruler_nlp.make_doc(piece) for piece in pieces],
+        [(start, start, start + len(piece)) for start, piece in zip(starts, pieces)],
+    )
+
+    assert len(pieces) > 1
+    assert [token.text for token in doc] == [
+        token.text for token in ruler_nlp.make_doc(text)
+    ]
+
+
+def test_when_merge_docs_then_owned_span_group_scores_concatenated(ruler_nlp):
+    # "John lives in Paris", in windows "John lives in " and "lives in Paris"
+    docs = [ruler_nlp.make_doc("John lives in "), ruler_nlp.make_doc("lives in Paris")]
+    for doc, spans, scores in zip(
+        docs, [[(0, 1), (1, 2)], [(0, 1), (2, 3)]], [[0.7, 0.1], [0.2, 0.9]]
+    ):
+        doc.spans["ner"] = [doc[start:end] for start, end in spans]
+        doc.spans["ner"].attrs["scores"] = scores
+
+    doc = SpacyNlpEngine._merge_docs(docs, [(0, 0, 5), (5, 5, 19)])
+
+    assert doc.text == "John lives in Paris"
+    assert [span.text for span in doc.spans["ner"]] == ["John", "lives", "Paris"]
+    assert doc.spans["ner"].attrs["scores"] == [0.7, 0.2, 0.9]
+
+
+def test_when_long_text_cut_inside_entity_then_same_entities_as_whole_text(
+    ruler_nlp,
+):
+    text = " ".join(
+        f"Item {i} ships from New York to John in Paris today" for i in range(40)
+    )
+    whole_engine = SpacyNlpEngine()
+    whole_engine.nlp = {"en": ruler_nlp}
+    long_text_engine = SpacyNlpEngine(long_text_threshold=300)
+    long_text_engine.nlp = {"en": ruler_nlp}
+    pieces = SpacyNlpEngine._split_long_text(text, 240)
+    cuts = [sum(len(piece) for piece in pieces[: i + 1]) for i in range(len(pieces))]
+
+    expected = whole_engine.process_text(text, language="en")
+    nlp_artifacts = long_text_engine.process_text(text, language="en")
+
+    # the text is cut between the words of some entities
+    assert any(
+        ent.start_char < cut < ent.end_char for ent in expected.entities for cut in cuts
+    )
+    assert [token.text for token in nlp_artifacts.tokens] == [
+        token.text for token in expected.tokens
+    ]
+    assert [
+        (ent.start_char, ent.end_char, ent.label_) for ent in nlp_artifacts.entities
+    ] == [(ent.start_char, ent.end_char, ent.label_) for ent in expected.entities]
+    assert nlp_artifacts.scores == expected.scores
@@ -1,11 +1,18 @@
 """Tests adapted from the spacy_stanza repo"""
 
+from types import SimpleNamespace
+
+from spacy import blank
 from spacy.lang.en import EnglishDefaults
 
 
 import pytest
 
-from presidio_analyzer.nlp_engine.stanza_nlp_engine import load_pipeline
+from presidio_analyzer.nlp_engine.stanza_nlp_engine import (
+    StanzaNlpEngine,
+    StanzaTokenizer,
+    load_pipeline,
+)
 
 
 def tags_equal(act, exp):
@@ -101,3 +108,142 @@ def test_spacy_stanza_english(stanza_pipeline):
     # Test serialization
     reloaded_nlp = load_pipeline(lang).from_bytes(nlp.to_bytes())
     assert reloaded_nlp.config.to_str() == nlp.config.to_str()
+
+
+@pytest.mark.skip_engine("stanza_en")
+def test_when_tokenizer_pipe_then_same_docs_as_one_by_one(stanza_pipeline):
+    nlp = stanza_pipeline
+    texts = [
+        "Hello world! This is a test.",
+        "",
+        "  ",
+        "Barack Obama was born in Hawaii.\n\n  He was elected president.",
+        "Angela Merkel visited Paris.",
+    ]
+
+    docs = list(nlp.tokenizer.pipe(texts, batch_size=2))
+
+    assert len(docs) == len(texts)
+    for text, doc in zip(texts, docs):
+        expected = nlp(text)
+        assert doc.text == text
+        assert [(t.text, t.head.i, t.lemma_, t.pos_, t.dep_) for t in doc] == [
+            (t.text, t.head.i, t.lemma_, t.pos_, t.dep_) for t in expected
+        ]
+        assert [(e.text, e.label_) for e in doc.ents] == [
+            (e.text, e.label_) for e in expected.ents
+        ]
+
+
+class MockStanzaPipeline:
+    """Stanza pipeline stub, which tags each space separated word.
+
+    Each sentence ends with a "." word, which is its root, with the other
+    words attached to it. Title case words are PERSON entities.
+    """
+
+    processors = {}
+
+    def __init__(self):
+        self.bulk_sizes = []
+
+    def __call__(self, text):
+        return self.bulk_process([text])[0]
+
+    def bulk_process(self, texts):
+        self.bulk_sizes.append(len(texts))
+        return [self._process(text) for text in texts]
+
+    @staticmethod
+    def _process(text):
+        sentences = []
+        entities = []
+        words = []
+        position = 0
+        for word_text in text.replace(".", " . ").split():
+            start_char = text.index(word_text, position)
+            position = start_char + len(word_text)
+            words.append(
+                SimpleNamespace(
+                    text=word_text,
+                    lemma=word_text.lower(),
+                    upos="PUNCT" if word_text == "." else "X",
+                    xpos=None,
+                    feats=None,
+                    deprel="root" if word_text == "." else "dep",
+                )
+            )
+            if word_text.istitle():
+                entities.append(
+                    SimpleNamespace(
+                        start_char=start_char, end_char=position, type="PERSON"
+                    )
+                )
+            if word_text == ".":
+                for word in words:
+                    word.head = 0 if word is words[-1] else len(words)
+                sentences.append(
+                    SimpleNamespace(
+                        tokens=[SimpleNamespace(text=w.text, words=[w]) for w in words]
+                    )
+                )
+                words = []
+        return SimpleNamespace(text=text, sentences=sentences, entities=entities)
+
+
+@pytest.fixture
+def mock_stanza_nlp():
+    nlp = blank("en")
+    nlp.tokenizer = StanzaTokenizer(MockStanzaPipeline(), nlp.vocab)
+    return nlp
+
+
+def test_when_tokenizer_pipe_with_stub_then_ordered_docs(mock_stanza_nlp):
+    tokenizer = mock_stanza_nlp.tokenizer
+    texts = ["Jane lives  here. She left.", "", "  ", "Bob ran."]
+
+    docs = list(tokenizer.pipe(texts, batch_size=3))
+
+    assert [doc.text for doc in docs] == texts
+    # empty and whitespace only texts are not passed to Stanza
+    assert tokenizer.snlp.bulk_sizes == [1, 1]
+    assert [t.text for t in docs[0]] == [
+        "Jane",
+        "lives",
+        " ",
+        "here",
+        ".",
+        "She",
+        "left",
+        ".",
+    ]
+    # the heads after the space token and in the second sentence are shifted,
+    # spaCy attaches the space token, which has no dependency, to itself
+    assert [t.head.i for t in docs[0]] == [4, 4, 2, 4, 4, 7, 7, 7]
+    assert [t.pos_ for t in docs[0]][2] == "SPACE"
+    assert [(e.text, e.label_) for e in docs[0].ents] == [
+        ("Jane", "PERSON"),
+        ("She", "PERSON"),
+    ]
+    assert len(docs[1]) == 0
+    assert [t.text for t in docs[2]] == ["  "]
+    assert [(e.text, e.label_) for e in docs[3].ents] == [("Bob", "PERSON")]
+    for text, doc in zip(texts, docs):
+        expected = mock_stanza_nlp(text)
+        assert [(t.text, t.head.i, t.lemma_, t.pos_) for t in doc] == [
+            (t.text, t.head.i, t.lemma_, t.pos_) for t in expected
+        ]
+
+
+def test_when_process_batch_then_stanza_called_in_bulk(mock_stanza_nlp):
+    engine = StanzaNlpEngine(stanza_batch_size=4)
+    engine.nlp = {"en": mock_stanza_nlp}
+    texts = [f"Person{i} left." for i in range(10)]
+
+    results = list(engine.process_batch(texts, language="en", batch_size=1))
+
+    assert [text for text, _ in results] == texts
+    assert mock_stanza_nlp.tokenizer.snlp.bulk_sizes == [4, 4, 2]
+    assert [
+        [e.text for e in nlp_artifacts.entities] for _, nlp_artifacts in results
+    ] == [[f"Person{i}"] for i in range(10)]
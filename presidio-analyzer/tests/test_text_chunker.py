@@ -0,0 +1,49 @@
+import pytest
+
+from presidio_analyzer import TextChunker
+
+
+def chunk_texts(text, chunk_size, chunk_overlap):
+    chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    return [text[start:end] for start, end in chunker.chunk(text)]
+
+
+@pytest.mark.parametrize(
+    "text, chunk_size, chunk_overlap, expected",
+    [
+        ("", 3, 0, [""]),
+        (" one two three ", 3, 1, [" one two three "]),
+        ("a b c d e f g", 3, 0, ["a b c", "d e f", "g"]),
+        ("a b c d e f g", 3, 1, ["a b c", "c d e", "e f g"]),
+        ("a b c d e f g", 4, 3, ["a b c d", "b c d e", "c d e f", "d e f g"]),
+        ("a b. c d e f", 4, 0, ["a b.", "c d e f"]),
+        ("a b. c d e f", 4, 1, ["a b.", ". c d e", "e f"]),
+        ("a. b c d e f", 4, 0, ["a. b c", "d e f"]),
+        ("a b\nc d e", 3, 0, ["a b", "c d e"]),
+        ("a b\nc d e f", 4, 0, ["a b\nc d", "e f"]),
+        ("John-Paul e-mail me", 2, 0, ["John-Paul e-mail", "me"]),
+    ],
+)
+def test_when_chunk_then_chunks_expected(text, chunk_size, chunk_overlap, expected):
+    assert chunk_texts(text, chunk_size, chunk_overlap) == expected
+
+
+def test_when_chunk_then_entities_up_to_overlap_found_whole():
+    words = [f"w{index}" for index in range(100)]
+    text = " ".join(words)
+    word_starts = [text.index(f" {word} ") + 1 for word in words[1:-1]]
+    chunks = TextChunker(chunk_size=10, chunk_overlap=3).chunk(text)
+
+    # entities of 3 words starting at each of the inner words
+    for entity_start, last_word in zip(word_starts, words[3:]):
+        entity_end = text.index(last_word, entity_start) + len(last_word)
+        assert any(
+            chunk_start <= entity_start and entity_end <= chunk_end
+            for chunk_start, chunk_end in chunks
+        )
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", [(0, 0), (3, 3), (3, -1)])
+def test_when_invalid_sizes_then_value_error(chunk_size, chunk_overlap):
+    with pytest.raises(ValueError):
+        TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
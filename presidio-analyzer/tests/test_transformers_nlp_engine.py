@@ -1,6 +1,11 @@
+import importlib.util
+from unittest.mock import MagicMock, call, patch
+
 import pytest
 
-from presidio_analyzer.nlp_engine import TransformersNlpEngine
+from presidio_analyzer.nlp_engine import NerModelConfiguration, TransformersNlpEngine
+
+ENGINE_MODULE = "presidio_analyzer.nlp_engine.transformers_nlp_engine"
 
 
 def test_default_models():
@@ -42,3 +47,299 @@ def test_validate_model_params_missing_fields(key):
 
     with pytest.raises(ValueError):
         TransformersNlpEngine._validate_model_params(model)
+
+
+@pytest.mark.parametrize(
+    "backend_params",
+    [
+        {},
+        {"backend": "pytorch"},
+        {"backend": "onnx"},
+        {"backend": "onnx", "quantize": True},
+    ],
+)
+def test_validate_model_params_with_backend(backend_params):
+    model = {
+        "lang_code": "en",
+        "model_name": {
+            "spacy": "en_core_web_sm",
+            "transformers": "obi/deid_roberta_i2b2",
+        },
+        **backend_params,
+    }
+
+    TransformersNlpEngine._validate_model_params(model)
+
+
+@pytest.mark.parametrize(
+    "backend_params",
+    [
+        {"backend": "tensorflow"},
+        {"quantize": True},
+        {"backend": "pytorch", "quantize": True},
+    ],
+)
+def test_validate_model_params_invalid_backend(backend_params):
+    model = {
+        "lang_code": "en",
+        "model_name": {
+            "spacy": "en_core_web_sm",
+            "transformers": "obi/deid_roberta_i2b2",
+        },
+        **backend_params,
+    }
+
+    with pytest.raises(ValueError):
+        TransformersNlpEngine._validate_model_params(model)
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("optimum") is not None,
+    reason="optimum is installed",
+)
+def test_when_onnx_backend_without_optimum_then_import_error():
+    engine = TransformersNlpEngine(
+        models=[
+            {
+                "lang_code": "en",
+                "model_name": {
+                    "spacy": "en_core_web_sm",
+                    "transformers": "obi/deid_roberta_i2b2",
+                },
+                "backend": "onnx",
+            }
+        ]
+    )
+
+    with pytest.raises(ImportError):
+        engine.load()
+
+
+@pytest.fixture
+def mock_onnx():
+    """Mock optimum's ONNX Runtime classes and transformers' pipeline."""
+
+    def quantize(save_dir, quantization_config):
+        (save_dir / "model_quantized.onnx").write_bytes(b"")
+
+    with patch(f"{ENGINE_MODULE}.ORTModelForTokenClassification") as ort_model_class:
+        with patch(f"{ENGINE_MODULE}.ORTQuantizer") as quantizer_class:
+            with patch(f"{ENGINE_MODULE}.AutoQuantizationConfig"):
+                with patch(f"{ENGINE_MODULE}.transformers") as transformers:
+                    quantizer = quantizer_class.from_pretrained.return_value
+                    quantizer.quantize.side_effect = quantize
+                    yield ort_model_class, quantizer_class, transformers
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_when_create_onnx_pipeline_then_model_exported(mock_onnx, tmp_path, quantize):
+    ort_model_class, quantizer_class, transformers = mock_onnx
+    engine = TransformersNlpEngine(
+        ner_model_configuration=NerModelConfiguration(
+            aggregation_strategy="first", stride=16
+        )
+    )
+    tokenizer = MagicMock()
+
+    hf_pipeline = engine._create_onnx_pipeline(
+        "obi/deid_roberta_i2b2", tokenizer, quantize=quantize, onnx_model_dir=tmp_path
+    )
+
+    file_name = "model_quantized.onnx" if quantize else "model.onnx"
+    assert ort_model_class.from_pretrained.call_args_list == [
+        call("obi/deid_roberta_i2b2", export=True),
+        call(tmp_path, file_name=file_name),
+    ]
+    exported_model = ort_model_class.from_pretrained.return_value
+    exported_model.save_pretrained.assert_called_once_with(tmp_path)
+    if quantize:
+        quantizer_class.from_pretrained.assert_called_once_with(exported_model)
+        assert (tmp_path / "model_quantized.onnx").exists()
+    else:
+        assert not quantizer_class.from_pretrained.called
+    transformers.pipeline.assert_called_once_with(
+        task="token-classification",
+        model=ort_model_class.from_pretrained.return_value,
+        tokenizer=tokenizer,
+        aggregation_strategy="first",
+        stride=16,
+    )
+    assert hf_pipeline is transformers.pipeline.return_value
+
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_when_onnx_model_already_exported_then_export_skipped(
+    mock_onnx, tmp_path, quantize
+):
+    ort_model_class, quantizer_class, _ = mock_onnx
+    file_name = "model_quantized.onnx" if quantize else "model.onnx"
+    (tmp_path / file_name).write_bytes(b"")
+
+    TransformersNlpEngine()._create_onnx_pipeline(
+        "obi/deid_roberta_i2b2", MagicMock(), quantize=quantize, onnx_model_dir=tmp_path
+    )
+
+    ort_model_class.from_pretrained.assert_called_once_with(
+        tmp_path, file_name=file_name
+    )
+    assert not quantizer_class.from_pretrained.called
+
+
+def test_when_load_with_onnx_backend_then_hf_pipeline_replaced(mock_onnx):
+    engine = TransformersNlpEngine(
+        models=[
+            {
+                "lang_code": "en",
+                "model_name": {
+                    "spacy": "en_core_web_sm",
+                    "transformers": "obi/deid_roberta_i2b2",
+                },
+                "backend": "onnx",
+                "quantize": True,
+                "onnx_model_dir": "onnx-models",
+            }
+        ]
+    )
+    nlp = MagicMock()
+    hf_token_pipe = nlp.get_pipe.return_value
+    tokenizer = hf_token_pipe.hf_pipeline.tokenizer
+
+    with patch(f"{ENGINE_MODULE}.spacy.load", return_value=nlp):
+        with patch.object(TransformersNlpEngine, "_download_spacy_model_if_needed"):
+            with patch.object(
+                TransformersNlpEngine, "_create_onnx_pipeline"
+            ) as create_pipeline:
+                engine.load()
+
+    assert nlp.add_pipe.call_args.args == ("hf_token_pipe",)
+    create_pipeline.assert_called_once_with(
+        "obi/deid_roberta_i2b2",
+        tokenizer=tokenizer,
+        quantize=True,
+        onnx_model_dir="onnx-models",
+    )
+    assert hf_token_pipe.hf_pipeline is create_pipeline.return_value
+    assert engine.nlp["en"] is nlp
+
+
+@pytest.mark.parametrize(
+    "lengths, max_batch_tokens, expected_batches",
+    [
+        ([], 10, []),
+        ([3, 1, 2], 10, [[1, 2, 0]]),
+        ([5, 1, 5, 1, 1], 10, [[1, 3, 4], [0, 2]]),
+        ([1, 20, 2], 10, [[0, 2], [1]]),
+        ([0, 0], 1, [[0], [1]]),
+    ],
+)
+def test_when_get_length_batches_then_batched_by_length_within_budget(
+    lengths, max_batch_tokens, expected_batches
+):
+    batches = TransformersNlpEngine._get_length_batches(lengths, max_batch_tokens)
+
+    assert batches == expected_batches
+
+
+class MockTokenizer:
+    """Tokenize texts into one token per word, plus two special tokens."""
+
+    model_max_length = 6
+
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [[0] * (len(text.split()) + 2) for text in texts]}
+
+
+class MockHfPipeline:
+    def __init__(self):
+        self._batch_size = None
+        self.tokenizer = MockTokenizer()
+        # (number of texts, batch size) of each call
+        self.calls = []
+
+
+class MockHfTokenPipe:
+    """Tag title case words as PERSON, as hf_token_pipe would."""
+
+    def __init__(self):
+        self.hf_pipeline = MockHfPipeline()
+
+    def __call__(self, doc):
+        spans = [token for token in doc if token.text.istitle()]
+        doc.spans["bert-base-ner"] = [doc[t.i : t.i + 1] for t in spans]
+        doc.spans["bert-base-ner"].attrs["scores"] = [0.9] * len(spans)
+        for span in doc.spans["bert-base-ner"]:
+            span.label_ = "PERSON"
+        return doc
+
+    def pipe(self, docs, batch_size=128):
+        docs = list(docs)
+        self.hf_pipeline.calls.append((len(docs), self.hf_pipeline._batch_size))
+        for doc in docs:
+            yield self(doc)
+
+
+@pytest.fixture(scope="module")
+def mock_transformers_nlp_engine():
+    import spacy
+    from spacy.language import Language
+
+    Language.factory("mock_hf_token_pipe", func=lambda nlp, name: MockHfTokenPipe())
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("mock_hf_token_pipe", name="hf_token_pipe")
+    engine = TransformersNlpEngine(max_batch_tokens=8)
+    engine.nlp = {"en": nlp}
+    return engine
+
+
+@pytest.mark.parametrize("as_tuples", [False, True])
+def test_when_process_batch_then_results_in_texts_order(
+    mock_transformers_nlp_engine, as_tuples
+):
+    texts = [
+        "a long text about someone called Dana and Kim here",
+        "hi Sam",
+        "",
+        "short one about Lee",
+        "x",
+    ]
+    batch = [(text, i) for i, text in enumerate(texts)] if as_tuples else texts
+
+    outputs = list(
+        mock_transformers_nlp_engine.process_batch(
+            batch, language="en", as_tuples=as_tuples
+        )
+    )
+
+    assert [output[0] for output in outputs] == texts
+    assert [
+        [entity.text for entity in output[1].entities] for output in outputs
+    ] == [["Dana", "Kim"], ["Sam"], [], ["Lee"], []]
+    if as_tuples:
+        assert [output[2] for output in outputs] == list(range(len(texts)))
+
+
+def test_when_process_batch_then_model_infers_length_batches(
+    mock_transformers_nlp_engine,
+):
+    texts = ["one", "one two three four five", "one two", "", "one two three"]
+    hf_pipeline = mock_transformers_nlp_engine.nlp["en"].get_pipe(
+        "hf_token_pipe"
+    ).hf_pipeline
+    hf_pipeline.calls.clear()
+
+    list(mock_transformers_nlp_engine.process_batch(texts, language="en"))
+
+    # tokenizer lengths, capped at the model max length: [3, 6, 4, 2, 5]
+    expected_batches = TransformersNlpEngine._get_length_batches([3, 6, 4, 2, 5], 8)
+    assert expected_batches == [[3, 0], [2], [4], [1]]
+    assert hf_pipeline.calls == [(len(batch), len(batch)) for batch in expected_batches]
+    assert hf_pipeline._batch_size is None
+
+
+def test_get_model_lengths_capped_at_model_max_length():
+    lengths = TransformersNlpEngine._get_model_lengths(
+        MockTokenizer(), ["", "a b c d e f g"]
+    )
+
+    assert lengths == [2, 6]
@@ -1,5 +1,6 @@
 import collections
-from typing import Any, Dict, Iterable, List, Optional, Union
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import DictRecognizerResult, RecognizerResult
@@ -45,6 +46,65 @@ class BatchAnonymizerEngine:
 
         return return_list
 
+    def anonymize_columnar(
+        self,
+        texts: List[Optional[Union[str, bool, int, float]]],
+        columnar_results: Any,
+        **kwargs,
+    ) -> List[Union[str, Any]]:
+        """
+        Anonymize a list of strings, given the analyzer results as columns.
+
+        The columns are read one text at a time, so only the results
+        of the text being anonymized are held as RecognizerResult objects.
+
+        :param texts: List containing the texts to be anonymized (original texts).
+            Items with a `type` not in `(str, bool, int, float)` will not be anonymized.
+        :param columnar_results: Columnar results of the analyzer on the texts,
+        e.g. the output of `BatchAnalyzerEngine.analyze_iterator_columnar`:
+        an object with the parallel `doc_index` (in increasing order), `start`,
+        `end`, `entity_type` and `score` columns (NumPy arrays or sequences),
+        where `entity_type` holds the indices of the types in `entity_types`.
+        :param kwargs: Additional kwargs for the `AnonymizerEngine.anonymize` method
+        """
+        doc_index = columnar_results.doc_index
+        columns = (
+            columnar_results.entity_type,
+            columnar_results.start,
+            columnar_results.end,
+            columnar_results.score,
+        )
+        entity_types = columnar_results.entity_types
+
+        return_list = []
+        begin = 0
+        for index, text in enumerate(texts):
+            stop = bisect_left(doc_index, index + 1, lo=begin)
+            if type(text) in (str, bool, int, float):
+                recognizer_results = [
+                    RecognizerResult(entity_types[code], start, end, score)
+                    for code, start, end, score in zip(
+                        *(self._to_list(column[begin:stop]) for column in columns)
+                    )
+                ]
+                res = self.anonymizer_engine.anonymize(
+                    text=str(text), analyzer_results=recognizer_results, **kwargs
+                )
+                return_list.append(res.text)
+            else:
+                return_list.append(text)
+            begin = stop
+
+        return return_list
+
+    @staticmethod
+    def _to_list(column: Sequence) -> List:
+        """Return a column slice as a list of Python numbers."""
+        if hasattr(column, "tolist"):
+            # NumPy arrays, whose items are NumPy scalars
+            return column.tolist()
+        return list(column)
+
     def anonymize_dict(
         self, analyzer_results: Iterable[DictRecognizerResult], **kwargs
     ) -> Dict[str, str]:
@@ -12,6 +12,8 @@ from presidio_anonymizer.services.validators import (
 class PIIEntity(ABC):
     """Abstract class to hold the text we are going to operate on metadata."""
 
+    __slots__ = ("start", "end", "entity_type")
+
     logger = logging.getLogger("presidio-anonymizer")
 
     def __init__(self, start: int, end: int, entity_type: str):
@@ -23,6 +23,8 @@ class RecognizerResult(PIIEntity):
     :param score: the score of the detection
     """
 
+    __slots__ = ("score",)
+
     logger = logging.getLogger("presidio-anonymizer")
 
     def __init__(self, entity_type: str, start: int, end: int, score: float):
@@ -41,7 +41,10 @@ class EngineResult:
 
     def to_json(self) -> str:
         """Return a json string serializing this instance."""
-        return json.dumps(self, default=lambda x: x.__dict__)
+        return json.dumps(
+            self,
+            default=lambda x: x.to_dict() if isinstance(x, OperatorResult) else vars(x),
+        )
 
     def __repr__(self):
         """Return a string representation of the object."""
@@ -6,6 +6,8 @@ from presidio_anonymizer.entities import PIIEntity
 class OperatorResult(PIIEntity):
     """A class to hold data for engines results either anonymize or deanonymize."""
 
+    __slots__ = ("text", "operator")
+
     def __init__(
         self,
         start: int,
@@ -24,7 +26,13 @@ class OperatorResult(PIIEntity):
 
     def to_dict(self) -> Dict:
         """Return object as Dict."""
-        return self.__dict__
+        return {
+            "start": self.start,
+            "end": self.end,
+            "entity_type": self.entity_type,
+            "text": self.text,
+            "operator": self.operator,
+        }
 
     def __str__(self):
         """Return a string representation of the object."""
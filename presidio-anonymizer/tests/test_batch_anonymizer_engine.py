@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import pytest
 
 from presidio_anonymizer import BatchAnonymizerEngine
@@ -134,3 +136,26 @@ def test_given_custom_anonymizer_we_anonymize_dict_correctly(engine, analyzer_re
     assert anonymize_results == {
         "name": ["<ENTITY: John>", "<ENTITY: Jill>", "<ENTITY: Jack>"]
     }
+
+
+def test_given_columnar_results_we_anonymize_list_correctly(engine):
+    texts = ["John and Jill", "nothing", ["random", 123], "Jack at 5"]
+    columnar_results = SimpleNamespace(
+        doc_index=[0, 0, 3, 3],
+        start=[0, 9, 0, 8],
+        end=[4, 13, 4, 9],
+        entity_type=[0, 0, 0, 1],
+        score=[0.85, 0.85, 0.85, 0.5],
+        entity_types=["PERSON", "NUMBER"],
+    )
+
+    anonymize_results = engine.anonymize_columnar(
+        texts=texts, columnar_results=columnar_results
+    )
+
+    assert anonymize_results == [
+        "<PERSON> and <PERSON>",
+        "nothing",
+        ["random", 123],
+        "<PERSON> at <NUMBER>",
+    ]
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from presidio_anonymizer.entities import OperatorResult
@@ -33,3 +35,21 @@ def test_given_idenctical_decrypt_results_item_they_are_equal():
 def test_given_changed_decrypt_results_item_they_are_equal(result_item):
     result_1 = OperatorResult(0, 3, "NAME", "bla", "decrypt")
     assert result_1 != result_item
+
+
+def test_given_operator_result_then_to_dict_returns_all_fields():
+    result = OperatorResult(0, 3, "NAME", "bla", "decrypt")
+    assert result.to_dict() == {
+        "start": 0,
+        "end": 3,
+        "entity_type": "NAME",
+        "text": "bla",
+        "operator": "decrypt",
+    }
+
+
+def test_given_operator_result_then_slots_and_pickled_equal():
+    result = OperatorResult(0, 3, "NAME", "bla", "decrypt")
+
+    assert not hasattr(result, "__dict__")
+    assert pickle.loads(pickle.dumps(result)) == result
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from presidio_anonymizer.entities import InvalidParamError, RecognizerResult
@@ -285,6 +287,15 @@ def test_given_negative_start_or_endpoint_then_we_fail(start, end):
         create_recognizer_result("entity", 0, start, end)
 
 
+def test_given_recognizer_result_then_slots_and_pickled_equal():
+    result = create_recognizer_result("entity", 0.5, 2, 8)
+
+    assert not hasattr(result, "__dict__")
+    unpickled = pickle.loads(pickle.dumps(result))
+    assert unpickled == result
+    assert unpickled.score == 0.5
+
+
 def create_recognizer_result(entity_type: str, score: float, start: int, end: int):
     data = {"entity_type": entity_type, "score": score, "start": start, "end": end}
     return RecognizerResult.from_json(data)
@@ -6,7 +6,7 @@ import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 from PIL import Image, ImageChops
-from presidio_analyzer import AnalyzerEngine, RecognizerResult
+from presidio_analyzer import AllowList, AnalyzerEngine, RecognizerResult
 
 from presidio_image_redactor import OCR, ImagePreprocessor, TesseractOCR
 from presidio_image_redactor.entities import ImageRecognizerResult
@@ -134,7 +134,7 @@ class ImageAnalyzerEngine:
         text_analyzer_results: List[RecognizerResult],
         ocr_result: dict,
         text: str,
-        allow_list: List[str],
+        allow_list: Union[List[str], AllowList],
     ) -> List[ImageRecognizerResult]:
         """Map extracted PII entities to image bounding boxes.
 
@@ -144,13 +144,17 @@ class ImageAnalyzerEngine:
         :param text_analyzer_results: PII entities recognized by presidio analyzer
         :param ocr_result: dict results with words and bboxes from OCR
         :param text: text the results are based on
-        :param allow_list: List of words to not redact
+        :param allow_list: List of words to not redact, or an AllowList
 
         return: list of extracted entities with image bounding boxes
         """
         if (not ocr_result) or (not text_analyzer_results):
             return []
 
+        # checked for every word, so look the words up in a set
+        if not isinstance(allow_list, AllowList):
+            allow_list = AllowList(allow_list or [])
+
         bboxes = []
         proc_indexes = 0
         indexes = len(text_analyzer_results)
@@ -297,7 +301,9 @@ class ImageAnalyzerEngine:
         return ocr_kwargs, ocr_threshold
 
     @staticmethod
-    def _check_for_allow_list(text_analyzer_kwargs: dict) -> List[str]:
+    def _check_for_allow_list(
+        text_analyzer_kwargs: dict,
+    ) -> Union[List[str], AllowList]:
         """Check the text_analyzer_kwargs for an allow_list.
 
         :param text_analyzer_kwargs: Text analyzer kwargs.